@@ -7,7 +7,9 @@ Public API re-exports so users can write::
 
 from mantic_thinking.core.mantic_kernel import (
     mantic_kernel,
+    mantic_kernel_batch,
     compute_temporal_kernel,
+    compute_temporal_kernel_batch,
     verify_kernel_integrity,
     KERNEL_VERSION,
     KERNEL_HASH,
@@ -22,8 +24,10 @@ from mantic_thinking.core.validators import (
 __all__ = [
     # Core kernel
     "mantic_kernel",
+    "mantic_kernel_batch",
     "safe_mantic_kernel",
     "compute_temporal_kernel",
+    "compute_temporal_kernel_batch",
     "verify_kernel_integrity",
     "KERNEL_VERSION",
     "KERNEL_HASH",
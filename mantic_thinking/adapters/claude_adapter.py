@@ -137,14 +137,9 @@ def explain_result(tool_name, result):
     return _explain(tool_name, result)
 
 
-def get_claude_tool_guidance(tool_names=None):
-    """Get tool calibration guidance formatted for Claude system prompt."""
-    return get_tool_guidance(tool_names)
-
-
-def get_claude_context(domain=None):
-    """Get complete LLM context for Claude."""
-    return get_full_context(domain)
+# Guidance and context are model-agnostic; alias the cached implementations.
+get_claude_tool_guidance = get_tool_guidance
+get_claude_context = get_full_context
 
 
 if __name__ == "__main__":
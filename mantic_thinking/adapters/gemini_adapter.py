@@ -129,14 +129,9 @@ def explain_result(tool_name, result):
     return _explain(tool_name, result)
 
 
-def get_gemini_tool_guidance(tool_names=None):
-    """Get tool calibration guidance formatted for Gemini system prompt."""
-    return get_tool_guidance(tool_names)
-
-
-def get_gemini_context(domain=None):
-    """Get complete LLM context for Gemini."""
-    return get_full_context(domain)
+# Guidance and context are model-agnostic; alias the cached implementations.
+get_gemini_tool_guidance = get_tool_guidance
+get_gemini_context = get_full_context
 
 
 def get_gemini_prompt_addon():
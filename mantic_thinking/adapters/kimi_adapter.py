@@ -181,14 +181,9 @@ def explain_result(tool_name, result):
     return _explain(tool_name, result)
 
 
-def get_kimi_tool_guidance(tool_names=None):
-    """Get tool calibration guidance formatted for Kimi system prompt."""
-    return get_tool_guidance(tool_names)
-
-
-def get_kimi_context(domain=None):
-    """Get complete LLM context for Kimi."""
-    return get_full_context(domain)
+# Guidance and context are model-agnostic; alias the cached implementations.
+get_kimi_tool_guidance = get_tool_guidance
+get_kimi_context = get_full_context
 
 
 if __name__ == "__main__":
@@ -10,8 +10,11 @@ Compatible with GPT-4, GPT-4o, Codex, and any OpenAI-compatible endpoint.
 
 import sys
 import os
+from functools import lru_cache
+from importlib.resources import files
 from pathlib import Path
 import inspect
+from types import MappingProxyType
 
 import yaml
 
@@ -22,7 +25,6 @@ if __name__ == "__main__":
     if _repo_root not in sys.path:
         sys.path.insert(0, _repo_root)
 
-_TOOLS_DIR = Path(__file__).parent.parent / "tools"
 _CONFIGS_DIR = Path(__file__).parent.parent / "configs"
 
 # Friction tools (divergence detection)
@@ -350,94 +352,127 @@ def explain_result(tool_name, result):
 
 # ---- YAML guidance loading -------------------------------------------------
 
+# Tool YAML ships as package data next to the tool modules; resolved through
+# importlib.resources so it also loads from zipped installs.
+_TOOL_RESOURCES = files("mantic_thinking.tools")
+
+# libyaml-backed safe loader when PyYAML was built with it; same semantics.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=64)
 def _load_tool_yaml(tool_name):
-    """Load YAML guidance for a tool. Returns dict or None."""
+    """
+    Load YAML guidance for a tool. Returns a read-only mapping or None.
+
+    Parsed once per process; clear this cache and ``_render_tool_block``'s
+    to pick up edits to the YAML files.
+    """
     for suite in ("friction", "emergence"):
-        path = _TOOLS_DIR / suite / f"{tool_name}.yaml"
-        if path.exists():
+        path = _TOOL_RESOURCES / suite / f"{tool_name}.yaml"
+        if path.is_file():
             try:
-                with open(path, encoding="utf-8") as f:
-                    return yaml.safe_load(f)
+                data = yaml.load(path.read_bytes(), Loader=_YAML_LOADER)
             except yaml.YAMLError:
                 return None
+            return MappingProxyType(data) if isinstance(data, dict) else data
     return None
 
 
+@lru_cache(maxsize=64)
+def _render_tool_block(name):
+    """Render one tool's guidance as Markdown. Returns str or None."""
+    data = _load_tool_yaml(name)
+    if not data:
+        return None
+
+    lines = [f"### {name} ({data.get('type', '?')} | {data.get('domain', '?')})"]
+
+    sel = data.get("selection", {})
+    if sel.get("use_when"):
+        lines.append("**Use when:**")
+        for item in sel["use_when"]:
+            lines.append(f"  - {item}")
+    if sel.get("not_for"):
+        lines.append("**Not for:**")
+        for item in sel["not_for"]:
+            lines.append(f"  - {item}")
+
+    params = data.get("parameters", {})
+    if params:
+        lines.append("**Parameters:**")
+        for pname, pdata in params.items():
+            layer = pdata.get("layer", "?")
+            low = pdata.get("low", "")
+            high = pdata.get("high", "")
+            lines.append(f"  - `{pname}` ({layer}): {low} \u2192 {high}")
+
+    ig = data.get("interaction_guidance", {})
+    dampen = ig.get("dampen_when", {})
+    amplify = ig.get("amplify_when", {})
+    if dampen or amplify:
+        lines.append("**Tuning:**")
+        for p, reason in dampen.items():
+            lines.append(f"  - Dampen `{p}`: {reason}")
+        for p, reason in amplify.items():
+            lines.append(f"  - Amplify `{p}`: {reason}")
+
+    interp = data.get("interpretation", {})
+    if interp:
+        lines.append(f"**High M:** {interp.get('high_m', '')}")
+        lines.append(f"**Low M:** {interp.get('low_m', '')}")
+
+    return "\n".join(lines)
+
+
+_GUIDANCE_HEADER = "## Tool Calibration Guidance\n"
+
+
 def get_tool_guidance(tool_names=None):
     """
     Load YAML calibration guidance for tools, formatted for system prompt.
 
     Args:
-        tool_names: List of tool names, or None for all tools.
+        tool_names: Iterable of tool names (order kept), or None for all tools.
 
     Returns:
         str: Formatted guidance text for system prompt injection.
     """
+    if tool_names is not None:
+        tool_names = tuple(tool_names)
+    return _tool_guidance(tool_names)
+
+
+# Tools that ship YAML guidance, in registry order; the set is the allowlist
+# for caller-supplied names, so nothing else ever reaches a file path.
+_GUIDANCE_TOOLS = tuple(n for n in TOOL_MAP if n != "generic_detect")
+_GUIDANCE_TOOL_SET = frozenset(_GUIDANCE_TOOLS)
+
+
+@lru_cache(maxsize=64)
+def _tool_guidance(tool_names):
+    """Cached body of get_tool_guidance, keyed on a tuple of names (order kept)."""
     if tool_names is None:
-        tool_names = [n for n in TOOL_MAP.keys() if n != "generic_detect"]
+        tool_names = _GUIDANCE_TOOLS
     else:
-        tool_names = [n for n in tool_names if n in TOOL_MAP]
-
-    sections = []
-    for name in tool_names:
-        data = _load_tool_yaml(name)
-        if not data:
-            continue
+        tool_names = [n for n in tool_names if n in _GUIDANCE_TOOL_SET]
 
-        lines = [f"### {name} ({data.get('type', '?')} | {data.get('domain', '?')})"]
-
-        sel = data.get("selection", {})
-        if sel.get("use_when"):
-            lines.append("**Use when:**")
-            for item in sel["use_when"]:
-                lines.append(f"  - {item}")
-        if sel.get("not_for"):
-            lines.append("**Not for:**")
-            for item in sel["not_for"]:
-                lines.append(f"  - {item}")
-
-        params = data.get("parameters", {})
-        if params:
-            lines.append("**Parameters:**")
-            for pname, pdata in params.items():
-                layer = pdata.get("layer", "?")
-                low = pdata.get("low", "")
-                high = pdata.get("high", "")
-                lines.append(f"  - `{pname}` ({layer}): {low} \u2192 {high}")
-
-        ig = data.get("interaction_guidance", {})
-        dampen = ig.get("dampen_when", {})
-        amplify = ig.get("amplify_when", {})
-        if dampen or amplify:
-            lines.append("**Tuning:**")
-            for p, reason in dampen.items():
-                lines.append(f"  - Dampen `{p}`: {reason}")
-            for p, reason in amplify.items():
-                lines.append(f"  - Amplify `{p}`: {reason}")
-
-        interp = data.get("interpretation", {})
-        if interp:
-            lines.append(f"**High M:** {interp.get('high_m', '')}")
-            lines.append(f"**Low M:** {interp.get('low_m', '')}")
-
-        sections.append("\n".join(lines))
-
-    header = "## Tool Calibration Guidance\n"
-    return header + "\n\n".join(sections)
+    blocks = (_render_tool_block(name) for name in tool_names)
+    return _GUIDANCE_HEADER + "\n\n".join(b for b in blocks if b)
 
 
 # ---- Context loading -------------------------------------------------------
 
 # Domain name -> tool name mapping for context loading
 _DOMAIN_TOOLS = {
-    "healthcare": ["healthcare_phenotype_genotype", "healthcare_precision_therapeutic"],
-    "finance": ["finance_regime_conflict", "finance_confluence_alpha"],
-    "cyber": ["cyber_attribution_resolver", "cyber_adversary_overreach"],
-    "climate": ["climate_maladaptation", "climate_resilience_multiplier"],
-    "legal": ["legal_precedent_drift", "legal_precedent_seeding"],
-    "military": ["military_friction_forecast", "military_strategic_initiative"],
-    "social": ["social_narrative_rupture", "social_catalytic_alignment"],
-    "system_lock": ["system_lock_recursive_control", "system_lock_dissolution_window"],
+    "healthcare": ("healthcare_phenotype_genotype", "healthcare_precision_therapeutic"),
+    "finance": ("finance_regime_conflict", "finance_confluence_alpha"),
+    "cyber": ("cyber_attribution_resolver", "cyber_adversary_overreach"),
+    "climate": ("climate_maladaptation", "climate_resilience_multiplier"),
+    "legal": ("legal_precedent_drift", "legal_precedent_seeding"),
+    "military": ("military_friction_forecast", "military_strategic_initiative"),
+    "social": ("social_narrative_rupture", "social_catalytic_alignment"),
+    "system_lock": ("system_lock_recursive_control", "system_lock_dissolution_window"),
 }
 
 # Aliases for domain names
@@ -448,7 +483,23 @@ _DOMAIN_ALIASES = {
     "command": "military",
 }
 
+# Every accepted domain spelling -> its tool tuple, built once at import
+_DOMAIN_TOOL_INDEX = {
+    **_DOMAIN_TOOLS,
+    **{alias: _DOMAIN_TOOLS[name] for alias, name in _DOMAIN_ALIASES.items()},
+}
+
+
+# Domain name -> config file stem (mantic_<stem>.md)
+_CONFIG_ALIASES = {
+    "healthcare": "health",
+    "cybersecurity": "security",
+    "cyber": "security",
+    "military": "command",
+}
+
 
+@lru_cache(maxsize=1)
 def get_scaffold():
     """
     Load the universal reasoning scaffold.
@@ -473,19 +524,19 @@ def get_domain_config(domain):
     Returns:
         str: Domain config content, or empty string if not found.
     """
-    aliases = {
-        "healthcare": "health",
-        "cybersecurity": "security",
-        "cyber": "security",
-        "military": "command",
-    }
-    config_name = aliases.get(domain, domain)
+    return _read_domain_config(_CONFIG_ALIASES.get(domain, domain))
+
+
+@lru_cache(maxsize=16)
+def _read_domain_config(config_name):
+    """Read configs/mantic_<config_name>.md once per process."""
     path = _CONFIGS_DIR / f"mantic_{config_name}.md"
     if path.exists():
         return path.read_text(encoding="utf-8")
     return ""
 
 
+@lru_cache(maxsize=32)
 def get_full_context(domain=None):
     """
     Load the complete LLM context in the correct order.
@@ -509,12 +560,9 @@ def get_full_context(domain=None):
         if config:
             parts.append(config)
 
-    canonical = _DOMAIN_ALIASES.get(domain, domain) if domain else None
-    if canonical and canonical in _DOMAIN_TOOLS:
-        guidance = get_tool_guidance(_DOMAIN_TOOLS[canonical])
-    else:
-        guidance = get_tool_guidance()
-    parts.append(guidance)
+    # Unknown or missing domain -> None -> guidance for every tool
+    tools = _DOMAIN_TOOL_INDEX.get(domain) if domain else None
+    parts.append(get_tool_guidance(tools))
 
     return "\n\n---\n\n".join(parts)
 
@@ -140,30 +140,186 @@ def compute_temporal_kernel(t, n=1.0, alpha=0.1, kernel_type="exponential",
     if decay_rate is not None:
         alpha = decay_rate
 
-    if kernel_type == "exponential":
-        result = np.exp(n * alpha * t)
-    elif kernel_type == "linear":
-        result = max(0.0, 1.0 - alpha * abs(t))
-    elif kernel_type == "logistic":
-        result = 1.0 / (1.0 + np.exp(-n * alpha * t))
-    elif kernel_type == "s_curve":
-        t0 = kwargs.get("t0", 0.0)
-        result = 1.0 / (1.0 + np.exp(-alpha * (t - t0)))
-    elif kernel_type == "power_law":
-        exponent = kwargs.get("exponent", 1.0)
-        base = max(1e-10, 1.0 + t)  # Clamp for t < -1
-        result = base ** (n * alpha * exponent)
-    elif kernel_type == "oscillatory":
-        frequency = kwargs.get("frequency", 1.0)
-        result = np.exp(n * alpha * t) * 0.5 * (1.0 + 0.5 * np.sin(frequency * t))
-    elif kernel_type == "memory":
-        memory_strength = kwargs.get("memory_strength", 1.0)
-        result = 1.0 + memory_strength * np.exp(-t)
-    else:
+    kernel = _TEMPORAL_KERNELS.get(kernel_type)
+    if kernel is None:
         raise ValueError(f"Unknown kernel type: {kernel_type}")
+    result = kernel(t, n, alpha, kwargs)
+
+    # Ensure positivity (per spec: f_time(t) > 0 for all t)
+    return float(1e-10 if result < 1e-10 else result)
+
+
+# -----------------------------------------------------------------------------
+# Temporal kernel implementations
+# NumPy math, so f_time stays bit-identical to the original kernel.
+# -----------------------------------------------------------------------------
+
+def _kernel_exponential(t, n, alpha, kwargs):
+    return np.exp(n * alpha * t)
+
+
+def _kernel_linear(t, n, alpha, kwargs):
+    return max(0.0, 1.0 - alpha * abs(t))
+
+
+def _kernel_logistic(t, n, alpha, kwargs):
+    return 1.0 / (1.0 + np.exp(-n * alpha * t))
+
+
+def _kernel_s_curve(t, n, alpha, kwargs):
+    t0 = kwargs.get("t0", 0.0)
+    return 1.0 / (1.0 + np.exp(-alpha * (t - t0)))
+
+
+def _kernel_power_law(t, n, alpha, kwargs):
+    exponent = kwargs.get("exponent", 1.0)
+    base = max(1e-10, 1.0 + t)  # Clamp for t < -1
+    return base ** (n * alpha * exponent)
+
+
+def _kernel_oscillatory(t, n, alpha, kwargs):
+    frequency = kwargs.get("frequency", 1.0)
+    return np.exp(n * alpha * t) * 0.5 * (1.0 + 0.5 * np.sin(frequency * t))
+
+
+def _kernel_memory(t, n, alpha, kwargs):
+    memory_strength = kwargs.get("memory_strength", 1.0)
+    return 1.0 + memory_strength * np.exp(-t)
+
+
+_TEMPORAL_KERNELS = {
+    "exponential": _kernel_exponential,
+    "linear": _kernel_linear,
+    "logistic": _kernel_logistic,
+    "s_curve": _kernel_s_curve,
+    "power_law": _kernel_power_law,
+    "oscillatory": _kernel_oscillatory,
+    "memory": _kernel_memory,
+}
+
+
+def compute_temporal_kernel_batch(t, kernel_type="exponential", n=1.0, alpha=0.1,
+                                  t0=0.0, exponent=1.0, frequency=1.0,
+                                  memory_strength=1.0):
+    """
+    Vectorized compute_temporal_kernel over arrays of configurations.
+
+    Every argument may be a scalar or an array; all are broadcast together,
+    so a sweep over N (t, kernel_type, ...) configurations costs a handful of
+    NumPy passes instead of N Python calls.
+
+    Args:
+        t: time deltas
+        kernel_type: kernel name(s), see compute_temporal_kernel
+        n, alpha: novelty and sensitivity parameters
+        t0, exponent, frequency, memory_strength: mode-specific parameters
+
+    Returns:
+        numpy array: temporal kernel multipliers (each > 0, NaN propagates)
+
+    Raises:
+        ValueError: If any kernel_type is unknown
+    """
+    kinds = np.asarray(kernel_type)
+    unknown = sorted(set(np.unique(kinds).tolist()) - set(_TEMPORAL_KERNELS))
+    if unknown:
+        raise ValueError(f"Unknown kernel type: {unknown[0]}")
+
+    t, n, alpha, t0, exponent, frequency, memory_strength, kinds = np.broadcast_arrays(
+        np.asarray(t, dtype=float), np.asarray(n, dtype=float),
+        np.asarray(alpha, dtype=float), np.asarray(t0, dtype=float),
+        np.asarray(exponent, dtype=float), np.asarray(frequency, dtype=float),
+        np.asarray(memory_strength, dtype=float), kinds,
+    )
+
+    # np.select evaluates every branch; overflow in unused branches is expected.
+    with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+        growth = np.exp(n * alpha * t)
+        # The vectorized np.power loop can differ from scalar pow in the last
+        # bit, so power_law rows are raised one at a time as in
+        # compute_temporal_kernel.
+        is_power_law = kinds == "power_law"
+        power_law = np.ones_like(t)
+        power_law[is_power_law] = [
+            base ** expo for base, expo in zip(
+                np.maximum(1e-10, 1.0 + t[is_power_law]),
+                (n * alpha * exponent)[is_power_law],
+            )
+        ]
+        result = np.select(
+            [
+                kinds == "exponential",
+                kinds == "linear",
+                kinds == "logistic",
+                kinds == "s_curve",
+                is_power_law,
+                kinds == "oscillatory",
+                kinds == "memory",
+            ],
+            [
+                growth,
+                np.maximum(0.0, 1.0 - alpha * np.abs(t)),
+                1.0 / (1.0 + np.exp(-n * alpha * t)),
+                1.0 / (1.0 + np.exp(-alpha * (t - t0))),
+                power_law,
+                growth * 0.5 * (1.0 + 0.5 * np.sin(frequency * t)),
+                1.0 + memory_strength * np.exp(-t),
+            ],
+        )
 
     # Ensure positivity (per spec: f_time(t) > 0 for all t)
-    return float(max(result, 1e-10))
+    return np.maximum(result, 1e-10)
+
+
+def mantic_kernel_batch(W, L, I=1.0, f_time=1.0, k_n=1.0, attribution=True):
+    """
+    Vectorized mantic_kernel over N rows of layer values.
+
+    Same formula and operation order as mantic_kernel, applied row by row in
+    a few NumPy passes, so each row's M, S and attribution match a single
+    call exactly. Missing-data degradation is not supported: batch callers
+    reject non-finite layers up front.
+
+    Args:
+        W: array of E weights (must sum to 1, each 0-1)
+        L: array of shape (N, E), layer values (0-1)
+        I: interaction coefficients (0.1-2.0), scalar, length E or (N, E)
+        f_time: temporal kernel value, scalar or length N
+        k_n: normalization constant (default 1.0)
+        attribution: set False to skip the per-layer shares (returned as None)
+            when only the scores are needed
+
+    Returns:
+        tuple: (M, S, attribution) as arrays of shape (N,), (N,), (N, E)
+
+    Raises:
+        ValueError: On shape mismatch, non-finite L, or out-of-range inputs
+    """
+    W = np.asarray(W, dtype=float)
+    L = np.asarray(L, dtype=float)
+    I = np.asarray(I, dtype=float)
+
+    if W.ndim != 1 or L.ndim != 2 or L.shape[1] != W.shape[0]:
+        raise ValueError(f"Expected W of shape (E,) and L of shape (N, E), got {W.shape} and {L.shape}")
+    if not np.isclose(W.sum(), 1.0, atol=1e-6):
+        raise ValueError(f"Weights must sum to 1.0, got {W.sum()}")
+    if np.any((W < 0) | (W > 1)):
+        raise ValueError("Weights (W) must be in range [0, 1]")
+    if not np.all((L >= 0) & (L <= 1)):
+        raise ValueError("Layer values (L) must be finite and in range [0, 1]")
+    if np.any((I < 0.1) | (I > 2.0)):
+        raise ValueError("Interaction coefficients (I) must be in range [0.1, 2.0]")
+
+    contributions = W * L * I
+    S = contributions.sum(axis=1)
+    M = (S * f_time) / k_n
+
+    if not attribution:
+        return M, S, None
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shares = np.where((S > 1e-10)[:, None], contributions / S[:, None], 0.0)
+
+    return M, S, shares
 
 
 # Version marker for cross-model compatibility verification
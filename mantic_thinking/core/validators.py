@@ -7,8 +7,13 @@ Provides consistent input validation across all domain tools:
 - Layer validation and NaN handling
 """
 
+import math
+from functools import lru_cache
+
 import numpy as np
 
+from mantic_thinking.core.mantic_kernel import compute_temporal_kernel
+
 
 def clamp_input(value, min_val=0.0, max_val=1.0, name="input"):
     """
@@ -34,11 +39,11 @@ def clamp_input(value, min_val=0.0, max_val=1.0, name="input"):
     except (TypeError, ValueError):
         raise TypeError(f"{name} must be a number, got {type(value).__name__}")
     
-    if np.isnan(val):
+    if math.isnan(val):
         return val
     
-    clamped = np.clip(val, min_val, max_val)
-    return float(clamped)
+    # Plain comparisons: this runs four times per detect() call.
+    return float(min_val if val < min_val else (max_val if val > max_val else val))
 
 
 def normalize_weights(weights):
@@ -54,14 +59,15 @@ def normalize_weights(weights):
     Raises:
         ValueError: If all weights are zero
     """
-    w = np.array(weights, dtype=float)
-    w = np.clip(w, 0, 1)  # Ensure all weights are valid
+    w = np.array(weights, dtype=float)  # fresh copy; safe to work in place
+    np.clip(w, 0, 1, out=w)  # Ensure all weights are valid
     
     total = w.sum()
     if total < 1e-10:
         raise ValueError("Cannot normalize: all weights are zero or negative")
     
-    return w / total
+    w /= total
+    return w
 
 
 def validate_layers(layer_values, layer_names=None):
@@ -120,10 +126,35 @@ def require_finite_inputs(values):
             val = float(value)
         except (TypeError, ValueError):
             raise TypeError(f"{name} must be a number, got {type(value).__name__}")
-        if not np.isfinite(val):
+        if not math.isfinite(val):
             raise ValueError(f"{name} must be a finite number")
 
 
+def require_finite_layer_batch(layer_values, n_layers=4):
+    """
+    Coerce batched layer input to a fresh (N, n_layers) float64 array.
+    
+    Batch counterpart of require_finite_inputs for the detect_batch paths.
+    The returned array is a copy, so callers may clip it in place.
+    
+    Args:
+        layer_values: array-like of shape (N, n_layers) or (n_layers,)
+        n_layers: Expected number of layer columns
+    
+    Returns:
+        numpy array: shape (N, n_layers), dtype float64
+    
+    Raises:
+        ValueError: If the shape is wrong or any value is not finite
+    """
+    L = np.array(layer_values, dtype=np.float64, ndmin=2)
+    if L.ndim != 2 or L.shape[1] != n_layers:
+        raise ValueError(f"Expected layer_values of shape (N, {n_layers}), got {L.shape}")
+    if not np.isfinite(L).all():
+        raise ValueError("layer_values must be finite numbers")
+    return L
+
+
 def check_mismatch(layer_values, threshold=0.4, comparison_mode="variance"):
     """
     Check for mismatches between layer values.
@@ -135,44 +166,42 @@ def check_mismatch(layer_values, threshold=0.4, comparison_mode="variance"):
     
     Returns:
         tuple: (has_mismatch, mismatch_score, mismatch_description)
+
+    Raises:
+        TypeError: If any layer value is not a number (None included)
     """
+    values = np.asarray(layer_values)
+    if values.dtype.kind not in "biuf":
+        bad = sorted({type(v).__name__ for v in values.ravel().tolist()
+                      if not isinstance(v, (int, float))})
+        raise TypeError(f"layer_values must be numbers, got {', '.join(bad)}")
+
     # Filter out NaN values
-    valid_values = [v for v in layer_values if not np.isnan(v)]
+    values = values.astype(float, copy=False)
+    valid = values[~np.isnan(values)]
     
-    if len(valid_values) < 2:
+    if valid.size < 2:
         return False, 0.0, "Insufficient data for mismatch detection"
     
-    valid_array = np.array(valid_values)
-    
     if comparison_mode == "variance":
         # Use standard deviation as mismatch indicator
-        mean_val = valid_array.mean()
-        std_val = valid_array.std()
-        mismatch_score = std_val
-        has_mismatch = std_val > threshold
-        description = f"StdDev={std_val:.3f} vs threshold={threshold}"
+        mismatch_score = float(valid.std())
+        description = f"StdDev={mismatch_score:.3f} vs threshold={threshold}"
     
     elif comparison_mode == "range":
         # Use range (max - min) as mismatch indicator
-        range_val = valid_array.max() - valid_array.min()
-        mismatch_score = range_val
-        has_mismatch = range_val > threshold
-        description = f"Range={range_val:.3f} vs threshold={threshold}"
+        mismatch_score = float(valid.max() - valid.min())
+        description = f"Range={mismatch_score:.3f} vs threshold={threshold}"
     
     elif comparison_mode == "pairwise":
         # Compare first two layers (domain-specific interpretation)
-        if len(valid_values) >= 2:
-            diff = abs(valid_values[0] - valid_values[1])
-            mismatch_score = diff
-            has_mismatch = diff > threshold
-            description = f"Pairwise diff={diff:.3f} vs threshold={threshold}"
-        else:
-            return False, 0.0, "Need 2+ layers for pairwise comparison"
+        mismatch_score = abs(float(valid[0]) - float(valid[1]))
+        description = f"Pairwise diff={mismatch_score:.3f} vs threshold={threshold}"
     
     else:
         raise ValueError(f"Unknown comparison mode: {comparison_mode}")
     
-    return has_mismatch, float(mismatch_score), description
+    return mismatch_score > threshold, mismatch_score, description
 
 
 def format_attribution(attribution_array, layer_names):
@@ -192,6 +221,38 @@ def format_attribution(attribution_array, layer_names):
     }
 
 
+def layer_dict_builder(layer_names):
+    """
+    Build a format_attribution() equivalent bound to a fixed layer list.
+
+    Tools call this once at import; the returned function maps any
+    per-layer sequence (attribution, layer values) onto the names. For the
+    standard four layers the dict literal is unrolled so no zip or
+    comprehension frame is created per call.
+
+    Args:
+        layer_names: List of layer names
+
+    Returns:
+        callable: values -> {layer_name: float(value)}
+    """
+    if len(layer_names) != 4:
+        names = tuple(layer_names)
+        return lambda values: format_attribution(values, names)
+
+    k0, k1, k2, k3 = layer_names
+
+    def build(values):
+        return {
+            k0: float(values[0]),
+            k1: float(values[1]),
+            k2: float(values[2]),
+            k3: float(values[3]),
+        }
+
+    return build
+
+
 # =============================================================================
 # BOUNDED OVERRIDE SYSTEM
 # Allows runtime tuning of tempo (kernel) and sensitivity (thresholds) while
@@ -213,6 +274,16 @@ DOMAIN_KERNEL_ALLOWLIST = {
     "generic": ["exponential", "s_curve", "linear", "memory", "oscillatory", "power_law", "logistic"],
 }
 
+# Hashed view of the allowlist for membership checks on the validation path.
+# DOMAIN_KERNEL_ALLOWLIST keeps its list form for ordered, JSON-friendly output.
+# Domains with the same kernels share one interned frozenset.
+_interned_sets = {}
+_ALLOWLIST_SETS = {
+    domain: _interned_sets.setdefault(frozenset(kernels), frozenset(kernels))
+    for domain, kernels in DOMAIN_KERNEL_ALLOWLIST.items()
+}
+del _interned_sets
+
 # Global hard bounds for any threshold override
 THRESHOLD_HARD_BOUNDS = (0.05, 0.95)
 
@@ -229,6 +300,22 @@ INTERACTION_BOUNDS = (0.1, 2.0)
 ALPHA_BOUNDS = (0.01, 0.5)
 NOVELTY_BOUNDS = (-2.0, 2.0)
 
+# validate_temporal_config field tables: clamped params (skipped when None)
+# and pass-through params (finite check only)
+_TEMPORAL_CLAMPED_FIELDS = (("alpha", ALPHA_BOUNDS), ("n", NOVELTY_BOUNDS))
+_TEMPORAL_PASSTHROUGH_FIELDS = ("t", "t0", "exponent", "frequency", "memory_strength")
+
+
+def _clamp_scalar(val, lo, hi):
+    """
+    Clamp a finite float to [lo, hi] without NumPy scalar dispatch.
+
+    Returns (clamped, moved); ``moved`` matches
+    ``not np.isclose(clamped, val, atol=1e-10)`` (default rtol=1e-5).
+    """
+    clamped = lo if val < lo else (hi if val > hi else val)
+    return clamped, abs(clamped - val) > 1e-10 + 1e-5 * abs(val)
+
 
 def clamp_threshold_override(requested, default, 
                               max_drift_pct=THRESHOLD_MAX_DRIFT_PCT,
@@ -274,7 +361,7 @@ def clamp_threshold_override(requested, default,
             "was_clamped": True,
             "reason": f"Invalid type: {type(requested).__name__}"
         }
-    if not np.isfinite(val):
+    if not math.isfinite(val):
         return default, True, {
             "requested": requested,
             "used": float(default),
@@ -285,8 +372,7 @@ def clamp_threshold_override(requested, default,
         }
     
     # Apply clamping
-    clamped = np.clip(val, effective_min, effective_max)
-    was_clamped = not np.isclose(clamped, val, atol=1e-10)
+    clamped, was_clamped = _clamp_scalar(val, effective_min, effective_max)
     
     clamp_info = {
         "requested": val,
@@ -305,6 +391,47 @@ def clamp_threshold_override(requested, default,
     return float(clamped), was_clamped, clamp_info
 
 
+# Sentinel for single-lookup dict probes where None is a legitimate value
+_MISSING = object()
+
+
+def resolve_threshold_overrides(threshold_override, defaults):
+    """
+    Apply a caller's threshold overrides on top of a tool's defaults.
+    
+    Args:
+        threshold_override: Optional mapping of {threshold_name: requested_value}
+        defaults: The tool's DEFAULT_THRESHOLDS
+    
+    Returns:
+        tuple: (active_thresholds, threshold_info, ignored_keys)
+            - active_thresholds: Copy of defaults with clamped overrides applied
+            - threshold_info: Dict of clamp_info per overridden threshold
+            - ignored_keys: Override keys the tool does not define
+    """
+    # Always a copy: callers hand active_thresholds back in their results.
+    active_thresholds = defaults.copy()
+    threshold_info = {}
+    ignored_keys = []
+    if not threshold_override:
+        return active_thresholds, threshold_info, ignored_keys
+    try:
+        items = threshold_override.items()
+    except AttributeError:  # not a mapping: ignored, as before
+        return active_thresholds, threshold_info, ignored_keys
+    
+    for key, requested in items:
+        default = defaults.get(key, _MISSING)
+        if default is _MISSING:
+            ignored_keys.append(key)
+            continue
+        clamped_val, _, info = clamp_threshold_override(requested, default)
+        active_thresholds[key] = clamped_val
+        threshold_info[key] = info
+    
+    return active_thresholds, threshold_info, ignored_keys
+
+
 def validate_temporal_config(config, domain=None):
     """
     Validate and clamp temporal configuration parameters.
@@ -329,65 +456,116 @@ def validate_temporal_config(config, domain=None):
     # Validate kernel_type against domain allowlist
     kernel_type = config.get("kernel_type")
     if kernel_type is not None:
-        if domain is not None and domain not in DOMAIN_KERNEL_ALLOWLIST:
+        allowed_set = _ALLOWLIST_SETS.get(domain)
+        if domain is not None and allowed_set is None:
             rejected["kernel_type"] = {
                 "requested": kernel_type,
                 "reason": f"Unknown domain '{domain}' — no kernel allowlist defined",
                 "allowed": []
             }
         else:
-            allowed = DOMAIN_KERNEL_ALLOWLIST.get(domain, [])
-            if allowed and kernel_type not in allowed:
+            # Non-string kernel types (possibly unhashable) are never allowed.
+            if allowed_set and (not isinstance(kernel_type, str)
+                                or kernel_type not in allowed_set):
                 rejected["kernel_type"] = {
                     "requested": kernel_type,
                     "reason": f"Not allowed for domain '{domain}'",
-                    "allowed": allowed
+                    "allowed": DOMAIN_KERNEL_ALLOWLIST[domain]
                 }
             else:
                 validated["kernel_type"] = kernel_type
     
-    # Clamp alpha
-    alpha = config.get("alpha")
-    if alpha is not None:
-        try:
-            val = float(alpha)
-            if not np.isfinite(val):
-                raise ValueError("Not a finite number")
-            clamped_val = np.clip(val, ALPHA_BOUNDS[0], ALPHA_BOUNDS[1])
-            validated["alpha"] = float(clamped_val)
-            if not np.isclose(clamped_val, val, atol=1e-10):
-                clamped["alpha"] = {"requested": val, "used": clamped_val, "bounds": ALPHA_BOUNDS}
-        except (TypeError, ValueError):
-            rejected["alpha"] = {"requested": alpha, "reason": "Not a finite number"}
-    
-    # Clamp n (novelty)
-    n = config.get("n")
-    if n is not None:
+    # Clamp alpha and n (novelty) to their governance bounds
+    for key, bounds in _TEMPORAL_CLAMPED_FIELDS:
+        raw = config.get(key)
+        if raw is None:
+            continue
         try:
-            val = float(n)
-            if not np.isfinite(val):
-                raise ValueError("Not a finite number")
-            clamped_val = np.clip(val, NOVELTY_BOUNDS[0], NOVELTY_BOUNDS[1])
-            validated["n"] = float(clamped_val)
-            if not np.isclose(clamped_val, val, atol=1e-10):
-                clamped["n"] = {"requested": val, "used": clamped_val, "bounds": NOVELTY_BOUNDS}
+            val = float(raw)
         except (TypeError, ValueError):
-            rejected["n"] = {"requested": n, "reason": "Not a finite number"}
+            val = math.nan
+        if not math.isfinite(val):
+            rejected[key] = {"requested": raw, "reason": "Not a finite number"}
+            continue
+        clamped_val, moved = _clamp_scalar(val, *bounds)
+        validated[key] = clamped_val
+        if moved:
+            clamped[key] = {"requested": val, "used": clamped_val, "bounds": bounds}
     
     # Pass through other params (t, t0, exponent, frequency, etc.) with basic validation
-    for key in ["t", "t0", "exponent", "frequency", "memory_strength"]:
+    for key in _TEMPORAL_PASSTHROUGH_FIELDS:
         if key in config:
             try:
                 val = float(config[key])
-                if not np.isfinite(val):
-                    raise ValueError("Not a finite number")
-                validated[key] = val
             except (TypeError, ValueError):
+                val = math.nan
+            if math.isfinite(val):
+                validated[key] = val
+            else:
                 rejected[key] = {"requested": config[key], "reason": "Not a finite number"}
     
     return validated, rejected, clamped
 
 
+@lru_cache(maxsize=1024)
+def _temporal_kernel_cached(config_items):
+    return compute_temporal_kernel(**dict(config_items))
+
+
+def temporal_kernel_for(validated):
+    """
+    f_time for a config returned by validate_temporal_config, memoized.
+    
+    Scans and backtests reuse the same temporal_config across many calls;
+    the validated config is keyed as sorted (name, value) pairs so repeats
+    skip the kernel math.
+    
+    Args:
+        validated: Validated config containing at least kernel_type and t
+    
+    Returns:
+        float: compute_temporal_kernel(**validated)
+    """
+    return _temporal_kernel_cached(tuple(sorted(validated.items())))
+
+
+# temporal_config keys that must validate before f_time is taken from it
+_REQUIRED_TEMPORAL_KEYS = (
+    ("kernel_type", "kernel_type required and must be allowed for domain"),
+    ("t", "t required for temporal_config"),
+)
+
+
+def resolve_temporal_config(temporal_config, f_time, domain=None):
+    """
+    Validate a temporal_config and, if usable, compute f_time from it.
+    
+    kernel_type and t are both required; when either is missing or
+    rejected the caller's f_time is kept and the gap is recorded.
+    
+    Args:
+        temporal_config: Optional dict passed by the caller
+        f_time: The caller's explicit f_time (used when no config applies)
+        domain: Domain name for the kernel allowlist
+    
+    Returns:
+        tuple: (f_time, temporal_applied, temporal_rejected, temporal_clamped)
+    """
+    if not (temporal_config and isinstance(temporal_config, dict)):
+        return f_time, None, {}, {}
+    
+    validated, rejected, clamped = validate_temporal_config(temporal_config, domain=domain)
+    missing = False
+    for key, reason in _REQUIRED_TEMPORAL_KEYS:
+        if key not in validated:
+            missing = True
+            if key not in rejected:
+                rejected[key] = {"requested": temporal_config.get(key), "reason": reason}
+    if missing:
+        return f_time, None, rejected, clamped
+    return temporal_kernel_for(validated), validated, rejected, clamped
+
+
 def validate_interaction_override(override, layer_names):
     """
     Validate and clamp interaction coefficient overrides (I).
@@ -583,15 +761,14 @@ def clamp_f_time(f_time):
             "was_clamped": True,
             "reason": f"Invalid type: {type(f_time).__name__}"
         }
-    if not np.isfinite(val):
+    if not math.isfinite(val):
         return 1.0, True, {
             "used": 1.0,
             "was_clamped": True,
             "reason": "Not a finite number"
         }
     
-    clamped = np.clip(val, F_TIME_BOUNDS[0], F_TIME_BOUNDS[1])
-    was_clamped = not np.isclose(clamped, val, atol=1e-10)
+    clamped, was_clamped = _clamp_scalar(val, *F_TIME_BOUNDS)
     
     clamp_info = {
         "requested": float(val), 
@@ -605,6 +782,36 @@ def clamp_f_time(f_time):
     return float(clamped), was_clamped, clamp_info
 
 
+def build_threshold_audit(threshold_info, ignored_keys):
+    """
+    Summarize resolved threshold overrides for build_overrides_audit.
+    
+    Args:
+        threshold_info: Per-threshold clamp_info from resolve_threshold_overrides
+        ignored_keys: Unknown override keys
+    
+    Returns:
+        dict or None: {'overrides', 'was_clamped', 'ignored_keys'}, or None
+        when no known threshold was overridden
+    """
+    if not threshold_info:
+        return None
+    
+    overrides = {
+        key: {
+            "requested": info.get("requested"),
+            "used": info.get("used"),
+            "was_clamped": info.get("was_clamped", False)
+        }
+        for key, info in threshold_info.items()
+    }
+    return {
+        "overrides": overrides,
+        "was_clamped": any(entry["was_clamped"] for entry in overrides.values()),
+        "ignored_keys": ignored_keys if ignored_keys else None
+    }
+
+
 def build_overrides_audit(threshold_overrides=None, temporal_config=None, 
                           threshold_info=None, temporal_validated=None, 
                           temporal_rejected=None, temporal_clamped=None,
@@ -697,7 +904,7 @@ def compute_layer_coupling(L, layer_names):
     layers = {}
     for i, li in valid:
         distances = [abs(li - lj) for j, lj in valid if j != i]
-        agreement = round(1.0 - np.mean(distances), 2)
+        agreement = float(round(1.0 - np.mean(distances), 2))
 
         tensions = {}
         for j, lj in valid:
@@ -69,28 +69,7 @@ def __getattr__(name):
 
 
 def __dir__():
-    return sorted(set(list(globals().keys()) + list(_TOOL_MODULES.keys())))
+    return sorted(set(globals()) | _TOOL_MODULES.keys())
 
 
-__all__ = [
-    # Friction
-    "healthcare_phenotype_genotype",
-    "finance_regime_conflict",
-    "cyber_attribution_resolver",
-    "climate_maladaptation",
-    "legal_precedent_drift",
-    "military_friction_forecast",
-    "social_narrative_rupture",
-    "system_lock_recursive_control",
-    # Emergence
-    "healthcare_precision_therapeutic",
-    "finance_confluence_alpha",
-    "cyber_adversary_overreach",
-    "climate_resilience_multiplier",
-    "legal_precedent_seeding",
-    "military_strategic_initiative",
-    "social_catalytic_alignment",
-    "system_lock_dissolution_window",
-    # Generic
-    "generic_detect",
-]
+__all__ = list(_TOOL_MODULES)
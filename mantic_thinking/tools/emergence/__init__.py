@@ -7,6 +7,8 @@ when multiple layers synchronize favorably.
 Logic Pattern: if all(L > 0.6 for L in layers): window_detected()
 """
 
+import importlib
+
 __all__ = [
     "healthcare_precision_therapeutic",
     "finance_confluence_alpha",
@@ -17,3 +19,16 @@ __all__ = [
     "social_catalytic_alignment",
     "system_lock_dissolution_window",
 ]
+
+_TOOL_NAMES = frozenset(__all__)
+
+
+def __getattr__(name):
+    """Import a tool submodule on first attribute access."""
+    if name in _TOOL_NAMES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _TOOL_NAMES)
@@ -17,23 +17,17 @@ Output:
     window_detected, intervention_type, cross_domain_coupling, m_score, overrides_applied
 """
 
-import sys
-import os
-
-# Avoid mutating sys.path on import; only adjust for direct script execution.
-if __name__ == "__main__":
-    _repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    if _repo_root not in sys.path:
-        sys.path.insert(0, _repo_root)
+from functools import lru_cache
 
 import numpy as np
 from mantic_thinking.core.safe_kernel import safe_mantic_kernel as mantic_kernel
-from mantic_thinking.core.mantic_kernel import compute_temporal_kernel
+from mantic_thinking.core.mantic_kernel import mantic_kernel_batch
 from mantic_thinking.core.validators import (
-    clamp_input, require_finite_inputs, format_attribution,
-    clamp_threshold_override, validate_temporal_config,
-    clamp_f_time, build_overrides_audit, compute_layer_coupling,
-    resolve_interaction_coefficients
+    clamp_input, require_finite_inputs, require_finite_layer_batch,
+    layer_dict_builder, clamp_f_time, build_overrides_audit,
+    compute_layer_coupling, resolve_interaction_coefficients,
+    resolve_threshold_overrides, resolve_temporal_config,
+    build_threshold_audit
 )
 from mantic_thinking.mantic.introspection import get_layer_visibility
 
@@ -49,6 +43,53 @@ DEFAULT_THRESHOLDS = {
 
 DOMAIN = "climate"
 
+# Kernel-ready weight vector, name-keyed weights for get_layer_visibility(),
+# detect_batch's intervention tiers (code 0 = no window)
+# and the bit position of each layer in below_threshold_mask
+_W_ARR = np.asarray(WEIGHTS, dtype=np.float64)
+_W_ARR.setflags(write=False)
+_WEIGHTS_DICT = dict(zip(LAYER_NAMES, WEIGHTS))
+# {layer_name: float} builder for attribution / layer-value result dicts.
+_layer_dict = layer_dict_builder(LAYER_NAMES)
+_INTERVENTION_TYPES = np.array(
+    [None, "MODERATE_MULTIPLIER", "MULTIPLIER", "HIGH_MULTIPLIER"], dtype=object
+)
+_LAYER_BITS = np.arange(len(LAYER_NAMES), dtype=np.uint8)
+
+# Per-tier (funding_priority, example_intervention, recommended_action)
+_TIER_TEXT = {
+    "HIGH_MULTIPLIER": (
+        "URGENT - High leverage across 4 domain columns",
+        "Urban forestry with green infrastructure: heat reduction + biodiversity + stormwater + equity",
+        "Prioritize immediate funding. Every dollar creates compounding benefits across atmospheric, ecological, infrastructure, and policy domains.",
+    ),
+    "MULTIPLIER": (
+        "HIGH - Cross-domain benefits",
+        "Wetland restoration: carbon sequestration + flood control + habitat + recreation",
+        "Fast-track approval. Strong positive externalities across multiple systems.",
+    ),
+    "MODERATE_MULTIPLIER": (
+        "MODERATE - Dual benefits",
+        "Solar canopy parking: renewable energy + heat reduction",
+        "Include in funding round. Good but not exceptional cross-domain coupling.",
+    ),
+}
+
+
+@lru_cache(maxsize=256)
+def _score_core(L, I, f_time):
+    """
+    Kernel scores for a clamped layer/interaction profile.
+
+    Pure function of its (hashable) inputs, so repeated profiles skip the
+    kernel.
+
+    Returns:
+        tuple: (M, S, attribution) with attribution as a tuple
+    """
+    M, S, attr = mantic_kernel(_W_ARR, L, I, f_time)
+    return M, S, tuple(attr)
+
 
 def detect(atmospheric_benefit, ecological_benefit, infrastructure_benefit, policy_alignment,
            f_time=1.0, threshold_override=None, temporal_config=None,
@@ -65,52 +106,22 @@ def detect(atmospheric_benefit, ecological_benefit, infrastructure_benefit, poli
     })
 
     # OVERRIDES PROCESSING
-    threshold_info = {}
-    active_thresholds = DEFAULT_THRESHOLDS.copy()
-    ignored_threshold_keys = []
-    
-    if threshold_override and isinstance(threshold_override, dict):
-        for key, requested in threshold_override.items():
-            if key in DEFAULT_THRESHOLDS:
-                clamped_val, was_clamped, info = clamp_threshold_override(
-                    requested, DEFAULT_THRESHOLDS[key]
-                )
-                active_thresholds[key] = clamped_val
-                threshold_info[key] = info
-            else:
-                ignored_threshold_keys.append(key)
-    
-    temporal_validated, temporal_rejected, temporal_clamped = None, {}, {}
-    temporal_applied = None
-    if temporal_config and isinstance(temporal_config, dict):
-        temporal_validated, temporal_rejected, temporal_clamped = validate_temporal_config(
-            temporal_config, domain=DOMAIN
-        )
-        if "kernel_type" not in temporal_validated:
-            if "kernel_type" not in temporal_rejected:
-                temporal_rejected["kernel_type"] = {
-                    "requested": temporal_config.get("kernel_type"),
-                    "reason": "kernel_type required and must be allowed for domain"
-                }
-        if "t" not in temporal_validated:
-            if "t" not in temporal_rejected:
-                temporal_rejected["t"] = {
-                    "requested": temporal_config.get("t"),
-                    "reason": "t required for temporal_config"
-                }
-        if "kernel_type" in temporal_validated and "t" in temporal_validated:
-            f_time = compute_temporal_kernel(**temporal_validated)
-            temporal_applied = temporal_validated
+    active_thresholds, threshold_info, ignored_threshold_keys = resolve_threshold_overrides(
+        threshold_override, DEFAULT_THRESHOLDS
+    )
+    f_time, temporal_applied, temporal_rejected, temporal_clamped = resolve_temporal_config(
+        temporal_config, f_time, domain=DOMAIN
+    )
     
     f_time_clamped, _, f_time_info = clamp_f_time(f_time)
     
     # CORE DETECTION
-    L = [
+    L = (
         clamp_input(atmospheric_benefit, name="atmospheric_benefit"),
         clamp_input(ecological_benefit, name="ecological_benefit"),
         clamp_input(infrastructure_benefit, name="infrastructure_benefit"),
         clamp_input(policy_alignment, name="policy_alignment")
-    ]
+    )
     
     # Interaction coefficients: base, optional tool-dynamic, optional caller override.
     I_base = [1.0, 1.0, 1.0, 1.0]
@@ -124,7 +135,7 @@ def detect(atmospheric_benefit, ecological_benefit, infrastructure_benefit, poli
         interaction_override_mode=interaction_override_mode,
     )
     
-    M, S, attr = mantic_kernel(WEIGHTS, L, I, f_time_clamped)
+    M, S, attr = _score_core(L, tuple(I), f_time_clamped)
     
     coupling_threshold = active_thresholds['coupling']
     min_layer_threshold = active_thresholds['min_layer']
@@ -136,7 +147,7 @@ def detect(atmospheric_benefit, ecological_benefit, infrastructure_benefit, poli
         L[2]*L[3]
     ]
     coupling = sum(pairwise_products) / len(pairwise_products)
-    high_benefit_count = sum(1 for l in L if l > 0.7)
+    high_benefit_count = (L[0] > 0.7) + (L[1] > 0.7) + (L[2] > 0.7) + (L[3] > 0.7)
     
     window_detected = False
     intervention_type = None
@@ -149,40 +160,14 @@ def detect(atmospheric_benefit, ecological_benefit, infrastructure_benefit, poli
         
         if coupling > multiplier_threshold and high_benefit_count >= 3:
             intervention_type = "HIGH_MULTIPLIER"
-            funding_priority = "URGENT - High leverage across 4 domain columns"
-            example_intervention = "Urban forestry with green infrastructure: heat reduction + biodiversity + stormwater + equity"
-            recommended_action = "Prioritize immediate funding. Every dollar creates compounding benefits across atmospheric, ecological, infrastructure, and policy domains."
         elif coupling > 0.60 or high_benefit_count >= 3:
             intervention_type = "MULTIPLIER"
-            funding_priority = "HIGH - Cross-domain benefits"
-            example_intervention = "Wetland restoration: carbon sequestration + flood control + habitat + recreation"
-            recommended_action = "Fast-track approval. Strong positive externalities across multiple systems."
         else:
             intervention_type = "MODERATE_MULTIPLIER"
-            funding_priority = "MODERATE - Dual benefits"
-            example_intervention = "Solar canopy parking: renewable energy + heat reduction"
-            recommended_action = "Include in funding round. Good but not exceptional cross-domain coupling."
+        funding_priority, example_intervention, recommended_action = _TIER_TEXT[intervention_type]
     
     # Build audit
-    threshold_clamped_any = any(
-        info.get("was_clamped", False) 
-        for info in threshold_info.values()
-    ) if threshold_info else False
-    
-    threshold_audit_info = None
-    if threshold_info:
-        threshold_audit_info = {
-            "overrides": {
-                key: {
-                    "requested": info.get("requested"),
-                    "used": info.get("used"),
-                    "was_clamped": info.get("was_clamped", False)
-                }
-                for key, info in threshold_info.items()
-            },
-            "was_clamped": threshold_clamped_any,
-            "ignored_keys": ignored_threshold_keys if ignored_threshold_keys else None
-        }
+    threshold_audit_info = build_threshold_audit(threshold_info, ignored_threshold_keys)
     
     overrides_applied = build_overrides_audit(
         threshold_overrides=threshold_override if threshold_override else None,
@@ -194,13 +179,11 @@ def detect(atmospheric_benefit, ecological_benefit, infrastructure_benefit, poli
         f_time_info=f_time_info,
         interaction=interaction_audit
     )
-    
-    _weights_dict = dict(zip(LAYER_NAMES, WEIGHTS))
     _layer_values_dict = dict(zip(LAYER_NAMES, L))
     _layer_interactions = dict(zip(LAYER_NAMES, I))
     layer_visibility = get_layer_visibility(
         "climate_resilience_multiplier",
-        _weights_dict,
+        _WEIGHTS_DICT,
         _layer_values_dict,
         _layer_interactions
     )
@@ -217,15 +200,10 @@ def detect(atmospheric_benefit, ecological_benefit, infrastructure_benefit, poli
             "funding_priority": funding_priority,
             "m_score": float(M),
             "spatial_component": float(S),
-            "layer_attribution": format_attribution(attr, LAYER_NAMES),
+            "layer_attribution": _layer_dict(attr),
             "thresholds": active_thresholds,
             "overrides_applied": overrides_applied,
-            "benefit_profile": {
-                "atmospheric": float(L[0]),
-                "ecological": float(L[1]),
-                "infrastructure": float(L[2]),
-                "policy": float(L[3])
-            },
+            "benefit_profile": dict(zip(LAYER_NAMES, map(float, L))),
             "layer_visibility": layer_visibility,
             "layer_coupling": layer_coupling
         }
@@ -240,7 +218,7 @@ def detect(atmospheric_benefit, ecological_benefit, infrastructure_benefit, poli
         "limiting_factors": below_threshold,
         "m_score": float(M),
         "spatial_component": float(S),
-        "layer_attribution": format_attribution(attr, LAYER_NAMES),
+        "layer_attribution": _layer_dict(attr),
         "status": f"Intervention benefits limited to {high_benefit_count} domains. Seek solutions with broader coupling.",
         "thresholds": active_thresholds,
         "overrides_applied": overrides_applied,
@@ -249,35 +227,106 @@ def detect(atmospheric_benefit, ecological_benefit, infrastructure_benefit, poli
     }
 
 
-if __name__ == "__main__":
-    print("=== Climate Resilience Multiplier ===\n")
-    
-    print("Test 1: High multiplier")
-    result = detect(
-        atmospheric_benefit=0.75,
-        ecological_benefit=0.80,
-        infrastructure_benefit=0.78,
-        policy_alignment=0.82
-    )
-    print(f"  Window Detected: {result['window_detected']}")
-    print(f"  Intervention Type: {result.get('intervention_type', 'N/A')}\n")
-    
-    print("Test 2: Moderate multiplier")
-    result = detect(
-        atmospheric_benefit=0.70,
-        ecological_benefit=0.72,
-        infrastructure_benefit=0.65,
-        policy_alignment=0.68
+def detect_batch(layer_values, f_time=1.0, threshold_override=None):
+    """
+    Score many candidate interventions at once.
+
+    Vectorized counterpart of detect() for bulk screening. Each row is
+    (atmospheric, ecological, infrastructure, policy); rows are clamped to
+    [0, 1] and scored with base interaction coefficients (I = 1), one shared
+    f_time and one set of threshold overrides. Window and tier logic match
+    detect() row for row; per-row audits and visibility are not built.
+
+    Args:
+        layer_values: array-like of shape (N, 4) or (4,)
+        f_time: temporal multiplier applied to every row (clamped as in detect)
+        threshold_override: optional dict, same keys and bounds as detect()
+
+    Returns:
+        dict of length-N arrays (window_detected, intervention_type,
+        cross_domain_coupling, benefit_layers_above_70, below_threshold_mask,
+        m_score, spatial_component) plus the scalar "thresholds" dict used.
+        below_threshold_mask packs detect()'s limiting_factors into a uint8:
+        bit i is set when LAYER_NAMES[i] <= min_layer, so masks from many rows
+        can be OR-reduced to find every layer that held any candidate back.
+
+    Raises:
+        ValueError: If the input is not N x 4 or contains non-finite values
+    """
+    L = require_finite_layer_batch(layer_values)
+    np.clip(L, 0.0, 1.0, out=L)
+
+    active_thresholds = resolve_threshold_overrides(threshold_override, DEFAULT_THRESHOLDS)[0]
+    f_time_clamped = clamp_f_time(f_time)[0]
+
+    M, S, _ = mantic_kernel_batch(_W_ARR, L, f_time=f_time_clamped, attribution=False)
+
+    a, b, c, d = L.T
+    # Same summation order as detect() so tier boundaries agree bit for bit
+    coupling = (a*b + a*c + a*d + b*c + b*d + c*d) / 6
+    high_benefit_count = (L > 0.7).sum(axis=1)
+    # Bit i set when layer i is at or below min_layer (detect()'s limiting_factors)
+    below_threshold_mask = (
+        (L <= active_thresholds['min_layer']).astype(np.uint8) << _LAYER_BITS
+    ).sum(axis=1, dtype=np.uint8)
+
+    window = (coupling > active_thresholds['coupling']) & (
+        L.min(axis=1) > active_thresholds['min_layer']
     )
-    print(f"  Window Detected: {result['window_detected']}")
-    print(f"  Intervention Type: {result.get('intervention_type', 'N/A')}\n")
-    
-    print("Test 3: No multiplier")
-    result = detect(
-        atmospheric_benefit=0.30,
-        ecological_benefit=0.25,
-        infrastructure_benefit=0.85,
-        policy_alignment=0.40
+    tier = np.select(
+        [
+            window & (coupling > active_thresholds['multiplier']) & (high_benefit_count >= 3),
+            window & ((coupling > 0.60) | (high_benefit_count >= 3)),
+            window,
+        ],
+        [3, 2, 1],
+        default=0,
     )
-    print(f"  Window Detected: {result['window_detected']}")
-    print(f"  Status: {result['status']}")
+
+    return {
+        "window_detected": window,
+        "intervention_type": _INTERVENTION_TYPES[tier],
+        "cross_domain_coupling": coupling,
+        "benefit_layers_above_70": high_benefit_count,
+        "below_threshold_mask": below_threshold_mask,
+        "m_score": M,
+        "spatial_component": S,
+        "thresholds": active_thresholds,
+    }
+
+
+def detect_grid(atmospheric, ecological, infrastructure, policy,
+                f_time=1.0, threshold_override=None):
+    """
+    Score every combination of the given layer values (sensitivity sweeps).
+
+    Builds the Cartesian product of the four 1-D axes and scores it with
+    detect_batch(), so a 20 x 20 x 20 x 20 sweep is one vectorized pass
+    rather than 160,000 detect() calls.
+
+    Args:
+        atmospheric, ecological, infrastructure, policy: 1-D array-likes of
+            values to sweep for each layer (a scalar is a one-point axis)
+        f_time: temporal multiplier applied to every point
+        threshold_override: optional dict, same keys and bounds as detect()
+
+    Returns:
+        Same keys as detect_batch(), with each per-point array shaped
+        (len(atmospheric), len(ecological), len(infrastructure), len(policy)).
+
+    Raises:
+        ValueError: If an axis is not 1-D or contains non-finite values
+    """
+    axes = [np.array(v, dtype=np.float64, ndmin=1)
+            for v in (atmospheric, ecological, infrastructure, policy)]
+    for name, axis in zip(LAYER_NAMES, axes):
+        if axis.ndim != 1:
+            raise ValueError(f"{name} axis must be 1-D, got shape {axis.shape}")
+    shape = tuple(axis.size for axis in axes)
+    points = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, 4)
+
+    result = detect_batch(points, f_time=f_time, threshold_override=threshold_override)
+    for key, value in result.items():
+        if isinstance(value, np.ndarray):
+            result[key] = value.reshape(shape)
+    return result
@@ -17,23 +17,15 @@ Output:
     window_detected, attacker_state, defender_advantage, m_score, overrides_applied
 """
 
-import sys
-import os
-
-# Avoid mutating sys.path on import; only adjust for direct script execution.
-if __name__ == "__main__":
-    _repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    if _repo_root not in sys.path:
-        sys.path.insert(0, _repo_root)
+from functools import lru_cache
 
 import numpy as np
 from mantic_thinking.core.safe_kernel import safe_mantic_kernel as mantic_kernel
-from mantic_thinking.core.mantic_kernel import compute_temporal_kernel
 from mantic_thinking.core.validators import (
-    clamp_input, require_finite_inputs, format_attribution,
-    clamp_threshold_override, validate_temporal_config,
-    clamp_f_time, build_overrides_audit, compute_layer_coupling,
-    resolve_interaction_coefficients
+    clamp_input, require_finite_inputs, layer_dict_builder, clamp_f_time,
+    build_overrides_audit, compute_layer_coupling,
+    resolve_interaction_coefficients, resolve_threshold_overrides,
+    resolve_temporal_config, build_threshold_audit
 )
 from mantic_thinking.mantic.introspection import get_layer_visibility
 
@@ -48,6 +40,51 @@ DEFAULT_THRESHOLDS = {
 
 DOMAIN = "cyber"
 
+# Kernel-ready weight vector, built once at import.
+_W_ARR = np.asarray(WEIGHTS, dtype=np.float64)
+_W_ARR.setflags(write=False)
+# Name-keyed weights for get_layer_visibility(); read-only, shared across calls.
+_WEIGHTS_DICT = dict(zip(LAYER_NAMES, WEIGHTS))
+# {layer_name: float} builder for attribution / layer-value result dicts.
+_layer_dict = layer_dict_builder(LAYER_NAMES)
+
+# Per-advantage (attacker_state, recommended_action, duration_estimate, counter_attack_viability)
+_TIER_TEXT = {
+    "CRITICAL": (
+        "SEVERELY_OVEREXTENDED",
+        "Deploy active defense / deception / takedown. Attacker TTPs are brittle and exposed.",
+        "24-48 hours before attacker rotates tools",
+        "High - consider attribution publication or infrastructure seizure",
+    ),
+    "HIGH": (
+        "OVEREXTENDED",
+        "Deploy deception and enhanced monitoring. Prepare for rapid response.",
+        "48-72 hour window",
+        "Moderate - gather intelligence before acting",
+    ),
+    "MODERATE": (
+        "STRESSED",
+        "Increase monitoring. Prepare countermeasures.",
+        "72-96 hour window",
+        "Low - maintain defensive posture",
+    ),
+}
+
+
+@lru_cache(maxsize=256)
+def _score_core(L, I, f_time):
+    """
+    Kernel scores for a clamped layer/interaction profile.
+
+    Pure function of its (hashable) inputs, so repeated profiles skip the
+    kernel.
+
+    Returns:
+        tuple: (M, S, attribution) with attribution as a tuple
+    """
+    M, S, attr = mantic_kernel(_W_ARR, L, I, f_time)
+    return M, S, tuple(attr)
+
 
 def detect(threat_intel_stretch, geopolitical_pressure, operational_hardening, tool_reuse_fatigue,
            f_time=1.0, threshold_override=None, temporal_config=None,
@@ -64,52 +101,22 @@ def detect(threat_intel_stretch, geopolitical_pressure, operational_hardening, t
     })
 
     # OVERRIDES PROCESSING
-    threshold_info = {}
-    active_thresholds = DEFAULT_THRESHOLDS.copy()
-    ignored_threshold_keys = []
-    
-    if threshold_override and isinstance(threshold_override, dict):
-        for key, requested in threshold_override.items():
-            if key in DEFAULT_THRESHOLDS:
-                clamped_val, was_clamped, info = clamp_threshold_override(
-                    requested, DEFAULT_THRESHOLDS[key]
-                )
-                active_thresholds[key] = clamped_val
-                threshold_info[key] = info
-            else:
-                ignored_threshold_keys.append(key)
-    
-    temporal_validated, temporal_rejected, temporal_clamped = None, {}, {}
-    temporal_applied = None
-    if temporal_config and isinstance(temporal_config, dict):
-        temporal_validated, temporal_rejected, temporal_clamped = validate_temporal_config(
-            temporal_config, domain=DOMAIN
-        )
-        if "kernel_type" not in temporal_validated:
-            if "kernel_type" not in temporal_rejected:
-                temporal_rejected["kernel_type"] = {
-                    "requested": temporal_config.get("kernel_type"),
-                    "reason": "kernel_type required and must be allowed for domain"
-                }
-        if "t" not in temporal_validated:
-            if "t" not in temporal_rejected:
-                temporal_rejected["t"] = {
-                    "requested": temporal_config.get("t"),
-                    "reason": "t required for temporal_config"
-                }
-        if "kernel_type" in temporal_validated and "t" in temporal_validated:
-            f_time = compute_temporal_kernel(**temporal_validated)
-            temporal_applied = temporal_validated
+    active_thresholds, threshold_info, ignored_threshold_keys = resolve_threshold_overrides(
+        threshold_override, DEFAULT_THRESHOLDS
+    )
+    f_time, temporal_applied, temporal_rejected, temporal_clamped = resolve_temporal_config(
+        temporal_config, f_time, domain=DOMAIN
+    )
     
     f_time_clamped, _, f_time_info = clamp_f_time(f_time)
     
     # CORE DETECTION
-    L = [
+    L = (
         clamp_input(threat_intel_stretch, name="threat_intel_stretch"),
         clamp_input(geopolitical_pressure, name="geopolitical_pressure"),
         clamp_input(operational_hardening, name="operational_hardening"),
         clamp_input(tool_reuse_fatigue, name="tool_reuse_fatigue")
-    ]
+    )
     
     # Interaction coefficients: base, optional tool-dynamic, optional caller override.
     I_base = [1.0, 1.0, 1.0, 1.0]
@@ -123,7 +130,7 @@ def detect(threat_intel_stretch, geopolitical_pressure, operational_hardening, t
         interaction_override_mode=interaction_override_mode,
     )
     
-    M, S, attr = mantic_kernel(WEIGHTS, L, I, f_time_clamped)
+    M, S, attr = _score_core(L, tuple(I), f_time_clamped)
     
     overreach_threshold = active_thresholds['overreach']
     hardening_threshold = active_thresholds['hardening']
@@ -142,43 +149,15 @@ def detect(threat_intel_stretch, geopolitical_pressure, operational_hardening, t
         
         if attacker_strain > 0.85 and L[2] > 0.75:
             defender_advantage = "CRITICAL"
-            attacker_state = "SEVERELY_OVEREXTENDED"
-            recommended_action = "Deploy active defense / deception / takedown. Attacker TTPs are brittle and exposed."
-            duration_estimate = "24-48 hours before attacker rotates tools"
-            counter_attack_viability = "High - consider attribution publication or infrastructure seizure"
         elif attacker_strain > 0.75:
             defender_advantage = "HIGH"
-            attacker_state = "OVEREXTENDED"
-            recommended_action = "Deploy deception and enhanced monitoring. Prepare for rapid response."
-            duration_estimate = "48-72 hour window"
-            counter_attack_viability = "Moderate - gather intelligence before acting"
         else:
             defender_advantage = "MODERATE"
-            attacker_state = "STRESSED"
-            recommended_action = "Increase monitoring. Prepare countermeasures."
-            duration_estimate = "72-96 hour window"
-            counter_attack_viability = "Low - maintain defensive posture"
+        (attacker_state, recommended_action, duration_estimate,
+         counter_attack_viability) = _TIER_TEXT[defender_advantage]
     
     # Build audit
-    threshold_clamped_any = any(
-        info.get("was_clamped", False) 
-        for info in threshold_info.values()
-    ) if threshold_info else False
-    
-    threshold_audit_info = None
-    if threshold_info:
-        threshold_audit_info = {
-            "overrides": {
-                key: {
-                    "requested": info.get("requested"),
-                    "used": info.get("used"),
-                    "was_clamped": info.get("was_clamped", False)
-                }
-                for key, info in threshold_info.items()
-            },
-            "was_clamped": threshold_clamped_any,
-            "ignored_keys": ignored_threshold_keys if ignored_threshold_keys else None
-        }
+    threshold_audit_info = build_threshold_audit(threshold_info, ignored_threshold_keys)
     
     overrides_applied = build_overrides_audit(
         threshold_overrides=threshold_override if threshold_override else None,
@@ -190,13 +169,11 @@ def detect(threat_intel_stretch, geopolitical_pressure, operational_hardening, t
         f_time_info=f_time_info,
         interaction=interaction_audit
     )
-    
-    _weights_dict = dict(zip(LAYER_NAMES, WEIGHTS))
     _layer_values_dict = dict(zip(LAYER_NAMES, L))
     _layer_interactions = dict(zip(LAYER_NAMES, I))
     layer_visibility = get_layer_visibility(
         "cyber_adversary_overreach",
-        _weights_dict,
+        _WEIGHTS_DICT,
         _layer_values_dict,
         _layer_interactions
     )
@@ -213,7 +190,7 @@ def detect(threat_intel_stretch, geopolitical_pressure, operational_hardening, t
             "counter_attack_viability": counter_attack_viability,
             "m_score": float(M),
             "spatial_component": float(S),
-            "layer_attribution": format_attribution(attr, LAYER_NAMES),
+            "layer_attribution": _layer_dict(attr),
             "thresholds": active_thresholds,
             "overrides_applied": overrides_applied,
             "strain_indicators": {
@@ -241,44 +218,10 @@ def detect(threat_intel_stretch, geopolitical_pressure, operational_hardening, t
         "limiting_factor": limiting_factor,
         "m_score": float(M),
         "spatial_component": float(S),
-        "layer_attribution": format_attribution(attr, LAYER_NAMES),
+        "layer_attribution": _layer_dict(attr),
         "status": "Defensive window not yet open",
         "thresholds": active_thresholds,
         "overrides_applied": overrides_applied,
         "layer_visibility": layer_visibility,
         "layer_coupling": layer_coupling
     }
-
-
-if __name__ == "__main__":
-    print("=== Cyber Adversary Overreach Detector ===\n")
-    
-    print("Test 1: Critical overreach")
-    result = detect(
-        threat_intel_stretch=0.90,
-        geopolitical_pressure=0.85,
-        operational_hardening=0.80,
-        tool_reuse_fatigue=0.88
-    )
-    print(f"  Window Detected: {result['window_detected']}")
-    print(f"  Attacker State: {result['attacker_state']}\n")
-    
-    print("Test 2: Moderate overreach")
-    result = detect(
-        threat_intel_stretch=0.75,
-        geopolitical_pressure=0.70,
-        operational_hardening=0.75,
-        tool_reuse_fatigue=0.72
-    )
-    print(f"  Window Detected: {result['window_detected']}")
-    print(f"  Attacker State: {result['attacker_state']}\n")
-    
-    print("Test 3: No window")
-    result = detect(
-        threat_intel_stretch=0.85,
-        geopolitical_pressure=0.80,
-        operational_hardening=0.45,
-        tool_reuse_fatigue=0.75
-    )
-    print(f"  Window Detected: {result['window_detected']}")
-    print(f"  Limiting Factor: {result['limiting_factor']}")
@@ -0,0 +1,6 @@
+"""
+Runnable demos for the emergence (confluence) tools.
+
+Each module exercises one detector on a few representative scenarios:
+    python -m mantic_thinking.tools.emergence.examples.<tool_name>
+"""
@@ -0,0 +1,54 @@
+"""
+Climate Resilience Multiplier - demo
+
+Runs a few representative scenarios through
+mantic_thinking.tools.emergence.climate_resilience_multiplier.detect.
+
+Usage:
+    python -m mantic_thinking.tools.emergence.examples.climate_resilience_multiplier
+"""
+
+import sys
+import os
+
+# Allow running this file directly from a source checkout.
+if __name__ == "__main__":
+    _repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", ".."))
+    if _repo_root not in sys.path:
+        sys.path.insert(0, _repo_root)
+
+from mantic_thinking.tools.emergence.climate_resilience_multiplier import detect
+
+
+if __name__ == "__main__":
+    print("=== Climate Resilience Multiplier ===\n")
+    
+    print("Test 1: High multiplier")
+    result = detect(
+        atmospheric_benefit=0.75,
+        ecological_benefit=0.80,
+        infrastructure_benefit=0.78,
+        policy_alignment=0.82
+    )
+    print(f"  Window Detected: {result['window_detected']}")
+    print(f"  Intervention Type: {result.get('intervention_type', 'N/A')}\n")
+    
+    print("Test 2: Moderate multiplier")
+    result = detect(
+        atmospheric_benefit=0.70,
+        ecological_benefit=0.72,
+        infrastructure_benefit=0.65,
+        policy_alignment=0.68
+    )
+    print(f"  Window Detected: {result['window_detected']}")
+    print(f"  Intervention Type: {result.get('intervention_type', 'N/A')}\n")
+    
+    print("Test 3: No multiplier")
+    result = detect(
+        atmospheric_benefit=0.30,
+        ecological_benefit=0.25,
+        infrastructure_benefit=0.85,
+        policy_alignment=0.40
+    )
+    print(f"  Window Detected: {result['window_detected']}")
+    print(f"  Status: {result['status']}")
@@ -0,0 +1,54 @@
+"""
+Cyber Adversary Overreach Detector - demo
+
+Runs a few representative scenarios through
+mantic_thinking.tools.emergence.cyber_adversary_overreach.detect.
+
+Usage:
+    python -m mantic_thinking.tools.emergence.examples.cyber_adversary_overreach
+"""
+
+import sys
+import os
+
+# Allow running this file directly from a source checkout.
+if __name__ == "__main__":
+    _repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", ".."))
+    if _repo_root not in sys.path:
+        sys.path.insert(0, _repo_root)
+
+from mantic_thinking.tools.emergence.cyber_adversary_overreach import detect
+
+
+if __name__ == "__main__":
+    print("=== Cyber Adversary Overreach Detector ===\n")
+    
+    print("Test 1: Critical overreach")
+    result = detect(
+        threat_intel_stretch=0.90,
+        geopolitical_pressure=0.85,
+        operational_hardening=0.80,
+        tool_reuse_fatigue=0.88
+    )
+    print(f"  Window Detected: {result['window_detected']}")
+    print(f"  Attacker State: {result['attacker_state']}\n")
+    
+    print("Test 2: Moderate overreach")
+    result = detect(
+        threat_intel_stretch=0.75,
+        geopolitical_pressure=0.70,
+        operational_hardening=0.75,
+        tool_reuse_fatigue=0.72
+    )
+    print(f"  Window Detected: {result['window_detected']}")
+    print(f"  Attacker State: {result['attacker_state']}\n")
+    
+    print("Test 3: No window")
+    result = detect(
+        threat_intel_stretch=0.85,
+        geopolitical_pressure=0.80,
+        operational_hardening=0.45,
+        tool_reuse_fatigue=0.75
+    )
+    print(f"  Window Detected: {result['window_detected']}")
+    print(f"  Limiting Factor: {result['limiting_factor']}")
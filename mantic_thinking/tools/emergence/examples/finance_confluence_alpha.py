@@ -0,0 +1,54 @@
+"""
+Finance Confluence Alpha Engine - demo
+
+Runs a few representative scenarios through
+mantic_thinking.tools.emergence.finance_confluence_alpha.detect.
+
+Usage:
+    python -m mantic_thinking.tools.emergence.examples.finance_confluence_alpha
+"""
+
+import sys
+import os
+
+# Allow running this file directly from a source checkout.
+if __name__ == "__main__":
+    _repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", ".."))
+    if _repo_root not in sys.path:
+        sys.path.insert(0, _repo_root)
+
+from mantic_thinking.tools.emergence.finance_confluence_alpha import detect
+
+
+if __name__ == "__main__":
+    print("=== Finance Confluence Alpha Engine ===\n")
+    
+    print("Test 1: High conviction (crowd short, technical/macro bullish)")
+    result = detect(
+        technical_setup=0.85,
+        macro_tailwind=0.80,
+        flow_positioning=0.75,
+        risk_compression=0.70
+    )
+    print(f"  Window Detected: {result['window_detected']}")
+    print(f"  Quality: {result.get('setup_quality', 'N/A')}\n")
+    
+    print("Test 2: Moderate conviction")
+    result = detect(
+        technical_setup=0.70,
+        macro_tailwind=0.65,
+        flow_positioning=-0.60,
+        risk_compression=0.60
+    )
+    print(f"  Window Detected: {result['window_detected']}")
+    print(f"  Quality: {result.get('setup_quality', 'N/A')}\n")
+    
+    print("Test 3: No confluence")
+    result = detect(
+        technical_setup=0.75,
+        macro_tailwind=0.70,
+        flow_positioning=-0.20,
+        risk_compression=0.65
+    )
+    print(f"  Window Detected: {result['window_detected']}")
+    print(f"  Reason: {result.get('reason', 'N/A')}")
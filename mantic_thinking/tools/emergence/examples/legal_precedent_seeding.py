@@ -0,0 +1,54 @@
+"""
+Legal Precedent Seeding Optimizer - demo
+
+Runs a few representative scenarios through
+mantic_thinking.tools.emergence.legal_precedent_seeding.detect.
+
+Usage:
+    python -m mantic_thinking.tools.emergence.examples.legal_precedent_seeding
+"""
+
+import sys
+import os
+
+# Allow running this file directly from a source checkout.
+if __name__ == "__main__":
+    _repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", ".."))
+    if _repo_root not in sys.path:
+        sys.path.insert(0, _repo_root)
+
+from mantic_thinking.tools.emergence.legal_precedent_seeding import detect
+
+
+if __name__ == "__main__":
+    print("=== Legal Precedent Seeding Optimizer ===\n")
+    
+    print("Test 1: Exceptional opportunity")
+    result = detect(
+        socio_political_climate=0.85,
+        institutional_capacity=0.80,
+        statutory_ambiguity=0.88,
+        circuit_split=0.82
+    )
+    print(f"  Window Detected: {result['window_detected']}")
+    print(f"  Opportunity Level: {result['precedent_opportunity']}\n")
+    
+    print("Test 2: High opportunity")
+    result = detect(
+        socio_political_climate=0.75,
+        institutional_capacity=0.70,
+        statutory_ambiguity=0.78,
+        circuit_split=0.72
+    )
+    print(f"  Window Detected: {result['window_detected']}")
+    print(f"  Opportunity Level: {result['precedent_opportunity']}\n")
+    
+    print("Test 3: No window")
+    result = detect(
+        socio_political_climate=0.80,
+        institutional_capacity=0.75,
+        statutory_ambiguity=0.82,
+        circuit_split=0.30
+    )
+    print(f"  Window Detected: {result['window_detected']}")
+    print(f"  Limiting Factor: {result['limiting_factor']}")
@@ -0,0 +1,54 @@
+"""
+Military Strategic Initiative Window - demo
+
+Runs a few representative scenarios through
+mantic_thinking.tools.emergence.military_strategic_initiative.detect.
+
+Usage:
+    python -m mantic_thinking.tools.emergence.examples.military_strategic_initiative
+"""
+
+import sys
+import os
+
+# Allow running this file directly from a source checkout.
+if __name__ == "__main__":
+    _repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", ".."))
+    if _repo_root not in sys.path:
+        sys.path.insert(0, _repo_root)
+
+from mantic_thinking.tools.emergence.military_strategic_initiative import detect
+
+
+if __name__ == "__main__":
+    print("=== Military Strategic Initiative Window ===\n")
+    
+    print("Test 1: Decisive action window")
+    result = detect(
+        enemy_ambiguity=0.85,
+        positional_advantage=0.88,
+        logistic_readiness=0.82,
+        authorization_clarity=0.90
+    )
+    print(f"  Window Detected: {result['window_detected']}")
+    print(f"  Maneuver Type: {result['maneuver_type']}\n")
+    
+    print("Test 2: Offensive operation")
+    result = detect(
+        enemy_ambiguity=0.75,
+        positional_advantage=0.78,
+        logistic_readiness=0.72,
+        authorization_clarity=0.80
+    )
+    print(f"  Window Detected: {result['window_detected']}")
+    print(f"  Maneuver Type: {result['maneuver_type']}\n")
+    
+    print("Test 3: No window")
+    result = detect(
+        enemy_ambiguity=0.80,
+        positional_advantage=0.75,
+        logistic_readiness=0.45,
+        authorization_clarity=0.85
+    )
+    print(f"  Window Detected: {result['window_detected']}")
+    print(f"  Limiting Factors: {result['limiting_factors']}")
@@ -0,0 +1,54 @@
+"""
+Social Catalytic Alignment Detector - demo
+
+Runs a few representative scenarios through
+mantic_thinking.tools.emergence.social_catalytic_alignment.detect.
+
+Usage:
+    python -m mantic_thinking.tools.emergence.examples.social_catalytic_alignment
+"""
+
+import sys
+import os
+
+# Allow running this file directly from a source checkout.
+if __name__ == "__main__":
+    _repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", ".."))
+    if _repo_root not in sys.path:
+        sys.path.insert(0, _repo_root)
+
+from mantic_thinking.tools.emergence.social_catalytic_alignment import detect
+
+
+if __name__ == "__main__":
+    print("=== Social Catalytic Alignment Detector ===\n")
+    
+    print("Test 1: Transformative potential")
+    result = detect(
+        individual_readiness=0.82,
+        network_bridges=0.85,
+        policy_window=0.80,
+        paradigm_momentum=0.88
+    )
+    print(f"  Window Detected: {result['window_detected']}")
+    print(f"  Movement Potential: {result['movement_potential']}\n")
+    
+    print("Test 2: High potential")
+    result = detect(
+        individual_readiness=0.75,
+        network_bridges=0.78,
+        policy_window=0.72,
+        paradigm_momentum=0.70
+    )
+    print(f"  Window Detected: {result['window_detected']}")
+    print(f"  Movement Potential: {result['movement_potential']}\n")
+    
+    print("Test 3: No window")
+    result = detect(
+        individual_readiness=0.80,
+        network_bridges=0.75,
+        policy_window=0.40,
+        paradigm_momentum=0.70
+    )
+    print(f"  Window Detected: {result['window_detected']}")
+    print(f"  Limiting Factors: {result['limiting_factors']}")
@@ -0,0 +1,32 @@
+"""
+System Lock Dissolution Window Detector - demo
+
+Runs a few representative scenarios through
+mantic_thinking.tools.emergence.system_lock_dissolution_window.detect.
+
+Usage:
+    python -m mantic_thinking.tools.emergence.examples.system_lock_dissolution_window
+"""
+
+import sys
+import os
+
+# Allow running this file directly from a source checkout.
+if __name__ == "__main__":
+    _repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", ".."))
+    if _repo_root not in sys.path:
+        sys.path.insert(0, _repo_root)
+
+from mantic_thinking.tools.emergence.system_lock_dissolution_window import detect
+
+
+if __name__ == "__main__":
+    print("=== System Lock Dissolution Window Detector ===\\n")
+    result = detect(
+        autonomy_momentum=0.6,
+        alternative_readiness=0.7,
+        control_vulnerability=0.65,
+        pattern_flexibility=0.6,
+    )
+    print(f"Window detected: {result['window_detected']}")
+    print(f"M-score: {result['m_score']:.3f}")
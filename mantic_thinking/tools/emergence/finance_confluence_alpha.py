@@ -17,23 +17,17 @@ Output:
     window_detected, setup_quality, conviction_score, m_score, overrides_applied
 """
 
-import sys
-import os
-
-# Avoid mutating sys.path on import; only adjust for direct script execution.
-if __name__ == "__main__":
-    _repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    if _repo_root not in sys.path:
-        sys.path.insert(0, _repo_root)
+from functools import lru_cache
 
 import numpy as np
 from mantic_thinking.core.safe_kernel import safe_mantic_kernel as mantic_kernel
-from mantic_thinking.core.mantic_kernel import compute_temporal_kernel
+from mantic_thinking.core.mantic_kernel import mantic_kernel_batch
 from mantic_thinking.core.validators import (
-    clamp_input, require_finite_inputs, format_attribution,
-    clamp_threshold_override, validate_temporal_config,
-    clamp_f_time, build_overrides_audit, compute_layer_coupling,
-    resolve_interaction_coefficients
+    clamp_input, require_finite_inputs, require_finite_layer_batch,
+    layer_dict_builder, clamp_f_time,
+    build_overrides_audit, compute_layer_coupling,
+    resolve_interaction_coefficients, resolve_threshold_overrides,
+    resolve_temporal_config, build_threshold_audit
 )
 from mantic_thinking.mantic.introspection import get_layer_visibility
 
@@ -50,6 +44,33 @@ DEFAULT_THRESHOLDS = {
 
 DOMAIN = "finance"
 
+# Kernel-ready weight vector in LAYER_NAMES order, built once at import.
+_W_ARR = np.asarray(WEIGHTS, dtype=np.float64)
+_W_ARR.setflags(write=False)
+# Name-keyed weights for get_layer_visibility(); read-only, shared across calls.
+_WEIGHTS_DICT = dict(zip(LAYER_NAMES, WEIGHTS))
+# {layer_name: float} builder for attribution / layer-value result dicts.
+_layer_dict = layer_dict_builder(LAYER_NAMES)
+# Per-column clamp bounds for detect_batch (flow is signed)
+_BATCH_LO = np.array([0.0, 0.0, -1.0, 0.0])
+_BATCH_HI = np.ones(4)
+_SETUP_QUALITIES = np.array([None, "MODERATE_CONVICTION", "HIGH_CONVICTION"], dtype=object)
+
+
+@lru_cache(maxsize=256)
+def _score_core(L, I, f_time):
+    """
+    Kernel scores for a normalized layer/interaction profile.
+
+    Pure function of its (hashable) inputs, so repeated profiles (e.g. a
+    backtest sweep revisiting the same grid points) skip the kernel.
+
+    Returns:
+        tuple: (M, S, attribution) with attribution as a tuple
+    """
+    M, S, attr = mantic_kernel(_W_ARR, L, I, f_time)
+    return M, S, tuple(attr)
+
 
 def detect(technical_setup, macro_tailwind, flow_positioning, risk_compression,
            f_time=1.0, threshold_override=None, temporal_config=None,
@@ -66,42 +87,12 @@ def detect(technical_setup, macro_tailwind, flow_positioning, risk_compression,
     })
 
     # OVERRIDES PROCESSING
-    threshold_info = {}
-    active_thresholds = DEFAULT_THRESHOLDS.copy()
-    ignored_threshold_keys = []
-    
-    if threshold_override and isinstance(threshold_override, dict):
-        for key, requested in threshold_override.items():
-            if key in DEFAULT_THRESHOLDS:
-                clamped_val, was_clamped, info = clamp_threshold_override(
-                    requested, DEFAULT_THRESHOLDS[key]
-                )
-                active_thresholds[key] = clamped_val
-                threshold_info[key] = info
-            else:
-                ignored_threshold_keys.append(key)
-    
-    temporal_validated, temporal_rejected, temporal_clamped = None, {}, {}
-    temporal_applied = None
-    if temporal_config and isinstance(temporal_config, dict):
-        temporal_validated, temporal_rejected, temporal_clamped = validate_temporal_config(
-            temporal_config, domain=DOMAIN
-        )
-        if "kernel_type" not in temporal_validated:
-            if "kernel_type" not in temporal_rejected:
-                temporal_rejected["kernel_type"] = {
-                    "requested": temporal_config.get("kernel_type"),
-                    "reason": "kernel_type required and must be allowed for domain"
-                }
-        if "t" not in temporal_validated:
-            if "t" not in temporal_rejected:
-                temporal_rejected["t"] = {
-                    "requested": temporal_config.get("t"),
-                    "reason": "t required for temporal_config"
-                }
-        if "kernel_type" in temporal_validated and "t" in temporal_validated:
-            f_time = compute_temporal_kernel(**temporal_validated)
-            temporal_applied = temporal_validated
+    active_thresholds, threshold_info, ignored_threshold_keys = resolve_threshold_overrides(
+        threshold_override, DEFAULT_THRESHOLDS
+    )
+    f_time, temporal_applied, temporal_rejected, temporal_clamped = resolve_temporal_config(
+        temporal_config, f_time, domain=DOMAIN
+    )
     
     f_time_clamped, _, f_time_info = clamp_f_time(f_time)
     
@@ -112,11 +103,13 @@ def detect(technical_setup, macro_tailwind, flow_positioning, risk_compression,
         clamp_input(flow_positioning, min_val=-1, max_val=1, name="flow_positioning"),
         clamp_input(risk_compression, name="risk_compression")
     ]
+    flow = L_raw[2]
+    flow_magnitude = abs(flow)
     
     L_normalized = [
         L_raw[0],
         L_raw[1],
-        (L_raw[2] + 1) / 2,  # Convert -1,1 to 0,1
+        (flow + 1) / 2,  # Convert -1,1 to 0,1
         L_raw[3]
     ]
     
@@ -124,7 +117,7 @@ def detect(technical_setup, macro_tailwind, flow_positioning, risk_compression,
     I_base = [1.0, 1.0, 1.0, 1.0]
 
     # Tool-dynamic interactions (respecting original logic)
-    flow_boost = abs(L_raw[2]) * 0.2
+    flow_boost = flow_magnitude * 0.2
     I_dynamic = [min(1.0, 0.9 + flow_boost), 1.0, min(1.0, 0.9 + flow_boost * 1.5), 1.0]
 
     I, interaction_audit = resolve_interaction_coefficients(
@@ -136,7 +129,7 @@ def detect(technical_setup, macro_tailwind, flow_positioning, risk_compression,
         interaction_override_mode=interaction_override_mode,
     )
     
-    M, S, attr = mantic_kernel(WEIGHTS, L_normalized, I, f_time_clamped)
+    M, S, attr = _score_core(tuple(L_normalized), tuple(I), f_time_clamped)
     
     alignment_threshold = active_thresholds['alignment']
     flow_extreme_threshold = active_thresholds['flow_extreme']
@@ -145,11 +138,9 @@ def detect(technical_setup, macro_tailwind, flow_positioning, risk_compression,
     
     technical_macro_gap = abs(L_raw[0] - L_raw[1])
     technical_macro_aligned = technical_macro_gap < tech_macro_gap_max and L_raw[0] > alignment_threshold
-    flow_favorable = abs(L_raw[2]) > flow_extreme_threshold
-    flow_direction = "long" if L_raw[2] < 0 else "short"
+    flow_favorable = flow_magnitude > flow_extreme_threshold
+    flow_direction = "long" if flow < 0 else "short"
     risk_ok = L_raw[3] > risk_ok_threshold
-    # Flow can be contrarian (negative) and still favorable; require non-flow layers > 0.5
-    all_favorable = min(L_raw[0], L_raw[1], L_raw[3]) > 0.5
     
     window_detected = False
     setup_quality = None
@@ -159,11 +150,15 @@ def detect(technical_setup, macro_tailwind, flow_positioning, risk_compression,
     stop_loss = None
     risk_reward = None
     
-    if technical_macro_aligned and flow_favorable and risk_ok and all_favorable:
+    # Flow extremes are the rarest condition in market data, so test them first.
+    # Flow can be contrarian (negative) and still favorable; require non-flow
+    # layers > 0.5, evaluated only once the reported flags have all passed.
+    if (flow_favorable and technical_macro_aligned and risk_ok
+            and min(L_raw[0], L_raw[1], L_raw[3]) > 0.5):
         window_detected = True
         
         base_conviction = (L_raw[0] + L_raw[1]) / 2
-        flow_boost_factor = 1 + abs(L_raw[2]) * 0.2
+        flow_boost_factor = 1 + flow_boost
         conviction_score = min(base_conviction * flow_boost_factor, 1.0)
         
         if conviction_score > 0.85 and min(L_raw[0], L_raw[1]) > 0.75:
@@ -180,25 +175,7 @@ def detect(technical_setup, macro_tailwind, flow_positioning, risk_compression,
             risk_reward = "Favorable (2:1)"
     
     # Build audit
-    threshold_clamped_any = any(
-        info.get("was_clamped", False) 
-        for info in threshold_info.values()
-    ) if threshold_info else False
-    
-    threshold_audit_info = None
-    if threshold_info:
-        threshold_audit_info = {
-            "overrides": {
-                key: {
-                    "requested": info.get("requested"),
-                    "used": info.get("used"),
-                    "was_clamped": info.get("was_clamped", False)
-                }
-                for key, info in threshold_info.items()
-            },
-            "was_clamped": threshold_clamped_any,
-            "ignored_keys": ignored_threshold_keys if ignored_threshold_keys else None
-        }
+    threshold_audit_info = build_threshold_audit(threshold_info, ignored_threshold_keys)
     
     overrides_applied = build_overrides_audit(
         threshold_overrides=threshold_override if threshold_override else None,
@@ -210,13 +187,11 @@ def detect(technical_setup, macro_tailwind, flow_positioning, risk_compression,
         f_time_info=f_time_info,
         interaction=interaction_audit
     )
-    
-    _weights_dict = dict(zip(LAYER_NAMES, WEIGHTS))
     _layer_values_dict = dict(zip(LAYER_NAMES, L_normalized))
     _layer_interactions = dict(zip(LAYER_NAMES, I))
     layer_visibility = get_layer_visibility(
         "finance_confluence_alpha",
-        _weights_dict,
+        _WEIGHTS_DICT,
         _layer_values_dict,
         _layer_interactions
     )
@@ -233,10 +208,10 @@ def detect(technical_setup, macro_tailwind, flow_positioning, risk_compression,
             "risk_reward": risk_reward,
             "m_score": float(M),
             "spatial_component": float(S),
-            "layer_attribution": format_attribution(attr, LAYER_NAMES),
+            "layer_attribution": _layer_dict(attr),
             "thresholds": active_thresholds,
             "overrides_applied": overrides_applied,
-            "flow_raw": float(L_raw[2]),
+            "flow_raw": float(flow),
             "technical_macro_gap": float(technical_macro_gap),
             "position_direction": flow_direction,
             "layer_visibility": layer_visibility,
@@ -257,7 +232,7 @@ def detect(technical_setup, macro_tailwind, flow_positioning, risk_compression,
         "reason": "; ".join(missing) if missing else "Layers below threshold",
         "m_score": float(M),
         "spatial_component": float(S),
-        "layer_attribution": format_attribution(attr, LAYER_NAMES),
+        "layer_attribution": _layer_dict(attr),
         "thresholds": active_thresholds,
         "overrides_applied": overrides_applied,
         "technical_macro_aligned": technical_macro_aligned,
@@ -268,35 +243,68 @@ def detect(technical_setup, macro_tailwind, flow_positioning, risk_compression,
     }
 
 
-if __name__ == "__main__":
-    print("=== Finance Confluence Alpha Engine ===\n")
-    
-    print("Test 1: High conviction (crowd short, technical/macro bullish)")
-    result = detect(
-        technical_setup=0.85,
-        macro_tailwind=0.80,
-        flow_positioning=0.75,
-        risk_compression=0.70
-    )
-    print(f"  Window Detected: {result['window_detected']}")
-    print(f"  Quality: {result.get('setup_quality', 'N/A')}\n")
-    
-    print("Test 2: Moderate conviction")
-    result = detect(
-        technical_setup=0.70,
-        macro_tailwind=0.65,
-        flow_positioning=-0.60,
-        risk_compression=0.60
+def detect_batch(layer_values, f_time=1.0, threshold_override=None):
+    """
+    Score many symbols/bars at once.
+
+    Vectorized counterpart of detect() for universe scans and backtests.
+    Each row is (technical, macro, flow, risk) with flow in [-1, 1]; rows are
+    clamped as in detect() and scored with its default dynamic interaction
+    coefficients, one shared f_time and one set of threshold overrides.
+    Confluence and conviction logic match detect() row for row; per-row
+    audits and visibility are not built.
+
+    Args:
+        layer_values: array-like of shape (N, 4) or (4,)
+        f_time: temporal multiplier applied to every row (clamped as in detect)
+        threshold_override: optional dict, same keys and bounds as detect()
+
+    Returns:
+        dict of length-N arrays (window_detected, setup_quality,
+        conviction_score, position_direction, technical_macro_gap, m_score,
+        spatial_component) plus the scalar "thresholds" dict used.
+
+    Raises:
+        ValueError: If the input is not N x 4 or contains non-finite values
+    """
+    L_raw = require_finite_layer_batch(layer_values)
+    np.clip(L_raw, _BATCH_LO, _BATCH_HI, out=L_raw)
+
+    active_thresholds = resolve_threshold_overrides(threshold_override, DEFAULT_THRESHOLDS)[0]
+    f_time_clamped = clamp_f_time(f_time)[0]
+
+    tech, macro, flow, risk = L_raw.T
+    L_normalized = L_raw.copy()
+    L_normalized[:, 2] = (flow + 1) / 2
+
+    flow_abs = np.abs(flow)
+    flow_boost = flow_abs * 0.2
+    I = np.ones_like(L_raw)
+    I[:, 0] = np.minimum(1.0, 0.9 + flow_boost)
+    I[:, 2] = np.minimum(1.0, 0.9 + flow_boost * 1.5)
+
+    M, S, _ = mantic_kernel_batch(_W_ARR, L_normalized, I, f_time_clamped, attribution=False)
+
+    technical_macro_gap = np.abs(tech - macro)
+    window = (
+        (technical_macro_gap < active_thresholds['tech_macro_gap'])
+        & (tech > active_thresholds['alignment'])
+        & (flow_abs > active_thresholds['flow_extreme'])
+        & (risk > active_thresholds['risk_ok'])
+        & (np.minimum(np.minimum(tech, macro), risk) > 0.5)
     )
-    print(f"  Window Detected: {result['window_detected']}")
-    print(f"  Quality: {result.get('setup_quality', 'N/A')}\n")
-    
-    print("Test 3: No confluence")
-    result = detect(
-        technical_setup=0.75,
-        macro_tailwind=0.70,
-        flow_positioning=-0.20,
-        risk_compression=0.65
+    conviction = np.where(
+        window, np.minimum((tech + macro) / 2 * (1 + flow_boost), 1.0), 0.0
     )
-    print(f"  Window Detected: {result['window_detected']}")
-    print(f"  Reason: {result.get('reason', 'N/A')}")
+    high = window & (conviction > 0.85) & (np.minimum(tech, macro) > 0.75)
+
+    return {
+        "window_detected": window,
+        "setup_quality": _SETUP_QUALITIES[window.astype(np.intp) + high],
+        "conviction_score": conviction,
+        "position_direction": np.where(flow < 0, "long", "short"),
+        "technical_macro_gap": technical_macro_gap,
+        "m_score": M,
+        "spatial_component": S,
+        "thresholds": active_thresholds,
+    }
@@ -17,23 +17,17 @@ Output:
     window_detected, window_type, confidence, m_score, overrides_applied
 """
 
-import sys
-import os
-
-# Avoid mutating sys.path on import; only adjust for direct script execution.
-if __name__ == "__main__":
-    _repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    if _repo_root not in sys.path:
-        sys.path.insert(0, _repo_root)
+from functools import lru_cache
 
 import numpy as np
 from mantic_thinking.core.safe_kernel import safe_mantic_kernel as mantic_kernel
-from mantic_thinking.core.mantic_kernel import compute_temporal_kernel
+from mantic_thinking.core.mantic_kernel import mantic_kernel_batch
 from mantic_thinking.core.validators import (
-    clamp_input, require_finite_inputs, format_attribution,
-    clamp_threshold_override, validate_temporal_config,
-    clamp_f_time, build_overrides_audit, compute_layer_coupling,
-    resolve_interaction_coefficients
+    clamp_input, require_finite_inputs, require_finite_layer_batch,
+    layer_dict_builder, clamp_f_time,
+    build_overrides_audit, compute_layer_coupling,
+    resolve_interaction_coefficients, resolve_threshold_overrides,
+    resolve_temporal_config, build_threshold_audit
 )
 from mantic_thinking.mantic.introspection import get_layer_visibility
 
@@ -48,6 +42,56 @@ DEFAULT_THRESHOLDS = {
 
 DOMAIN = "healthcare"
 
+# Kernel-ready weight vector in LAYER_NAMES order, built once at import.
+_W_ARR = np.asarray(WEIGHTS, dtype=np.float64)
+_W_ARR.setflags(write=False)
+# Name-keyed weights for get_layer_visibility(); read-only, shared across calls.
+_WEIGHTS_DICT = dict(zip(LAYER_NAMES, WEIGHTS))
+# {layer_name: float} builder for attribution / layer-value result dicts.
+_layer_dict = layer_dict_builder(LAYER_NAMES)
+# Per-tier (window_type, confidence, recommended_action, duration_estimate);
+# tier 0 = no window, 1 = favorable, 2 = optimal (also detect_batch's codes)
+_WINDOW_TEXT = (
+    None,
+    (
+        "FAVORABLE: Strong alignment across all factors",
+        0.75,
+        "Good therapeutic window - proceed with treatment",
+        "5-7 day favorable window",
+    ),
+    (
+        "OPTIMAL: All systems aligned for maximum efficacy",
+        0.95,
+        "Initiate treatment protocol immediately - peak window",
+        "48-72 hour optimal window",
+    ),
+)
+_WINDOW_TYPES = np.array([None] + [text[0] for text in _WINDOW_TEXT[1:]], dtype=object)
+_CONFIDENCES = np.array([0.0] + [text[1] for text in _WINDOW_TEXT[1:]])
+_LAYER_NAME_ARR = np.array(LAYER_NAMES, dtype=object)
+_LAYER_BITS = np.arange(len(LAYER_NAMES), dtype=np.uint8)
+# Layer names for each below-threshold bit mask (same bit order as
+# detect_batch's below_threshold_mask)
+_MASK_TO_NAMES = tuple(
+    tuple(name for bit, name in enumerate(LAYER_NAMES) if mask >> bit & 1)
+    for mask in range(1 << len(LAYER_NAMES))
+)
+
+
+@lru_cache(maxsize=256)
+def _score_core(L, I, f_time):
+    """
+    Kernel scores for a clamped layer/interaction profile.
+
+    Pure function of its (hashable) inputs, so repeated profiles skip the
+    kernel.
+
+    Returns:
+        tuple: (M, S, attribution) with attribution as a tuple
+    """
+    M, S, attr = mantic_kernel(_W_ARR, L, I, f_time)
+    return M, S, tuple(attr)
+
 
 def detect(genomic_predisposition, environmental_readiness, phenotypic_timing, psychosocial_engagement, 
            f_time=1.0, threshold_override=None, temporal_config=None,
@@ -64,52 +108,22 @@ def detect(genomic_predisposition, environmental_readiness, phenotypic_timing, p
     })
 
     # OVERRIDES PROCESSING
-    threshold_info = {}
-    active_thresholds = DEFAULT_THRESHOLDS.copy()
-    ignored_threshold_keys = []
-    
-    if threshold_override and isinstance(threshold_override, dict):
-        for key, requested in threshold_override.items():
-            if key in DEFAULT_THRESHOLDS:
-                clamped_val, was_clamped, info = clamp_threshold_override(
-                    requested, DEFAULT_THRESHOLDS[key]
-                )
-                active_thresholds[key] = clamped_val
-                threshold_info[key] = info
-            else:
-                ignored_threshold_keys.append(key)
-    
-    temporal_validated, temporal_rejected, temporal_clamped = None, {}, {}
-    temporal_applied = None
-    if temporal_config and isinstance(temporal_config, dict):
-        temporal_validated, temporal_rejected, temporal_clamped = validate_temporal_config(
-            temporal_config, domain=DOMAIN
-        )
-        if "kernel_type" not in temporal_validated:
-            if "kernel_type" not in temporal_rejected:
-                temporal_rejected["kernel_type"] = {
-                    "requested": temporal_config.get("kernel_type"),
-                    "reason": "kernel_type required and must be allowed for domain"
-                }
-        if "t" not in temporal_validated:
-            if "t" not in temporal_rejected:
-                temporal_rejected["t"] = {
-                    "requested": temporal_config.get("t"),
-                    "reason": "t required for temporal_config"
-                }
-        if "kernel_type" in temporal_validated and "t" in temporal_validated:
-            f_time = compute_temporal_kernel(**temporal_validated)
-            temporal_applied = temporal_validated
+    active_thresholds, threshold_info, ignored_threshold_keys = resolve_threshold_overrides(
+        threshold_override, DEFAULT_THRESHOLDS
+    )
+    f_time, temporal_applied, temporal_rejected, temporal_clamped = resolve_temporal_config(
+        temporal_config, f_time, domain=DOMAIN
+    )
     
     f_time_clamped, _, f_time_info = clamp_f_time(f_time)
     
     # CORE DETECTION
-    L = [
+    L = (
         clamp_input(genomic_predisposition, name="genomic_predisposition"),
         clamp_input(environmental_readiness, name="environmental_readiness"),
         clamp_input(phenotypic_timing, name="phenotypic_timing"),
         clamp_input(psychosocial_engagement, name="psychosocial_engagement")
-    ]
+    )
     
     # Interaction coefficients: base, optional tool-dynamic, optional caller override.
     I_base = [1.0, 1.0, 1.0, 1.0]
@@ -123,39 +137,21 @@ def detect(genomic_predisposition, environmental_readiness, phenotypic_timing, p
         interaction_override_mode=interaction_override_mode,
     )
     
-    M, S, attr = mantic_kernel(WEIGHTS, L, I, f_time_clamped)
+    M, S, attr = _score_core(L, tuple(I), f_time_clamped)
     
-    alignment_floor = min(L)
+    # Weakest layer and its value in one unrolled sweep (first minimum wins, as argmin)
+    weakest_idx, alignment_floor = 0, L[0]
+    if L[1] < alignment_floor:
+        weakest_idx, alignment_floor = 1, L[1]
+    if L[2] < alignment_floor:
+        weakest_idx, alignment_floor = 2, L[2]
+    if L[3] < alignment_floor:
+        weakest_idx, alignment_floor = 3, L[3]
     alignment_threshold = active_thresholds['alignment']
     optimal_threshold = active_thresholds['optimal']
     
-    window_detected = False
-    window_type = None
-    confidence = 0.0
-    recommended_action = None
-    duration_estimate = None
-    limiting_factor = None
-    
-    # Build audit (once, before branching)
-    threshold_clamped_any = any(
-        info.get("was_clamped", False) 
-        for info in threshold_info.values()
-    ) if threshold_info else False
-    
-    threshold_audit_info = None
-    if threshold_info:
-        threshold_audit_info = {
-            "overrides": {
-                key: {
-                    "requested": info.get("requested"),
-                    "used": info.get("used"),
-                    "was_clamped": info.get("was_clamped", False)
-                }
-                for key, info in threshold_info.items()
-            },
-            "was_clamped": threshold_clamped_any,
-            "ignored_keys": ignored_threshold_keys if ignored_threshold_keys else None
-        }
+    # Build audit
+    threshold_audit_info = build_threshold_audit(threshold_info, ignored_threshold_keys)
     
     overrides_applied = build_overrides_audit(
         threshold_overrides=threshold_override if threshold_override else None,
@@ -169,29 +165,18 @@ def detect(genomic_predisposition, environmental_readiness, phenotypic_timing, p
     )
     
     if alignment_floor > alignment_threshold:
-        window_detected = True
-        
-        if all(l > optimal_threshold for l in L):
-            window_type = "OPTIMAL: All systems aligned for maximum efficacy"
-            confidence = 0.95
-            recommended_action = "Initiate treatment protocol immediately - peak window"
-            duration_estimate = "48-72 hour optimal window"
-        else:
-            window_type = "FAVORABLE: Strong alignment across all factors"
-            confidence = 0.75
-            recommended_action = "Good therapeutic window - proceed with treatment"
-            duration_estimate = "5-7 day favorable window"
+        window_type, confidence, recommended_action, duration_estimate = _WINDOW_TEXT[
+            2 if alignment_floor > optimal_threshold else 1
+        ]
         
-        weakest_idx = int(np.argmin(L))
         limiting_factor = LAYER_NAMES[weakest_idx]
         
         # Layer visibility for reasoning (v1.2.0+) - input-driven
-        _weights_dict = dict(zip(LAYER_NAMES, WEIGHTS))
         _layer_values_dict = dict(zip(LAYER_NAMES, L))
         _layer_interactions = dict(zip(LAYER_NAMES, I))
         layer_visibility = get_layer_visibility(
             "healthcare_precision_therapeutic",
-            _weights_dict,
+            _WEIGHTS_DICT,
             _layer_values_dict,
             _layer_interactions
         )
@@ -203,32 +188,32 @@ def detect(genomic_predisposition, environmental_readiness, phenotypic_timing, p
             "confidence": float(confidence),
             "m_score": float(M),
             "spatial_component": float(S),
-            "layer_attribution": format_attribution(attr, LAYER_NAMES),
+            "layer_attribution": _layer_dict(attr),
             "alignment_floor": float(alignment_floor),
             "limiting_factor": limiting_factor,
             "recommended_action": recommended_action,
             "duration_estimate": duration_estimate,
             "thresholds": active_thresholds,
             "overrides_applied": overrides_applied,
-            "layer_values": {
-                "genomic": float(L[0]),
-                "environmental": float(L[1]),
-                "phenotypic": float(L[2]),
-                "psychosocial": float(L[3])
-            },
+            "layer_values": _layer_dict(L),
             "layer_visibility": layer_visibility,
             "layer_coupling": layer_coupling
         }
     
-    below_threshold = [LAYER_NAMES[i] for i, l in enumerate(L) if l <= alignment_threshold]
+    below_mask = (
+        (L[0] <= alignment_threshold)
+        | (L[1] <= alignment_threshold) << 1
+        | (L[2] <= alignment_threshold) << 2
+        | (L[3] <= alignment_threshold) << 3
+    )
+    below_threshold = list(_MASK_TO_NAMES[below_mask])
     
     # Layer visibility for reasoning (v1.2.0+) - input-driven
-    _weights_dict = dict(zip(LAYER_NAMES, WEIGHTS))
     _layer_values_dict = dict(zip(LAYER_NAMES, L))
     _layer_interactions = dict(zip(LAYER_NAMES, I))
     layer_visibility = get_layer_visibility(
         "healthcare_precision_therapeutic",
-        _weights_dict,
+        _WEIGHTS_DICT,
         _layer_values_dict,
         _layer_interactions
     )
@@ -238,7 +223,7 @@ def detect(genomic_predisposition, environmental_readiness, phenotypic_timing, p
         "window_detected": False,
         "m_score": float(M),
         "spatial_component": float(S),
-        "layer_attribution": format_attribution(attr, LAYER_NAMES),
+        "layer_attribution": _layer_dict(attr),
         "alignment_floor": float(alignment_floor),
         "status": f"Layers not aligned. {', '.join(below_threshold)} below threshold.",
         "improvement_needed": below_threshold,
@@ -249,36 +234,54 @@ def detect(genomic_predisposition, environmental_readiness, phenotypic_timing, p
     }
 
 
-if __name__ == "__main__":
-    print("=== Healthcare Precision Therapeutic Window Detector ===\n")
-    
-    print("Test 1: Optimal alignment (all > 0.8)")
-    result = detect(
-        genomic_predisposition=0.85,
-        environmental_readiness=0.82,
-        phenotypic_timing=0.88,
-        psychosocial_engagement=0.90
-    )
-    print(f"  Window Detected: {result['window_detected']}")
-    print(f"  Type: {result['window_type']}")
-    print(f"  Confidence: {result['confidence']}\n")
-    
-    print("Test 2: Favorable alignment (all > 0.65)")
-    result = detect(
-        genomic_predisposition=0.70,
-        environmental_readiness=0.72,
-        phenotypic_timing=0.68,
-        psychosocial_engagement=0.75
-    )
-    print(f"  Window Detected: {result['window_detected']}")
-    print(f"  Type: {result['window_type']}\n")
-    
-    print("Test 3: Not aligned (psychosocial low)")
-    result = detect(
-        genomic_predisposition=0.75,
-        environmental_readiness=0.80,
-        phenotypic_timing=0.70,
-        psychosocial_engagement=0.45
-    )
-    print(f"  Window Detected: {result['window_detected']}")
-    print(f"  Status: {result['status']}")
+def detect_batch(layer_values, f_time=1.0, threshold_override=None):
+    """
+    Score many patients/timepoints at once.
+
+    Vectorized counterpart of detect() for cohort screening. Each row is
+    (genomic, environmental, phenotypic, psychosocial); rows are clamped to
+    [0, 1] and scored with base interaction coefficients (I = 1), one shared
+    f_time and one set of threshold overrides. Window logic matches detect()
+    row for row; per-row audits and visibility are not built.
+
+    Args:
+        layer_values: array-like of shape (N, 4) or (4,)
+        f_time: temporal multiplier applied to every row (clamped as in detect)
+        threshold_override: optional dict, same keys and bounds as detect()
+
+    Returns:
+        dict of length-N arrays (window_detected, window_type, confidence,
+        alignment_floor, limiting_factor, below_threshold_mask, m_score,
+        spatial_component) plus the scalar "thresholds" dict used.
+        limiting_factor is None where no window opened; below_threshold_mask
+        packs detect()'s improvement_needed (bit i = LAYER_NAMES[i]).
+
+    Raises:
+        ValueError: If the input is not N x 4 or contains non-finite values
+    """
+    L = require_finite_layer_batch(layer_values)
+    np.clip(L, 0.0, 1.0, out=L)
+
+    active_thresholds = resolve_threshold_overrides(threshold_override, DEFAULT_THRESHOLDS)[0]
+    f_time_clamped = clamp_f_time(f_time)[0]
+
+    M, S, _ = mantic_kernel_batch(_W_ARR, L, f_time=f_time_clamped, attribution=False)
+
+    alignment_floor = L.min(axis=1)
+    window = alignment_floor > active_thresholds['alignment']
+    tier = window.astype(np.intp) + (window & (alignment_floor > active_thresholds['optimal']))
+    below_threshold_mask = (
+        (L <= active_thresholds['alignment']).astype(np.uint8) << _LAYER_BITS
+    ).sum(axis=1, dtype=np.uint8)
+
+    return {
+        "window_detected": window,
+        "window_type": _WINDOW_TYPES[tier],
+        "confidence": _CONFIDENCES[tier],
+        "alignment_floor": alignment_floor,
+        "limiting_factor": np.where(window, _LAYER_NAME_ARR[L.argmin(axis=1)], None),
+        "below_threshold_mask": below_threshold_mask,
+        "m_score": M,
+        "spatial_component": S,
+        "thresholds": active_thresholds,
+    }
@@ -17,23 +17,15 @@ Output:
     window_detected, precedent_opportunity, strategy, m_score, overrides_applied
 """
 
-import sys
-import os
-
-# Avoid mutating sys.path on import; only adjust for direct script execution.
-if __name__ == "__main__":
-    _repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    if _repo_root not in sys.path:
-        sys.path.insert(0, _repo_root)
+from functools import lru_cache
 
 import numpy as np
 from mantic_thinking.core.safe_kernel import safe_mantic_kernel as mantic_kernel
-from mantic_thinking.core.mantic_kernel import compute_temporal_kernel
 from mantic_thinking.core.validators import (
-    clamp_input, require_finite_inputs, format_attribution,
-    clamp_threshold_override, validate_temporal_config,
-    clamp_f_time, build_overrides_audit, compute_layer_coupling,
-    resolve_interaction_coefficients
+    clamp_input, require_finite_inputs, layer_dict_builder, clamp_f_time,
+    build_overrides_audit, compute_layer_coupling,
+    resolve_interaction_coefficients, resolve_threshold_overrides,
+    resolve_temporal_config, build_threshold_audit
 )
 from mantic_thinking.mantic.introspection import get_layer_visibility
 
@@ -48,6 +40,58 @@ DEFAULT_THRESHOLDS = {
 
 DOMAIN = "legal"
 
+# Kernel-ready weight vector in LAYER_NAMES order, built once at import.
+_W_ARR = np.asarray(WEIGHTS, dtype=np.float64)
+_W_ARR.setflags(write=False)
+# Name-keyed weights for get_layer_visibility(); read-only, shared across calls.
+_WEIGHTS_DICT = dict(zip(LAYER_NAMES, WEIGHTS))
+# {layer_name: float} builder for attribution / layer-value result dicts.
+_layer_dict = layer_dict_builder(LAYER_NAMES)
+
+# Per-level (precedent_opportunity, strategy, forum_recommendation, timeline);
+# level = (ripeness > 0.70) + (ripeness > 0.80 and circuit split > 0.75)
+_TIER_TEXT = (
+    (
+        "MODERATE",
+        "Begin test case development. Window is open but not exceptional. "
+        "Build record and coalition while conditions favorable.",
+        "Select circuit with favorable precedent + active split",
+        "18-24 months to decision",
+    ),
+    (
+        "HIGH",
+        "Pursue test case aggressively. Socio-political climate favorable, "
+        "statutory ambiguity provides doctrinal opening, circuit split creates urgency. "
+        "Monitor parallel cases in other circuits.",
+        "Forum shop for most favorable circuit with active split",
+        "12-18 months to circuit decision",
+    ),
+    (
+        "EXCEPTIONAL",
+        "File test case in most favorable circuit immediately. "
+        "Exceptional convergence of socio-political tailwinds, statutory ambiguity, "
+        "and circuit split creates Supreme Court grant likelihood. "
+        "Maximize ripple effects through amicus coordination.",
+        "File in 9th or DC Circuit (depending on issue) with expedited briefing",
+        "6-12 months to circuit decision, 18-24 months to potential SCOTUS",
+    ),
+)
+
+
+@lru_cache(maxsize=256)
+def _score_core(L, I, f_time):
+    """
+    Kernel scores for a clamped layer/interaction profile.
+
+    Pure function of its (hashable) inputs, so repeated profiles skip the
+    kernel.
+
+    Returns:
+        tuple: (M, S, attribution) with attribution as a tuple
+    """
+    M, S, attr = mantic_kernel(_W_ARR, L, I, f_time)
+    return M, S, tuple(attr)
+
 
 def detect(socio_political_climate, institutional_capacity, statutory_ambiguity, circuit_split,
            f_time=1.0, threshold_override=None, temporal_config=None,
@@ -64,52 +108,22 @@ def detect(socio_political_climate, institutional_capacity, statutory_ambiguity,
     })
 
     # OVERRIDES PROCESSING
-    threshold_info = {}
-    active_thresholds = DEFAULT_THRESHOLDS.copy()
-    ignored_threshold_keys = []
-    
-    if threshold_override and isinstance(threshold_override, dict):
-        for key, requested in threshold_override.items():
-            if key in DEFAULT_THRESHOLDS:
-                clamped_val, was_clamped, info = clamp_threshold_override(
-                    requested, DEFAULT_THRESHOLDS[key]
-                )
-                active_thresholds[key] = clamped_val
-                threshold_info[key] = info
-            else:
-                ignored_threshold_keys.append(key)
-    
-    temporal_validated, temporal_rejected, temporal_clamped = None, {}, {}
-    temporal_applied = None
-    if temporal_config and isinstance(temporal_config, dict):
-        temporal_validated, temporal_rejected, temporal_clamped = validate_temporal_config(
-            temporal_config, domain=DOMAIN
-        )
-        if "kernel_type" not in temporal_validated:
-            if "kernel_type" not in temporal_rejected:
-                temporal_rejected["kernel_type"] = {
-                    "requested": temporal_config.get("kernel_type"),
-                    "reason": "kernel_type required and must be allowed for domain"
-                }
-        if "t" not in temporal_validated:
-            if "t" not in temporal_rejected:
-                temporal_rejected["t"] = {
-                    "requested": temporal_config.get("t"),
-                    "reason": "t required for temporal_config"
-                }
-        if "kernel_type" in temporal_validated and "t" in temporal_validated:
-            f_time = compute_temporal_kernel(**temporal_validated)
-            temporal_applied = temporal_validated
+    active_thresholds, threshold_info, ignored_threshold_keys = resolve_threshold_overrides(
+        threshold_override, DEFAULT_THRESHOLDS
+    )
+    f_time, temporal_applied, temporal_rejected, temporal_clamped = resolve_temporal_config(
+        temporal_config, f_time, domain=DOMAIN
+    )
     
     f_time_clamped, _, f_time_info = clamp_f_time(f_time)
     
     # CORE DETECTION
-    L = [
+    L = (
         clamp_input(socio_political_climate, name="socio_political_climate"),
         clamp_input(institutional_capacity, name="institutional_capacity"),
         clamp_input(statutory_ambiguity, name="statutory_ambiguity"),
         clamp_input(circuit_split, name="circuit_split")
-    ]
+    )
     
     # Interaction coefficients: base, optional tool-dynamic, optional caller override.
     I_base = [1.0, 1.0, 1.0, 1.0]
@@ -123,7 +137,7 @@ def detect(socio_political_climate, institutional_capacity, statutory_ambiguity,
         interaction_override_mode=interaction_override_mode,
     )
     
-    M, S, attr = mantic_kernel(WEIGHTS, L, I, f_time_clamped)
+    M, S, attr = _score_core(L, tuple(I), f_time_clamped)
     
     ripeness_threshold = active_thresholds['ripeness']
     split_threshold = active_thresholds['split']
@@ -142,48 +156,12 @@ def detect(socio_political_climate, institutional_capacity, statutory_ambiguity,
         window_detected = True
         circuit_split_exploitable = True
         
-        if ripeness > 0.80 and L[3] > 0.75:
-            precedent_opportunity = "EXCEPTIONAL"
-            strategy = ("File test case in most favorable circuit immediately. "
-                       "Exceptional convergence of socio-political tailwinds, statutory ambiguity, "
-                       "and circuit split creates Supreme Court grant likelihood. "
-                       "Maximize ripple effects through amicus coordination.")
-            forum_recommendation = "File in 9th or DC Circuit (depending on issue) with expedited briefing"
-            timeline = "6-12 months to circuit decision, 18-24 months to potential SCOTUS"
-        elif ripeness > 0.70:
-            precedent_opportunity = "HIGH"
-            strategy = ("Pursue test case aggressively. Socio-political climate favorable, "
-                       "statutory ambiguity provides doctrinal opening, circuit split creates urgency. "
-                       "Monitor parallel cases in other circuits.")
-            forum_recommendation = "Forum shop for most favorable circuit with active split"
-            timeline = "12-18 months to circuit decision"
-        else:
-            precedent_opportunity = "MODERATE"
-            strategy = ("Begin test case development. Window is open but not exceptional. "
-                       "Build record and coalition while conditions favorable.")
-            forum_recommendation = "Select circuit with favorable precedent + active split"
-            timeline = "18-24 months to decision"
+        # EXCEPTIONAL implies ripeness > 0.70, so the two tests sum to 0-2
+        level = (ripeness > 0.70) + (ripeness > 0.80 and L[3] > 0.75)
+        precedent_opportunity, strategy, forum_recommendation, timeline = _TIER_TEXT[level]
     
     # Build audit
-    threshold_clamped_any = any(
-        info.get("was_clamped", False) 
-        for info in threshold_info.values()
-    ) if threshold_info else False
-    
-    threshold_audit_info = None
-    if threshold_info:
-        threshold_audit_info = {
-            "overrides": {
-                key: {
-                    "requested": info.get("requested"),
-                    "used": info.get("used"),
-                    "was_clamped": info.get("was_clamped", False)
-                }
-                for key, info in threshold_info.items()
-            },
-            "was_clamped": threshold_clamped_any,
-            "ignored_keys": ignored_threshold_keys if ignored_threshold_keys else None
-        }
+    threshold_audit_info = build_threshold_audit(threshold_info, ignored_threshold_keys)
     
     overrides_applied = build_overrides_audit(
         threshold_overrides=threshold_override if threshold_override else None,
@@ -195,13 +173,11 @@ def detect(socio_political_climate, institutional_capacity, statutory_ambiguity,
         f_time_info=f_time_info,
         interaction=interaction_audit
     )
-    
-    _weights_dict = dict(zip(LAYER_NAMES, WEIGHTS))
     _layer_values_dict = dict(zip(LAYER_NAMES, L))
     _layer_interactions = dict(zip(LAYER_NAMES, I))
     layer_visibility = get_layer_visibility(
         "legal_precedent_seeding",
-        _weights_dict,
+        _WEIGHTS_DICT,
         _layer_values_dict,
         _layer_interactions
     )
@@ -218,7 +194,7 @@ def detect(socio_political_climate, institutional_capacity, statutory_ambiguity,
             "timeline": timeline,
             "m_score": float(M),
             "spatial_component": float(S),
-            "layer_attribution": format_attribution(attr, LAYER_NAMES),
+            "layer_attribution": _layer_dict(attr),
             "thresholds": active_thresholds,
             "overrides_applied": overrides_applied,
             "favorable_conditions": {
@@ -248,7 +224,7 @@ def detect(socio_political_climate, institutional_capacity, statutory_ambiguity,
         "limiting_factor": limiting_factor,
         "m_score": float(M),
         "spatial_component": float(S),
-        "layer_attribution": format_attribution(attr, LAYER_NAMES),
+        "layer_attribution": _layer_dict(attr),
         "status": f"Precedent window not yet ripe. {limiting_factor}.",
         "recommendation": "Monitor for circuit split development or socio-political shift.",
         "thresholds": active_thresholds,
@@ -256,37 +232,3 @@ def detect(socio_political_climate, institutional_capacity, statutory_ambiguity,
         "layer_visibility": layer_visibility,
         "layer_coupling": layer_coupling
     }
-
-
-if __name__ == "__main__":
-    print("=== Legal Precedent Seeding Optimizer ===\n")
-    
-    print("Test 1: Exceptional opportunity")
-    result = detect(
-        socio_political_climate=0.85,
-        institutional_capacity=0.80,
-        statutory_ambiguity=0.88,
-        circuit_split=0.82
-    )
-    print(f"  Window Detected: {result['window_detected']}")
-    print(f"  Opportunity Level: {result['precedent_opportunity']}\n")
-    
-    print("Test 2: High opportunity")
-    result = detect(
-        socio_political_climate=0.75,
-        institutional_capacity=0.70,
-        statutory_ambiguity=0.78,
-        circuit_split=0.72
-    )
-    print(f"  Window Detected: {result['window_detected']}")
-    print(f"  Opportunity Level: {result['precedent_opportunity']}\n")
-    
-    print("Test 3: No window")
-    result = detect(
-        socio_political_climate=0.80,
-        institutional_capacity=0.75,
-        statutory_ambiguity=0.82,
-        circuit_split=0.30
-    )
-    print(f"  Window Detected: {result['window_detected']}")
-    print(f"  Limiting Factor: {result['limiting_factor']}")
@@ -17,23 +17,13 @@ Output:
     window_detected, movement_potential, recommended_action, m_score, overrides_applied
 """
 
-import sys
-import os
-
-# Avoid mutating sys.path on import; only adjust for direct script execution.
-if __name__ == "__main__":
-    _repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    if _repo_root not in sys.path:
-        sys.path.insert(0, _repo_root)
-
 import numpy as np
 from mantic_thinking.core.safe_kernel import safe_mantic_kernel as mantic_kernel
-from mantic_thinking.core.mantic_kernel import compute_temporal_kernel
 from mantic_thinking.core.validators import (
-    clamp_input, require_finite_inputs, format_attribution,
-    clamp_threshold_override, validate_temporal_config,
-    clamp_f_time, build_overrides_audit, compute_layer_coupling,
-    resolve_interaction_coefficients
+    clamp_input, require_finite_inputs, layer_dict_builder, clamp_f_time,
+    build_overrides_audit, compute_layer_coupling,
+    resolve_interaction_coefficients, resolve_threshold_overrides,
+    resolve_temporal_config, build_threshold_audit
 )
 from mantic_thinking.mantic.introspection import get_layer_visibility
 
@@ -48,6 +38,14 @@ DEFAULT_THRESHOLDS = {
 
 DOMAIN = "social"
 
+# Kernel-ready weight vector in LAYER_NAMES order, built once at import.
+_W_ARR = np.asarray(WEIGHTS, dtype=np.float64)
+_W_ARR.setflags(write=False)
+# Name-keyed weights for get_layer_visibility(); read-only, shared across calls.
+_WEIGHTS_DICT = dict(zip(LAYER_NAMES, WEIGHTS))
+# {layer_name: float} builder for attribution / layer-value result dicts.
+_layer_dict = layer_dict_builder(LAYER_NAMES)
+
 
 def detect(individual_readiness, network_bridges, policy_window, paradigm_momentum,
            f_time=1.0, threshold_override=None, temporal_config=None,
@@ -64,42 +62,12 @@ def detect(individual_readiness, network_bridges, policy_window, paradigm_moment
     })
 
     # OVERRIDES PROCESSING
-    threshold_info = {}
-    active_thresholds = DEFAULT_THRESHOLDS.copy()
-    ignored_threshold_keys = []
-    
-    if threshold_override and isinstance(threshold_override, dict):
-        for key, requested in threshold_override.items():
-            if key in DEFAULT_THRESHOLDS:
-                clamped_val, was_clamped, info = clamp_threshold_override(
-                    requested, DEFAULT_THRESHOLDS[key]
-                )
-                active_thresholds[key] = clamped_val
-                threshold_info[key] = info
-            else:
-                ignored_threshold_keys.append(key)
-    
-    temporal_validated, temporal_rejected, temporal_clamped = None, {}, {}
-    temporal_applied = None
-    if temporal_config and isinstance(temporal_config, dict):
-        temporal_validated, temporal_rejected, temporal_clamped = validate_temporal_config(
-            temporal_config, domain=DOMAIN
-        )
-        if "kernel_type" not in temporal_validated:
-            if "kernel_type" not in temporal_rejected:
-                temporal_rejected["kernel_type"] = {
-                    "requested": temporal_config.get("kernel_type"),
-                    "reason": "kernel_type required and must be allowed for domain"
-                }
-        if "t" not in temporal_validated:
-            if "t" not in temporal_rejected:
-                temporal_rejected["t"] = {
-                    "requested": temporal_config.get("t"),
-                    "reason": "t required for temporal_config"
-                }
-        if "kernel_type" in temporal_validated and "t" in temporal_validated:
-            f_time = compute_temporal_kernel(**temporal_validated)
-            temporal_applied = temporal_validated
+    active_thresholds, threshold_info, ignored_threshold_keys = resolve_threshold_overrides(
+        threshold_override, DEFAULT_THRESHOLDS
+    )
+    f_time, temporal_applied, temporal_rejected, temporal_clamped = resolve_temporal_config(
+        temporal_config, f_time, domain=DOMAIN
+    )
     
     f_time_clamped, _, f_time_info = clamp_f_time(f_time)
     
@@ -123,7 +91,7 @@ def detect(individual_readiness, network_bridges, policy_window, paradigm_moment
         interaction_override_mode=interaction_override_mode,
     )
     
-    M, S, attr = mantic_kernel(WEIGHTS, L, I, f_time_clamped)
+    M, S, attr = mantic_kernel(_W_ARR, L, I, f_time_clamped)
     
     catalyst_threshold = active_thresholds['catalyst']
     transformative_threshold = active_thresholds['transformative']
@@ -142,7 +110,7 @@ def detect(individual_readiness, network_bridges, policy_window, paradigm_moment
     if catalyst > catalyst_threshold:
         window_detected = True
         
-        if transformative_potential > transformative_threshold and all(l > 0.75 for l in L):
+        if transformative_potential > transformative_threshold and L[0] > 0.75 and L[1] > 0.75 and L[2] > 0.75 and L[3] > 0.75:
             movement_potential = "TRANSFORMATIVE"
             critical_mass_risk = "Network bridges activated but window is narrow - act before policy closes"
             recommended_action = ("Mobilize immediately across all channels. Policy window + Network topology + "
@@ -165,25 +133,7 @@ def detect(individual_readiness, network_bridges, policy_window, paradigm_moment
             mobilization_urgency = "MODERATE - Build capacity"
     
     # Build audit
-    threshold_clamped_any = any(
-        info.get("was_clamped", False) 
-        for info in threshold_info.values()
-    ) if threshold_info else False
-    
-    threshold_audit_info = None
-    if threshold_info:
-        threshold_audit_info = {
-            "overrides": {
-                key: {
-                    "requested": info.get("requested"),
-                    "used": info.get("used"),
-                    "was_clamped": info.get("was_clamped", False)
-                }
-                for key, info in threshold_info.items()
-            },
-            "was_clamped": threshold_clamped_any,
-            "ignored_keys": ignored_threshold_keys if ignored_threshold_keys else None
-        }
+    threshold_audit_info = build_threshold_audit(threshold_info, ignored_threshold_keys)
     
     overrides_applied = build_overrides_audit(
         threshold_overrides=threshold_override if threshold_override else None,
@@ -195,13 +145,11 @@ def detect(individual_readiness, network_bridges, policy_window, paradigm_moment
         f_time_info=f_time_info,
         interaction=interaction_audit
     )
-    
-    _weights_dict = dict(zip(LAYER_NAMES, WEIGHTS))
     _layer_values_dict = dict(zip(LAYER_NAMES, L))
     _layer_interactions = dict(zip(LAYER_NAMES, I))
     layer_visibility = get_layer_visibility(
         "social_catalytic_alignment",
-        _weights_dict,
+        _WEIGHTS_DICT,
         _layer_values_dict,
         _layer_interactions
     )
@@ -219,7 +167,7 @@ def detect(individual_readiness, network_bridges, policy_window, paradigm_moment
             "mobilization_urgency": mobilization_urgency,
             "m_score": float(M),
             "spatial_component": float(S),
-            "layer_attribution": format_attribution(attr, LAYER_NAMES),
+            "layer_attribution": _layer_dict(attr),
             "thresholds": active_thresholds,
             "overrides_applied": overrides_applied,
             "alignment_status": {
@@ -241,7 +189,7 @@ def detect(individual_readiness, network_bridges, policy_window, paradigm_moment
         "limiting_factors": below_threshold,
         "m_score": float(M),
         "spatial_component": float(S),
-        "layer_attribution": format_attribution(attr, LAYER_NAMES),
+        "layer_attribution": _layer_dict(attr),
         "status": f"Catalytic alignment not achieved. {', '.join(below_threshold)} below threshold.",
         "recommendation": "Continue base-building. Focus on strengthening network bridges and individual readiness.",
         "thresholds": active_thresholds,
@@ -249,37 +197,3 @@ def detect(individual_readiness, network_bridges, policy_window, paradigm_moment
         "layer_visibility": layer_visibility,
         "layer_coupling": layer_coupling
     }
-
-
-if __name__ == "__main__":
-    print("=== Social Catalytic Alignment Detector ===\n")
-    
-    print("Test 1: Transformative potential")
-    result = detect(
-        individual_readiness=0.82,
-        network_bridges=0.85,
-        policy_window=0.80,
-        paradigm_momentum=0.88
-    )
-    print(f"  Window Detected: {result['window_detected']}")
-    print(f"  Movement Potential: {result['movement_potential']}\n")
-    
-    print("Test 2: High potential")
-    result = detect(
-        individual_readiness=0.75,
-        network_bridges=0.78,
-        policy_window=0.72,
-        paradigm_momentum=0.70
-    )
-    print(f"  Window Detected: {result['window_detected']}")
-    print(f"  Movement Potential: {result['movement_potential']}\n")
-    
-    print("Test 3: No window")
-    result = detect(
-        individual_readiness=0.80,
-        network_bridges=0.75,
-        policy_window=0.40,
-        paradigm_momentum=0.70
-    )
-    print(f"  Window Detected: {result['window_detected']}")
-    print(f"  Limiting Factors: {result['limiting_factors']}")
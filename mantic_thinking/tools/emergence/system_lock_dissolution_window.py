@@ -19,28 +19,13 @@ Output:
     window_detected, window_type, catalyst_score, m_score, overrides_applied
 """
 
-import sys
-import os
-
-# Avoid mutating sys.path on import; only adjust for direct script execution.
-if __name__ == "__main__":
-    _repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    if _repo_root not in sys.path:
-        sys.path.insert(0, _repo_root)
-
 import numpy as np
 from mantic_thinking.core.safe_kernel import safe_mantic_kernel as mantic_kernel
-from mantic_thinking.core.mantic_kernel import compute_temporal_kernel
 from mantic_thinking.core.validators import (
-    clamp_input,
-    require_finite_inputs,
-    format_attribution,
-    clamp_threshold_override,
-    validate_temporal_config,
-    clamp_f_time,
-    build_overrides_audit,
-    compute_layer_coupling,
-    resolve_interaction_coefficients,
+    clamp_input, require_finite_inputs, layer_dict_builder, clamp_f_time,
+    build_overrides_audit, compute_layer_coupling,
+    resolve_interaction_coefficients, resolve_threshold_overrides,
+    resolve_temporal_config, build_threshold_audit
 )
 from mantic_thinking.mantic.introspection import get_layer_visibility
 
@@ -53,6 +38,14 @@ LAYER_NAMES = [
     "pattern_flexibility",
 ]
 
+# Kernel-ready weight vector, built once at import.
+_W_ARR = np.asarray(WEIGHTS, dtype=np.float64)
+_W_ARR.setflags(write=False)
+# Name-keyed weights for get_layer_visibility(); read-only, shared across calls.
+_WEIGHTS_DICT = dict(zip(LAYER_NAMES, WEIGHTS))
+# {layer_name: float} builder for attribution / layer-value result dicts.
+_layer_dict = layer_dict_builder(LAYER_NAMES)
+
 DEFAULT_THRESHOLDS = {
     "dissolution_forming": 0.50,
     "dissolution_window": 0.70,
@@ -94,43 +87,13 @@ def detect(
     )
 
     # OVERRIDES PROCESSING
-    threshold_info = {}
-    active_thresholds = DEFAULT_THRESHOLDS.copy()
-    ignored_threshold_keys = []
-
-    if threshold_override and isinstance(threshold_override, dict):
-        for key, requested in threshold_override.items():
-            if key in DEFAULT_THRESHOLDS:
-                clamped_val, _, info = clamp_threshold_override(
-                    requested, DEFAULT_THRESHOLDS[key]
-                )
-                active_thresholds[key] = clamped_val
-                threshold_info[key] = info
-            else:
-                ignored_threshold_keys.append(key)
-
-    temporal_validated, temporal_rejected, temporal_clamped = None, {}, {}
-    temporal_applied = None
-    if temporal_config and isinstance(temporal_config, dict):
-        temporal_validated, temporal_rejected, temporal_clamped = validate_temporal_config(
-            temporal_config, domain=DOMAIN
-        )
-        if "kernel_type" not in temporal_validated:
-            if "kernel_type" not in temporal_rejected:
-                temporal_rejected["kernel_type"] = {
-                    "requested": temporal_config.get("kernel_type"),
-                    "reason": "kernel_type required and must be allowed for domain",
-                }
-        if "t" not in temporal_validated:
-            if "t" not in temporal_rejected:
-                temporal_rejected["t"] = {
-                    "requested": temporal_config.get("t"),
-                    "reason": "t required for temporal_config",
-                }
-        if "kernel_type" in temporal_validated and "t" in temporal_validated:
-            f_time = compute_temporal_kernel(**temporal_validated)
-            temporal_applied = temporal_validated
-
+    active_thresholds, threshold_info, ignored_threshold_keys = resolve_threshold_overrides(
+        threshold_override, DEFAULT_THRESHOLDS
+    )
+    f_time, temporal_applied, temporal_rejected, temporal_clamped = resolve_temporal_config(
+        temporal_config, f_time, domain=DOMAIN
+    )
+    
     f_time_clamped, _, f_time_info = clamp_f_time(f_time)
 
     # CORE DETECTION
@@ -155,7 +118,7 @@ def detect(
         interaction_override_mode=interaction_override_mode,
     )
 
-    M, S, attr = mantic_kernel(WEIGHTS, L, I, f_time_clamped)
+    M, S, attr = mantic_kernel(_W_ARR, L, I, f_time_clamped)
 
     dissolution_forming = active_thresholds["dissolution_forming"]
     dissolution_window = active_thresholds["dissolution_window"]
@@ -188,25 +151,8 @@ def detect(
             )
 
     # Build audit
-    threshold_clamped_any = any(
-        info.get("was_clamped", False) for info in threshold_info.values()
-    ) if threshold_info else False
-
-    threshold_audit_info = None
-    if threshold_info:
-        threshold_audit_info = {
-            "overrides": {
-                key: {
-                    "requested": info.get("requested"),
-                    "used": info.get("used"),
-                    "was_clamped": info.get("was_clamped", False),
-                }
-                for key, info in threshold_info.items()
-            },
-            "was_clamped": threshold_clamped_any,
-            "ignored_keys": ignored_threshold_keys if ignored_threshold_keys else None,
-        }
-
+    threshold_audit_info = build_threshold_audit(threshold_info, ignored_threshold_keys)
+    
     overrides_applied = build_overrides_audit(
         threshold_overrides=threshold_override if threshold_override else None,
         temporal_config=temporal_config if temporal_config else None,
@@ -217,13 +163,11 @@ def detect(
         f_time_info=f_time_info,
         interaction=interaction_audit,
     )
-
-    _weights_dict = dict(zip(LAYER_NAMES, WEIGHTS))
     _layer_values_dict = dict(zip(LAYER_NAMES, L))
     _layer_interactions = dict(zip(LAYER_NAMES, I))
     layer_visibility = get_layer_visibility(
         "system_lock_dissolution_window",
-        _weights_dict,
+        _WEIGHTS_DICT,
         _layer_values_dict,
         _layer_interactions,
     )
@@ -238,7 +182,7 @@ def detect(
             "catalyst_score": float(catalyst),
             "m_score": float(M),
             "spatial_component": float(S),
-            "layer_attribution": format_attribution(attr, LAYER_NAMES),
+            "layer_attribution": _layer_dict(attr),
             "thresholds": active_thresholds,
             "overrides_applied": overrides_applied,
             "layer_visibility": layer_visibility,
@@ -255,7 +199,7 @@ def detect(
         "limiting_factors": below_threshold,
         "m_score": float(M),
         "spatial_component": float(S),
-        "layer_attribution": format_attribution(attr, LAYER_NAMES),
+        "layer_attribution": _layer_dict(attr),
         "status": "Dissolution window not yet formed.",
         "recommendation": "Increase autonomy momentum, alternative readiness, and control vulnerability alignment.",
         "thresholds": active_thresholds,
@@ -263,15 +207,3 @@ def detect(
         "layer_visibility": layer_visibility,
         "layer_coupling": layer_coupling,
     }
-
-
-if __name__ == "__main__":
-    print("=== System Lock Dissolution Window Detector ===\\n")
-    result = detect(
-        autonomy_momentum=0.6,
-        alternative_readiness=0.7,
-        control_vulnerability=0.65,
-        pattern_flexibility=0.6,
-    )
-    print(f"Window detected: {result['window_detected']}")
-    print(f"M-score: {result['m_score']:.3f}")
@@ -7,6 +7,8 @@ when layers diverge or contradict each other.
 Logic Pattern: if abs(L1 - L2) > 0.5: alert()
 """
 
+import importlib
+
 __all__ = [
     "healthcare_phenotype_genotype",
     "finance_regime_conflict",
@@ -17,3 +19,16 @@ __all__ = [
     "social_narrative_rupture",
     "system_lock_recursive_control",
 ]
+
+_TOOL_NAMES = frozenset(__all__)
+
+
+def __getattr__(name):
+    """Import a tool submodule on first attribute access."""
+    if name in _TOOL_NAMES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _TOOL_NAMES)
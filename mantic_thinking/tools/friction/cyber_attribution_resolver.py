@@ -38,12 +38,11 @@ if __name__ == "__main__":
 
 import numpy as np
 from mantic_thinking.core.safe_kernel import safe_mantic_kernel as mantic_kernel
-from mantic_thinking.core.mantic_kernel import compute_temporal_kernel
 from mantic_thinking.core.validators import (
-    clamp_input, require_finite_inputs, format_attribution,
-    clamp_threshold_override, validate_temporal_config,
+    clamp_input, require_finite_inputs, layer_dict_builder,
     clamp_f_time, build_overrides_audit, compute_layer_coupling,
-    resolve_interaction_coefficients
+    resolve_interaction_coefficients, resolve_threshold_overrides,
+    resolve_temporal_config, build_threshold_audit
 )
 from mantic_thinking.mantic.introspection import get_layer_visibility
 
@@ -66,6 +65,12 @@ DEFAULT_THRESHOLDS = {
 
 DOMAIN = "cyber"
 
+# Kernel-ready weight vector in LAYER_NAMES order, built once at import.
+_W_ARR = np.asarray(list(WEIGHTS.values()), dtype=np.float64)
+_W_ARR.setflags(write=False)
+# {layer_name: float} builder for attribution / layer-value result dicts.
+_layer_dict = layer_dict_builder(LAYER_NAMES)
+
 
 def detect(technical, threat_intel, operational_impact, geopolitical, f_time=1.0,
            threshold_override=None, temporal_config=None,
@@ -98,44 +103,13 @@ def detect(technical, threat_intel, operational_impact, geopolitical, f_time=1.0
     # OVERRIDES PROCESSING
     # =======================================================================
     
-    threshold_info = {}
-    active_thresholds = DEFAULT_THRESHOLDS.copy()
-    ignored_threshold_keys = []
-    
-    if threshold_override and isinstance(threshold_override, dict):
-        for key, requested in threshold_override.items():
-            if key in DEFAULT_THRESHOLDS:
-                clamped_val, was_clamped, info = clamp_threshold_override(
-                    requested, DEFAULT_THRESHOLDS[key]
-                )
-                active_thresholds[key] = clamped_val
-                threshold_info[key] = info
-            else:
-                ignored_threshold_keys.append(key)
+    active_thresholds, threshold_info, ignored_threshold_keys = resolve_threshold_overrides(
+        threshold_override, DEFAULT_THRESHOLDS
+    )
     
-    temporal_validated, temporal_rejected, temporal_clamped = None, {}, {}
-    temporal_applied = None
-    if temporal_config and isinstance(temporal_config, dict):
-        temporal_validated, temporal_rejected, temporal_clamped = validate_temporal_config(
-            temporal_config, domain=DOMAIN
-        )
-        
-        if "kernel_type" not in temporal_validated:
-            if "kernel_type" not in temporal_rejected:
-                temporal_rejected["kernel_type"] = {
-                    "requested": temporal_config.get("kernel_type"),
-                    "reason": "kernel_type required and must be allowed for domain"
-                }
-        if "t" not in temporal_validated:
-            if "t" not in temporal_rejected:
-                temporal_rejected["t"] = {
-                    "requested": temporal_config.get("t"),
-                    "reason": "t required for temporal_config"
-                }
-        
-        if "kernel_type" in temporal_validated and "t" in temporal_validated:
-            f_time = compute_temporal_kernel(**temporal_validated)
-            temporal_applied = temporal_validated
+    f_time, temporal_applied, temporal_rejected, temporal_clamped = resolve_temporal_config(
+        temporal_config, f_time, domain=DOMAIN
+    )
     
     f_time_clamped, _, f_time_info = clamp_f_time(f_time)
     
@@ -150,7 +124,6 @@ def detect(technical, threat_intel, operational_impact, geopolitical, f_time=1.0
         clamp_input(geopolitical, name="geopolitical")
     ]
     
-    W = list(WEIGHTS.values())
     # Interaction coefficients: base, optional tool-dynamic, optional caller override.
     I_base = [1.0, 1.0, 1.0, 1.0]
     I_dynamic = I_base
@@ -163,7 +136,7 @@ def detect(technical, threat_intel, operational_impact, geopolitical, f_time=1.0
         interaction_override_mode=interaction_override_mode,
     )
     
-    M, S, attr = mantic_kernel(W, L, I, f_time_clamped)
+    M, S, attr = mantic_kernel(_W_ARR, L, I, f_time_clamped)
     
     alert = None
     confidence = "high"
@@ -205,25 +178,7 @@ def detect(technical, threat_intel, operational_impact, geopolitical, f_time=1.0
     else:
         mismatch_explanation = "Attribution factors align reasonably well."
     
-    threshold_clamped_any = any(
-        info.get("was_clamped", False) 
-        for info in threshold_info.values()
-    ) if threshold_info else False
-    
-    threshold_audit_info = None
-    if threshold_info:
-        threshold_audit_info = {
-            "overrides": {
-                key: {
-                    "requested": info.get("requested"),
-                    "used": info.get("used"),
-                    "was_clamped": info.get("was_clamped", False)
-                }
-                for key, info in threshold_info.items()
-            },
-            "was_clamped": threshold_clamped_any,
-            "ignored_keys": ignored_threshold_keys if ignored_threshold_keys else None
-        }
+    threshold_audit_info = build_threshold_audit(threshold_info, ignored_threshold_keys)
     
     overrides_applied = build_overrides_audit(
         threshold_overrides=threshold_override if threshold_override else None,
@@ -252,7 +207,7 @@ def detect(technical, threat_intel, operational_impact, geopolitical, f_time=1.0
         "mismatch_explanation": mismatch_explanation,
         "m_score": float(M),
         "spatial_component": float(S),
-        "layer_attribution": format_attribution(attr, LAYER_NAMES),
+        "layer_attribution": _layer_dict(attr),
         "tech_intel_gap": float(tech_intel_gap),
         "threshold": active_thresholds["attribution_gap"],
         "thresholds": active_thresholds,
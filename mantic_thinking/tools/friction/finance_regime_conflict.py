@@ -38,12 +38,11 @@ if __name__ == "__main__":
 
 import numpy as np
 from mantic_thinking.core.safe_kernel import safe_mantic_kernel as mantic_kernel
-from mantic_thinking.core.mantic_kernel import compute_temporal_kernel
 from mantic_thinking.core.validators import (
-    clamp_input, require_finite_inputs, format_attribution,
-    clamp_threshold_override, validate_temporal_config,
+    clamp_input, require_finite_inputs, layer_dict_builder,
     clamp_f_time, build_overrides_audit, compute_layer_coupling,
-    resolve_interaction_coefficients
+    resolve_interaction_coefficients, resolve_threshold_overrides,
+    resolve_temporal_config, build_threshold_audit
 )
 from mantic_thinking.mantic.introspection import get_layer_visibility
 
@@ -65,6 +64,12 @@ DEFAULT_THRESHOLDS = {
 
 DOMAIN = "finance"
 
+# Kernel-ready weight vector in LAYER_NAMES order, built once at import.
+_W_ARR = np.asarray(list(WEIGHTS.values()), dtype=np.float64)
+_W_ARR.setflags(write=False)
+# {layer_name: float} builder for attribution / layer-value result dicts.
+_layer_dict = layer_dict_builder(LAYER_NAMES)
+
 
 def detect(technical, macro, flow, risk, f_time=1.0,
            threshold_override=None, temporal_config=None,
@@ -99,47 +104,14 @@ def detect(technical, macro, flow, risk, f_time=1.0,
     # =======================================================================
     
     # Process threshold overrides (clamped to ±20% of defaults, within [0.05, 0.95])
-    threshold_info = {}
-    active_thresholds = DEFAULT_THRESHOLDS.copy()
-    ignored_threshold_keys = []
-    
-    if threshold_override and isinstance(threshold_override, dict):
-        for key, requested in threshold_override.items():
-            if key in DEFAULT_THRESHOLDS:
-                clamped_val, was_clamped, info = clamp_threshold_override(
-                    requested, DEFAULT_THRESHOLDS[key]
-                )
-                active_thresholds[key] = clamped_val
-                threshold_info[key] = info
-            else:
-                ignored_threshold_keys.append(key)
+    active_thresholds, threshold_info, ignored_threshold_keys = resolve_threshold_overrides(
+        threshold_override, DEFAULT_THRESHOLDS
+    )
     
     # Process temporal config (domain-restricted kernel types, clamped params)
-    temporal_validated, temporal_rejected, temporal_clamped = None, {}, {}
-    temporal_applied = None
-    if temporal_config and isinstance(temporal_config, dict):
-        temporal_validated, temporal_rejected, temporal_clamped = validate_temporal_config(
-            temporal_config, domain=DOMAIN
-        )
-        
-        # Require kernel_type + t to apply temporal_config
-        if "kernel_type" not in temporal_validated:
-            if "kernel_type" not in temporal_rejected:
-                temporal_rejected["kernel_type"] = {
-                    "requested": temporal_config.get("kernel_type"),
-                    "reason": "kernel_type required and must be allowed for domain"
-                }
-        if "t" not in temporal_validated:
-            if "t" not in temporal_rejected:
-                temporal_rejected["t"] = {
-                    "requested": temporal_config.get("t"),
-                    "reason": "t required for temporal_config"
-                }
-        
-        # Compute f_time only when required fields are valid
-        if "kernel_type" in temporal_validated and "t" in temporal_validated:
-            f_time = compute_temporal_kernel(**temporal_validated)
-            temporal_applied = temporal_validated
+    f_time, temporal_applied, temporal_rejected, temporal_clamped = resolve_temporal_config(
+        temporal_config, f_time, domain=DOMAIN
+    )
     
     # Clamp f_time to prevent runaway growth ([0.1, 3.0])
     f_time_clamped, f_time_was_clamped, f_time_info = clamp_f_time(f_time)
@@ -164,7 +136,6 @@ def detect(technical, macro, flow, risk, f_time=1.0,
         L[3]
     ]
     
-    W = list(WEIGHTS.values())
     # Interaction coefficients: base, optional tool-dynamic, optional caller override.
     I_base = [1.0, 1.0, 1.0, 1.0]
     I_dynamic = I_base
@@ -178,7 +149,7 @@ def detect(technical, macro, flow, risk, f_time=1.0,
     )
     
     # Calculate Mantic score (IMMUTABLE FORMULA)
-    M, S, attr = mantic_kernel(W, L_normalized, I, f_time_clamped)
+    M, S, attr = mantic_kernel(_W_ARR, L_normalized, I, f_time_clamped)
     
     # Detection logic
     alert = None
@@ -221,26 +192,7 @@ def detect(technical, macro, flow, risk, f_time=1.0,
             alert = "RISK MISMATCH: Risk-off environment with bullish technicals - contrarian trap"
     
     # Build audit block - collect threshold clamp info
-    threshold_clamped_any = any(
-        info.get("was_clamped", False) 
-        for info in threshold_info.values()
-    ) if threshold_info else False
-    
-    # Convert threshold info to audit format
-    threshold_audit_info = None
-    if threshold_info:
-        threshold_audit_info = {
-            "overrides": {
-                key: {
-                    "requested": info.get("requested"),
-                    "used": info.get("used"),
-                    "was_clamped": info.get("was_clamped", False)
-                }
-                for key, info in threshold_info.items()
-            },
-            "was_clamped": threshold_clamped_any,
-            "ignored_keys": ignored_threshold_keys if ignored_threshold_keys else None
-        }
+    threshold_audit_info = build_threshold_audit(threshold_info, ignored_threshold_keys)
     
     overrides_applied = build_overrides_audit(
         threshold_overrides=threshold_override if threshold_override else None,
@@ -269,7 +221,7 @@ def detect(technical, macro, flow, risk, f_time=1.0,
         "confidence": float(confidence),
         "m_score": float(M),
         "spatial_component": float(S),
-        "layer_attribution": format_attribution(attr, LAYER_NAMES),
+        "layer_attribution": _layer_dict(attr),
         "flow_raw": float(L[2]),
         "threshold": threshold,
         "thresholds": active_thresholds,
@@ -39,12 +39,11 @@ if __name__ == "__main__":
 
 import numpy as np
 from mantic_thinking.core.safe_kernel import safe_mantic_kernel as mantic_kernel
-from mantic_thinking.core.mantic_kernel import compute_temporal_kernel
 from mantic_thinking.core.validators import (
-    clamp_input, require_finite_inputs, format_attribution,
-    clamp_threshold_override, validate_temporal_config,
+    clamp_input, require_finite_inputs, layer_dict_builder,
     clamp_f_time, build_overrides_audit, compute_layer_coupling,
-    resolve_interaction_coefficients
+    resolve_interaction_coefficients, resolve_threshold_overrides,
+    resolve_temporal_config
 )
 from mantic_thinking.mantic.introspection import get_layer_visibility
 
@@ -66,6 +65,12 @@ DEFAULT_THRESHOLDS = {
 
 DOMAIN = "healthcare"
 
+# Kernel-ready weight vector in LAYER_NAMES order, built once at import.
+_W_ARR = np.asarray(list(WEIGHTS.values()), dtype=np.float64)
+_W_ARR.setflags(write=False)
+# {layer_name: float} builder for attribution / layer-value result dicts.
+_layer_dict = layer_dict_builder(LAYER_NAMES)
+
 
 def detect(phenotypic, genomic, environmental, psychosocial, f_time=1.0,
            threshold_override=None, temporal_config=None,
@@ -117,47 +122,14 @@ def detect(phenotypic, genomic, environmental, psychosocial, f_time=1.0,
     # =======================================================================
     
     # Process threshold overrides (clamped to ±20% of defaults, within [0.05, 0.95])
-    threshold_info = {}
-    active_thresholds = DEFAULT_THRESHOLDS.copy()
-    ignored_threshold_keys = []
-    
-    if threshold_override and isinstance(threshold_override, dict):
-        for key, requested in threshold_override.items():
-            if key in DEFAULT_THRESHOLDS:
-                clamped_val, was_clamped, info = clamp_threshold_override(
-                    requested, DEFAULT_THRESHOLDS[key]
-                )
-                active_thresholds[key] = clamped_val
-                threshold_info[key] = info
-            else:
-                ignored_threshold_keys.append(key)
+    active_thresholds, threshold_info, ignored_threshold_keys = resolve_threshold_overrides(
+        threshold_override, DEFAULT_THRESHOLDS
+    )
     
     # Process temporal config (domain-restricted kernel types, clamped params)
-    temporal_validated, temporal_rejected, temporal_clamped = None, {}, {}
-    temporal_applied = None
-    if temporal_config and isinstance(temporal_config, dict):
-        temporal_validated, temporal_rejected, temporal_clamped = validate_temporal_config(
-            temporal_config, domain=DOMAIN
-        )
-
-        # Require kernel_type + t to apply temporal_config
-        if "kernel_type" not in temporal_validated:
-            if "kernel_type" not in temporal_rejected:
-                temporal_rejected["kernel_type"] = {
-                    "requested": temporal_config.get("kernel_type"),
-                    "reason": "kernel_type required and must be allowed for domain"
-                }
-        if "t" not in temporal_validated:
-            if "t" not in temporal_rejected:
-                temporal_rejected["t"] = {
-                    "requested": temporal_config.get("t"),
-                    "reason": "t required for temporal_config"
-                }
-
-        # Compute f_time only when required fields are valid
-        if "kernel_type" in temporal_validated and "t" in temporal_validated:
-            f_time = compute_temporal_kernel(**temporal_validated)
-            temporal_applied = temporal_validated
+    f_time, temporal_applied, temporal_rejected, temporal_clamped = resolve_temporal_config(
+        temporal_config, f_time, domain=DOMAIN
+    )
     
     # Clamp f_time to prevent runaway growth ([0.1, 3.0])
     f_time_clamped, f_time_was_clamped, f_time_info = clamp_f_time(f_time)
@@ -174,7 +146,6 @@ def detect(phenotypic, genomic, environmental, psychosocial, f_time=1.0,
         clamp_input(psychosocial, name="psychosocial")
     ]
     
-    W = list(WEIGHTS.values())
     # Interaction coefficients: base, optional tool-dynamic, optional caller override.
     I_base = [1.0, 1.0, 1.0, 1.0]
     I_dynamic = I_base
@@ -188,7 +159,7 @@ def detect(phenotypic, genomic, environmental, psychosocial, f_time=1.0,
     )
     
     # Calculate Mantic score (IMMUTABLE FORMULA)
-    M, S, attr = mantic_kernel(W, L, I, f_time_clamped)
+    M, S, attr = mantic_kernel(_W_ARR, L, I, f_time_clamped)
     
     # Detection logic: Compare expected vs actual phenotype
     # Expected phenotype = weighted combination of genomic + environmental
@@ -276,7 +247,7 @@ def detect(phenotypic, genomic, environmental, psychosocial, f_time=1.0,
         "buffering_layer": buffering_layer,
         "m_score": float(M),
         "spatial_component": float(S),
-        "layer_attribution": format_attribution(attr, LAYER_NAMES),
+        "layer_attribution": _layer_dict(attr),
         "threshold": threshold,
         "thresholds": active_thresholds,
         "overrides_applied": overrides_applied,
@@ -28,19 +28,21 @@ if __name__ == "__main__":
     if _repo_root not in sys.path:
         sys.path.insert(0, _repo_root)
 
+from functools import lru_cache
+
 import numpy as np
 from mantic_thinking.core.safe_kernel import safe_mantic_kernel as mantic_kernel
-from mantic_thinking.core.mantic_kernel import compute_temporal_kernel
 from mantic_thinking.core.validators import (
     clamp_input,
     require_finite_inputs,
-    format_attribution,
-    clamp_threshold_override,
-    validate_temporal_config,
+    layer_dict_builder,
+    resolve_threshold_overrides,
     clamp_f_time,
     build_overrides_audit,
     compute_layer_coupling,
     resolve_interaction_coefficients,
+    resolve_temporal_config,
+    build_threshold_audit,
 )
 from mantic_thinking.mantic.introspection import get_layer_visibility
 
@@ -59,6 +61,12 @@ LAYER_NAMES = [
     "recursive_depth",
 ]
 
+# Kernel-ready weight vector in LAYER_NAMES order, built once at import.
+_W_ARR = np.asarray(list(WEIGHTS.values()), dtype=np.float64)
+_W_ARR.setflags(write=False)
+# {layer_name: float} builder for attribution / layer-value result dicts.
+_layer_dict = layer_dict_builder(LAYER_NAMES)
+
 DEFAULT_THRESHOLDS = {
     "asymmetry_warning": 0.40,
     "lock_active": 0.52,
@@ -68,6 +76,21 @@ DEFAULT_THRESHOLDS = {
 DOMAIN = "system_lock"
 
 
+@lru_cache(maxsize=256)
+def _score_core(L, I, f_time):
+    """
+    Kernel scores for a clamped layer/interaction profile.
+
+    Pure function of its (hashable) inputs, so repeated profiles -- e.g. the
+    same layers evaluated under several temporal configs -- skip the kernel.
+
+    Returns:
+        tuple: (M, S, attribution) with attribution as a tuple
+    """
+    M, S, attr = mantic_kernel(_W_ARR, L, I, f_time)
+    return M, S, tuple(attr)
+
+
 def _severity_band(score):
     if score < 0.25:
         return "low"
@@ -103,54 +126,23 @@ def detect(
     )
 
     # OVERRIDES PROCESSING
-    threshold_info = {}
-    active_thresholds = DEFAULT_THRESHOLDS.copy()
-    ignored_threshold_keys = []
-
-    if threshold_override and isinstance(threshold_override, dict):
-        for key, requested in threshold_override.items():
-            if key in DEFAULT_THRESHOLDS:
-                clamped_val, _, info = clamp_threshold_override(
-                    requested, DEFAULT_THRESHOLDS[key]
-                )
-                active_thresholds[key] = clamped_val
-                threshold_info[key] = info
-            else:
-                ignored_threshold_keys.append(key)
-
-    temporal_validated, temporal_rejected, temporal_clamped = None, {}, {}
-    temporal_applied = None
-    if temporal_config and isinstance(temporal_config, dict):
-        temporal_validated, temporal_rejected, temporal_clamped = validate_temporal_config(
-            temporal_config, domain=DOMAIN
-        )
-        if "kernel_type" not in temporal_validated:
-            if "kernel_type" not in temporal_rejected:
-                temporal_rejected["kernel_type"] = {
-                    "requested": temporal_config.get("kernel_type"),
-                    "reason": "kernel_type required and must be allowed for domain",
-                }
-        if "t" not in temporal_validated:
-            if "t" not in temporal_rejected:
-                temporal_rejected["t"] = {
-                    "requested": temporal_config.get("t"),
-                    "reason": "t required for temporal_config",
-                }
-        if "kernel_type" in temporal_validated and "t" in temporal_validated:
-            f_time = compute_temporal_kernel(**temporal_validated)
-            temporal_applied = temporal_validated
+    active_thresholds, threshold_info, ignored_threshold_keys = resolve_threshold_overrides(
+        threshold_override, DEFAULT_THRESHOLDS
+    )
+
+    f_time, temporal_applied, temporal_rejected, temporal_clamped = resolve_temporal_config(
+        temporal_config, f_time, domain=DOMAIN
+    )
 
     f_time_clamped, _, f_time_info = clamp_f_time(f_time)
 
     # CORE DETECTION
-    L = [
+    L = (
         clamp_input(agent_autonomy, name="agent_autonomy"),
         clamp_input(collective_capacity, name="collective_capacity"),
         clamp_input(concentration_control, name="concentration_control"),
         clamp_input(recursive_depth, name="recursive_depth"),
-    ]
-
-    W = list(WEIGHTS.values())
+    )
 
     # Dynamic lock amplification: when concentration exceeds autonomy,
     # recursive reinforcement gets stronger.
@@ -167,7 +159,7 @@ def detect(
         interaction_override_mode=interaction_override_mode,
     )
 
-    M, S, attr = mantic_kernel(W, L, I, f_time_clamped)
+    M, S, attr = _score_core(L, tuple(I), f_time_clamped)
 
     asymmetry_ratio = L[2] / max(L[0], 0.01)
     lock_signal = ((L[2] + L[3]) / 2.0) - ((L[0] + L[1]) / 2.0)
@@ -224,24 +216,7 @@ def detect(
         )
 
     # Build audit
-    threshold_clamped_any = any(
-        info.get("was_clamped", False) for info in threshold_info.values()
-    ) if threshold_info else False
-
-    threshold_audit_info = None
-    if threshold_info:
-        threshold_audit_info = {
-            "overrides": {
-                key: {
-                    "requested": info.get("requested"),
-                    "used": info.get("used"),
-                    "was_clamped": info.get("was_clamped", False),
-                }
-                for key, info in threshold_info.items()
-            },
-            "was_clamped": threshold_clamped_any,
-            "ignored_keys": ignored_threshold_keys if ignored_threshold_keys else None,
-        }
+    threshold_audit_info = build_threshold_audit(threshold_info, ignored_threshold_keys)
 
     overrides_applied = build_overrides_audit(
         threshold_overrides=threshold_override if threshold_override else None,
@@ -283,7 +258,7 @@ def detect(
         "recommended_adjustment": recommended_adjustment,
         "m_score": float(M),
         "spatial_component": float(S),
-        "layer_attribution": format_attribution(attr, LAYER_NAMES),
+        "layer_attribution": _layer_dict(attr),
         "thresholds": active_thresholds,
         "overrides_applied": overrides_applied,
         "layer_visibility": layer_visibility,
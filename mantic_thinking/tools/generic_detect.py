@@ -40,12 +40,11 @@ if __name__ == "__main__":
 
 import numpy as np
 from mantic_thinking.core.safe_kernel import safe_mantic_kernel as mantic_kernel
-from mantic_thinking.core.mantic_kernel import compute_temporal_kernel
 from mantic_thinking.core.validators import (
     clamp_input, require_finite_inputs, format_attribution,
     clamp_threshold_override, validate_temporal_config,
     clamp_f_time, build_overrides_audit, compute_layer_coupling,
-    resolve_interaction_coefficients
+    resolve_interaction_coefficients, temporal_kernel_for
 )
 
 # Existing hardcoded domains — generic tool cannot shadow these
@@ -60,6 +59,12 @@ _MAX_LAYERS = 6
 # Generic domain uses full kernel allowlist (all types permitted)
 _GENERIC_DOMAIN_KEY = "generic"
 
+# temporal_config keys that must validate before f_time is taken from it
+_REQUIRED_TEMPORAL_KEYS = (
+    ("kernel_type", "kernel_type required and must be a valid kernel type"),
+    ("t", "t required for temporal_config"),
+)
+
 
 def _validate_registration(domain_name, layer_names, weights, layer_values, mode):
     """
@@ -186,20 +191,14 @@ def detect(domain_name, layer_names, weights, layer_values, mode="friction",
         temporal_validated, temporal_rejected, temporal_clamped = validate_temporal_config(
             temporal_config, domain=_GENERIC_DOMAIN_KEY  # "generic" — allowlist includes all 7 kernel types
         )
-        if "kernel_type" not in temporal_validated:
-            if "kernel_type" not in temporal_rejected:
-                temporal_rejected["kernel_type"] = {
-                    "requested": temporal_config.get("kernel_type"),
-                    "reason": "kernel_type required and must be a valid kernel type"
-                }
-        if "t" not in temporal_validated:
-            if "t" not in temporal_rejected:
-                temporal_rejected["t"] = {
-                    "requested": temporal_config.get("t"),
-                    "reason": "t required for temporal_config"
-                }
-        if "kernel_type" in temporal_validated and "t" in temporal_validated:
-            f_time = compute_temporal_kernel(**temporal_validated)
+        missing = False
+        for key, reason in _REQUIRED_TEMPORAL_KEYS:
+            if key not in temporal_validated:
+                missing = True
+                if key not in temporal_rejected:
+                    temporal_rejected[key] = {"requested": temporal_config.get(key), "reason": reason}
+        if not missing:
+            f_time = temporal_kernel_for(temporal_validated)
             temporal_applied = temporal_validated
 
     f_time_clamped, _, f_time_info = clamp_f_time(f_time)
@@ -252,15 +251,20 @@ def detect(domain_name, layer_names, weights, layer_values, mode="friction",
     if mode == "friction":
         # Friction: detect cross-layer divergence via range (max - min)
         valid_L = [v for v in L if not np.isnan(v)]
-        range_val = float(max(valid_L) - min(valid_L)) if len(valid_L) >= 2 else 0.0
+        if len(valid_L) >= 2:
+            hi, lo = max(valid_L), min(valid_L)
+            range_val = float(hi - lo)
+        else:
+            range_val = 0.0
         has_mismatch = range_val > detection_thresh
 
         alert = None
         severity = 0.0
         if has_mismatch:
             severity = min(range_val, 1.0)
-            max_idx = int(np.argmax(L))
-            min_idx = int(np.argmin(L))
+            # First occurrence, as np.argmax/np.argmin, without array coercion
+            max_idx = L.index(hi)
+            min_idx = L.index(lo)
             alert = (
                 f"DIVERGENCE: {layer_names[max_idx]} ({L[max_idx]:.2f}) vs "
                 f"{layer_names[min_idx]} ({L[min_idx]:.2f}) — "
@@ -292,7 +296,7 @@ def detect(domain_name, layer_names, weights, layer_values, mode="friction",
                 confidence = 0.75
                 recommended_action = "Good alignment — proceed with awareness"
 
-            weakest_idx = int(np.argmin(L))
+            weakest_idx = L.index(alignment_floor)  # first minimum, as np.argmin
             domain_result = {
                 "window_detected": True,
                 "window_type": window_type,
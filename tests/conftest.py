@@ -0,0 +1,120 @@
+"""Shared pytest fixtures for the Mantic test suite."""
+
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+SCHEMAS_DIR = ROOT / "mantic_thinking" / "schemas"
+
+# Make the repository root importable once for every test module.
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+try:
+    import orjson
+except ImportError:  # optional dev dependency
+    orjson = None
+
+
+def _load_json(path):
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# ---------------------------------------------------------------------------
+# Schemas and adapters
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def tool_map():
+    """Internal registry of all tool detect functions."""
+    from mantic_thinking.adapters.openai_adapter import TOOL_MAP
+    return TOOL_MAP
+
+
+@pytest.fixture(scope="session")
+def schema_snapshot():
+    """Schema files and adapter tool lists, loaded once per session."""
+    from mantic_thinking.adapters.openai_adapter import get_openai_tools
+    from mantic_thinking.adapters.kimi_adapter import get_kimi_tools
+
+    openapi_doc = _load_json(SCHEMAS_DIR / "openapi.json")
+    kimi_doc = _load_json(SCHEMAS_DIR / "kimi-tools.json")
+    return SimpleNamespace(
+        openapi_paths=set(openapi_doc.get("paths", {})),
+        openapi_schemas={
+            path.lstrip("/"): spec["post"]["requestBody"]["content"]["application/json"]["schema"]
+            for path, spec in openapi_doc.get("paths", {}).items()
+        },
+        kimi_names={t["name"] for t in kimi_doc},
+        openai_names={t["function"]["name"] for t in get_openai_tools()},
+        kimi_adapter_names={t["name"] for t in get_kimi_tools()},
+    )
+
+
+# ---------------------------------------------------------------------------
+# LLM context strings (scaffold, guidance, full context)
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def scaffold():
+    """Universal reasoning scaffold text."""
+    from mantic_thinking.adapters.openai_adapter import get_scaffold
+    return get_scaffold()
+
+
+@pytest.fixture(scope="session")
+def all_guidance():
+    """Calibration guidance for every built-in tool."""
+    from mantic_thinking.adapters.openai_adapter import get_tool_guidance
+    return get_tool_guidance()
+
+
+@pytest.fixture(scope="session")
+def healthcare_guidance():
+    """Calibration guidance for healthcare_phenotype_genotype only."""
+    from mantic_thinking.adapters.openai_adapter import get_tool_guidance
+    return get_tool_guidance(["healthcare_phenotype_genotype"])
+
+
+@pytest.fixture(scope="session")
+def full_context():
+    """Full LLM context with no domain (scaffold + all tool guidance)."""
+    from mantic_thinking.adapters.openai_adapter import get_full_context
+    return get_full_context()
+
+
+@pytest.fixture(scope="session")
+def full_context_healthcare():
+    """Full LLM context scoped to the healthcare domain."""
+    from mantic_thinking.adapters.openai_adapter import get_full_context
+    return get_full_context("healthcare")
+
+
+# ---------------------------------------------------------------------------
+# MCP server (requires the [mcp] extra; only imported by fixtures that need it)
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def health_result():
+    """health_check() output, computed once per session."""
+    from mantic_thinking.server import health_check
+    return health_check()
+
+
+@pytest.fixture(scope="session")
+def presets_data():
+    """Parsed mantic://presets resource, loaded once per session."""
+    from mantic_thinking.server import resource_presets
+    return json.loads(resource_presets())
@@ -10,10 +10,6 @@ Validates that all tools work correctly across:
 Run with: python -m pytest tests/test_cross_model.py -v
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
 import numpy as np
 
@@ -7,10 +7,6 @@ argument filtering gap, and all-adapter parity across 17 tools.
 Run with: python -m pytest tests/test_cross_model_deep.py -v
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
 import numpy as np
 
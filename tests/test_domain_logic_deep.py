@@ -7,10 +7,6 @@ and semantic correctness across all 7 domains.
 Run with: python -m pytest tests/test_domain_logic_deep.py -v
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
 import numpy as np
 
@@ -22,9 +18,23 @@ from mantic_thinking.tools.friction.cyber_attribution_resolver import detect as
 from mantic_thinking.tools.friction.military_friction_forecast import detect as military_friction
 from mantic_thinking.tools.friction.social_narrative_rupture import detect as social_friction
 
-from mantic_thinking.tools.emergence.healthcare_precision_therapeutic import detect as healthcare_emergence
-from mantic_thinking.tools.emergence.finance_confluence_alpha import detect as finance_emergence
-from mantic_thinking.tools.emergence.climate_resilience_multiplier import detect as climate_emergence
+from mantic_thinking.tools.emergence.healthcare_precision_therapeutic import (
+    _score_core as healthcare_score_core,
+    detect as healthcare_emergence,
+    detect_batch as healthcare_emergence_batch,
+)
+from mantic_thinking.tools.emergence.finance_confluence_alpha import (
+    _score_core as finance_score_core,
+    detect as finance_emergence,
+    detect_batch as finance_emergence_batch,
+)
+from mantic_thinking.tools.emergence.climate_resilience_multiplier import (
+    LAYER_NAMES as LAYER_NAMES_CLIMATE,
+    _score_core as climate_score_core,
+    detect as climate_emergence,
+    detect_batch as climate_emergence_batch,
+    detect_grid as climate_emergence_grid,
+)
 from mantic_thinking.tools.emergence.social_catalytic_alignment import detect as social_emergence
 
 
@@ -342,6 +352,36 @@ class TestFinanceEmergenceFlowNormalization:
         assert result["window_detected"] is False
         assert "Flow not extreme enough" in result["reason"]
 
+    def test_repeated_tick_reuses_kernel_scores(self):
+        """Identical normalized profiles hit the memoized kernel core."""
+        finance_score_core.cache_clear()
+        first = finance_emergence(0.85, 0.80, -0.7, 0.70)
+        second = finance_emergence(0.85, 0.80, -0.7, 0.70)
+        assert finance_score_core.cache_info().hits == 1
+        assert first["m_score"] == second["m_score"]
+
+    def test_batch_matches_scalar_detect(self):
+        """detect_batch agrees with detect() row for row on a symbol universe."""
+        rows = np.array([
+            [0.90, 0.85, -0.80, 0.70],  # HIGH_CONVICTION, long
+            [0.70, 0.65, 0.60, 0.60],   # MODERATE_CONVICTION, short
+            [0.85, 0.80, 0.00, 0.70],   # flow not extreme
+            [0.90, 0.50, -0.90, 0.80],  # tech/macro gap
+            [1.30, 0.95, -1.50, 0.90],  # clamped
+        ])
+        batch = finance_emergence_batch(rows, f_time=1.2)
+        for i, row in enumerate(rows):
+            single = finance_emergence(*row, f_time=1.2)
+            assert batch["window_detected"][i] == single["window_detected"]
+            assert batch["setup_quality"][i] == single.get("setup_quality")
+            assert batch["m_score"][i] == single["m_score"]
+            if single["window_detected"]:
+                assert batch["conviction_score"][i] == single["conviction_score"]
+                assert batch["position_direction"][i] == single["position_direction"]
+        assert list(batch["setup_quality"][:3]) == [
+            "HIGH_CONVICTION", "MODERATE_CONVICTION", None,
+        ]
+
 
 # =============================================================================
 # Healthcare Emergence: Precision Therapeutic Window
@@ -388,6 +428,53 @@ class TestHealthcareEmergenceConfluence:
         )
         assert "FAVORABLE" in favorable["window_type"]
 
+    def test_batch_matches_scalar_detect(self):
+        """detect_batch agrees with detect() row for row on a cohort."""
+        rows = np.array([
+            [0.85, 0.85, 0.85, 0.85],   # OPTIMAL
+            [0.90, 0.72, 0.80, 0.72],   # FAVORABLE, first weakest = environmental
+            [0.90, 0.85, 0.88, 0.60],   # psychosocial below alignment
+            [1.20, -0.10, 0.90, 0.90],  # clamped
+        ])
+        batch = healthcare_emergence_batch(rows)
+        for i, row in enumerate(rows):
+            single = healthcare_emergence(*row)
+            assert batch["window_detected"][i] == single["window_detected"]
+            assert batch["window_type"][i] == single.get("window_type")
+            assert batch["m_score"][i] == single["m_score"]
+            assert batch["limiting_factor"][i] == single.get("limiting_factor")
+        assert batch["below_threshold_mask"].tolist() == [0, 0, 0b1000, 0b0010]
+
+    def test_limiting_factor_is_first_weakest_layer(self):
+        """limiting_factor names the lowest layer; ties resolve to the first."""
+        result = healthcare_emergence(
+            genomic_predisposition=0.90,
+            environmental_readiness=0.72,
+            phenotypic_timing=0.80,
+            psychosocial_engagement=0.72
+        )
+        assert result["limiting_factor"] == "environmental"
+        assert result["alignment_floor"] == 0.72
+
+    def test_repeated_profile_reuses_kernel_scores(self):
+        """Identical clamped profiles hit the memoized kernel core."""
+        healthcare_score_core.cache_clear()
+        first = healthcare_emergence(0.81, 0.77, 0.9, 0.7)
+        second = healthcare_emergence(0.81, 0.77, 0.9, 0.7)
+        assert healthcare_score_core.cache_info().hits == 1
+        assert first["layer_attribution"] == second["layer_attribution"]
+
+    def test_improvement_needed_lists_layers_at_or_below_alignment(self):
+        """No-window results name every layer at/below alignment, in layer order."""
+        result = healthcare_emergence(
+            genomic_predisposition=0.40,
+            environmental_readiness=0.90,
+            phenotypic_timing=0.65,
+            psychosocial_engagement=0.30
+        )
+        assert result["window_detected"] is False
+        assert result["improvement_needed"] == ["genomic", "phenotypic", "psychosocial"]
+
 
 # =============================================================================
 # Climate Emergence: Resilience Multiplier
@@ -417,6 +504,70 @@ class TestClimateEmergenceCoupling:
         )
         assert result["window_detected"] is False
 
+    def test_repeated_profile_reuses_kernel_scores(self):
+        """Identical clamped profiles hit the memoized kernel core."""
+        climate_score_core.cache_clear()
+        first = climate_emergence(0.7, 0.72, 0.65, 0.68)
+        second = climate_emergence(0.7, 0.72, 0.65, 0.68)
+        assert climate_score_core.cache_info().hits == 1
+        assert first["m_score"] == second["m_score"]
+        assert first["layer_attribution"] == second["layer_attribution"]
+
+    def test_batch_matches_scalar_detect(self):
+        """detect_batch agrees with detect() row for row, including tiers."""
+        rows = np.array([
+            [0.85, 0.85, 0.85, 0.85],   # HIGH_MULTIPLIER
+            [0.80, 0.80, 0.75, 0.60],   # MULTIPLIER
+            [0.75, 0.75, 0.68, 0.68],   # MODERATE_MULTIPLIER
+            [0.85, 0.85, 0.85, 0.30],   # no window
+            [1.20, -0.10, 0.90, 0.90],  # clamped
+        ])
+        batch = climate_emergence_batch(rows, f_time=1.5)
+        for i, row in enumerate(rows):
+            single = climate_emergence(*row, f_time=1.5)
+            assert batch["window_detected"][i] == single["window_detected"]
+            assert batch["intervention_type"][i] == single.get("intervention_type")
+            assert batch["cross_domain_coupling"][i] == single["cross_domain_coupling"]
+            assert batch["m_score"][i] == single["m_score"]
+            if not single["window_detected"]:
+                mask = int(batch["below_threshold_mask"][i])
+                names = [n for bit, n in enumerate(LAYER_NAMES_CLIMATE) if mask >> bit & 1]
+                assert names == single["limiting_factors"]
+        assert batch["below_threshold_mask"].tolist() == [0, 0, 0, 0b1000, 0b0010]
+        assert list(batch["intervention_type"][:4]) == [
+            "HIGH_MULTIPLIER", "MULTIPLIER", "MODERATE_MULTIPLIER", None,
+        ]
+
+    def test_coupling_boundary_decisions_are_pinned(self):
+        """Profiles whose coupling rounds onto the 0.50 threshold keep their v1.0.0 decision."""
+        rows = [(0.52, 0.64, 0.93, 0.76), (0.52, 0.76, 0.93, 0.64)]
+        expected = [False, True]
+        assert [climate_emergence(*row)["window_detected"] for row in rows] == expected
+        assert climate_emergence_batch(np.array(rows))["window_detected"].tolist() == expected
+
+    def test_batch_rejects_bad_shape_and_nan(self):
+        with pytest.raises(ValueError, match="shape"):
+            climate_emergence_batch([[0.5, 0.5, 0.5]])
+        with pytest.raises(ValueError, match="finite"):
+            climate_emergence_batch([[0.5, np.nan, 0.5, 0.5]])
+
+    def test_grid_matches_scalar_detect_at_each_point(self):
+        """detect_grid scores the full Cartesian product, indexed by axis."""
+        atm, eco, infra, pol = [0.4, 0.8], [0.75, 0.9], [0.6, 0.7, 0.85], 0.8
+        grid = climate_emergence_grid(atm, eco, infra, pol)
+        assert grid["m_score"].shape == (2, 2, 3, 1)
+        for i, a in enumerate(atm):
+            for j, e in enumerate(eco):
+                for k, c in enumerate(infra):
+                    single = climate_emergence(a, e, c, pol)
+                    assert grid["window_detected"][i, j, k, 0] == single["window_detected"]
+                    assert grid["intervention_type"][i, j, k, 0] == single.get("intervention_type")
+                    assert grid["m_score"][i, j, k, 0] == single["m_score"]
+
+    def test_grid_rejects_nested_axis(self):
+        with pytest.raises(ValueError, match="1-D"):
+            climate_emergence_grid([[0.5, 0.6]], 0.5, 0.5, 0.5)
+
 
 # =============================================================================
 # Social Emergence: Catalytic Alignment
@@ -10,10 +10,6 @@ verifying design properties like:
 Run with: python -m pytest tests/test_friction_emergence_pairs.py -v
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
 import numpy as np
 
@@ -94,6 +90,21 @@ class TestWeightDifferences:
         # Emergence: slightly different distribution
         assert fin_e_w == [0.30, 0.30, 0.20, 0.20]
 
+    def test_kernel_weight_vectors_mirror_weights(self):
+        """Each tool's prebuilt weight views (_W_ARR, _WEIGHTS_DICT) mirror WEIGHTS."""
+        import mantic_thinking.tools.emergence as emergence
+        import mantic_thinking.tools.friction as friction
+
+        for suite in (friction, emergence):
+            for name in suite.__all__:
+                module = getattr(suite, name)
+                weights = module.WEIGHTS
+                expected = [weights[n] for n in module.LAYER_NAMES] if isinstance(weights, dict) else weights
+                assert module._W_ARR.tolist() == expected, name
+                assert not module._W_ARR.flags.writeable, name
+                if not isinstance(weights, dict):
+                    assert module._WEIGHTS_DICT == dict(zip(module.LAYER_NAMES, weights)), name
+
 
 # =============================================================================
 # Interaction Coefficient Modifications
@@ -13,10 +13,6 @@ Covers:
 Run with: python -m pytest tests/test_generic_detect.py -v
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
 import numpy as np
 
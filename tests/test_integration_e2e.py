@@ -9,8 +9,8 @@ Run with: python -m pytest tests/test_integration_e2e.py -v
 
 import sys
 import os
+import runpy
 import subprocess
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pytest
 import numpy as np
@@ -19,6 +19,7 @@ from mantic_thinking.core.mantic_kernel import mantic_kernel, compute_temporal_k
 from mantic_thinking.adapters.openai_adapter import TOOL_MAP, execute_tool as execute_openai
 from mantic_thinking.adapters.kimi_adapter import batch_execute
 from mantic_thinking.adapters.claude_adapter import format_for_claude
+import mantic_thinking.tools.emergence as emergence_tools
 
 
 # =============================================================================
@@ -208,3 +209,11 @@ class TestScriptSmoke:
                 capture_output=True, text=True, timeout=30
             )
             assert result.returncode == 0, f"self_analysis.py failed: {result.stderr}"
+
+    @pytest.mark.parametrize("tool_name", emergence_tools.__all__)
+    def test_emergence_example_runs(self, tool_name, capsys):
+        """Each emergence demo in tools/emergence/examples runs to completion."""
+        runpy.run_module(
+            f"mantic_thinking.tools.emergence.examples.{tool_name}", run_name="__main__"
+        )
+        assert capsys.readouterr().out.startswith("=== ")
@@ -6,11 +6,6 @@ These tests validate the new interaction override API:
 - audit trail in overrides_applied
 """
 
-import os
-import sys
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
 
 from mantic_thinking.core.validators import (
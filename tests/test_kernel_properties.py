@@ -7,17 +7,13 @@ boundary conditions, and property-based correctness.
 Run with: python -m pytest tests/test_kernel_properties.py -v
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
 import numpy as np
 import random
 
 # Tools call the safe kernel wrapper; keep the core kernel immutable.
 from mantic_thinking.core.safe_kernel import safe_mantic_kernel as mantic_kernel
-from mantic_thinking.core.mantic_kernel import compute_temporal_kernel, verify_kernel_integrity
+from mantic_thinking.core.mantic_kernel import compute_temporal_kernel, mantic_kernel_batch, verify_kernel_integrity
 
 
 # =============================================================================
@@ -223,3 +219,36 @@ class TestArrayLengthValidation:
         with pytest.raises(ValueError, match="Interaction coefficients"):
             mantic_kernel([0.25, 0.25, 0.25, 0.25], [0.5, 0.5, 0.5, 0.5],
                           [2.5, 1.0, 1.0, 1.0])
+
+
+class TestKernelBatch:
+    """mantic_kernel_batch must agree with the scalar kernel row for row."""
+
+    def test_rows_match_scalar_kernel_exactly(self):
+        rng = np.random.default_rng(7)
+        W = rng.random(4)
+        W /= W.sum()
+        L = rng.random((200, 4))
+        L[0] = 0.0
+        I = 0.1 + rng.random((200, 4)) * 1.9
+
+        M, S, attr = mantic_kernel_batch(W, L, I, f_time=1.3)
+
+        for i in range(len(L)):
+            m, s, a = mantic_kernel(W, L[i], I[i], f_time=1.3)
+            assert (M[i], S[i], attr[i].tolist()) == (m, s, a)
+
+    def test_attribution_can_be_skipped(self):
+        M, S, attr = mantic_kernel_batch([0.25] * 4, [[0.5] * 4], attribution=False)
+        assert attr is None
+        assert M.tolist() == S.tolist() == [0.5]
+
+    def test_non_finite_or_out_of_range_layers_raise(self):
+        with pytest.raises(ValueError, match="Layer values"):
+            mantic_kernel_batch([0.25] * 4, [[np.nan, 0.5, 0.5, 0.5]])
+        with pytest.raises(ValueError, match="Layer values"):
+            mantic_kernel_batch([0.25] * 4, [[1.5, 0.5, 0.5, 0.5]])
+
+    def test_shape_mismatch_raises(self):
+        with pytest.raises(ValueError, match="shape"):
+            mantic_kernel_batch([0.25] * 4, [0.5] * 4)
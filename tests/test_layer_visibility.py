@@ -4,10 +4,6 @@ Layer Visibility Tests for Mantic Framework v1.2.0
 Tests the layer introspection module and tool response additions.
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
 import numpy as np
 
@@ -7,10 +7,6 @@ with required keys present in all code paths.
 Run with: python -m pytest tests/test_output_schemas.py -v
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
 import numpy as np
 
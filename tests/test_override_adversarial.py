@@ -7,10 +7,6 @@ edge cases, and chained overrides.
 Run with: python -m pytest tests/test_override_adversarial.py -v
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
 import numpy as np
 
@@ -147,42 +143,29 @@ class TestCombinedOverrides:
 # Sensitivity: Thresholds at ±20% Drift
 # =============================================================================
 
-class TestSensitivityAtDriftBounds:
-    """Test that ±20% drift changes detection behavior predictably."""
-
-    def test_max_permissive_threshold(self):
-        """Threshold at +20% → fewer alerts (more permissive)."""
-        # Default buffering threshold = 0.4, +20% = 0.48
-        # Construct case with buffering_score ≈ 0.45 (between 0.4 and 0.48)
-        # expected = 0.8*0.6 + 0.3*0.4 = 0.60
-        # phenotypic=0.15, buffering_score = |0.15 - 0.60| = 0.45
-        result_default = healthcare_friction(
-            phenotypic=0.15, genomic=0.8, environmental=0.3, psychosocial=0.8
-        )
-        result_permissive = healthcare_friction(
-            phenotypic=0.15, genomic=0.8, environmental=0.3, psychosocial=0.8,
-            threshold_override={"buffering": 0.48}
-        )
-        # Default triggers (0.45 > 0.4), permissive does not (0.45 < 0.48)
-        assert result_default["alert"] is not None
-        assert result_permissive["alert"] is None
-
-    def test_max_sensitive_threshold(self):
-        """Threshold at -20% → more alerts (more sensitive)."""
-        # Default buffering threshold = 0.4, -20% = 0.32
-        # Construct case with buffering_score ≈ 0.35 (between 0.32 and 0.4)
-        # expected = 0.6*0.6 + 0.5*0.4 = 0.56
-        # phenotypic=0.9, buffering_score = |0.9 - 0.56| = 0.34
-        result_default = healthcare_friction(
-            phenotypic=0.9, genomic=0.6, environmental=0.5, psychosocial=0.5
-        )
-        result_sensitive = healthcare_friction(
-            phenotypic=0.9, genomic=0.6, environmental=0.5, psychosocial=0.5,
-            threshold_override={"buffering": 0.32}
-        )
-        # Default does not trigger (0.34 < 0.4), sensitive triggers (0.34 > 0.32)
-        assert result_default["alert"] is None
-        assert result_sensitive["alert"] is not None
+# Each case: (inputs, buffering override, alert expected at default, alert expected with override)
+_SENSITIVITY_CASES = [
+    # Max permissive: default 0.4, +20% = 0.48.
+    # expected = 0.8*0.6 + 0.3*0.4 = 0.60; buffering_score = |0.15 - 0.60| = 0.45
+    # Default triggers (0.45 > 0.4), permissive does not (0.45 < 0.48)
+    (dict(phenotypic=0.15, genomic=0.8, environmental=0.3, psychosocial=0.8), 0.48, True, False),
+    # Max sensitive: default 0.4, -20% = 0.32.
+    # expected = 0.6*0.6 + 0.5*0.4 = 0.56; buffering_score = |0.9 - 0.56| = 0.34
+    # Default does not trigger (0.34 < 0.4), sensitive triggers (0.34 > 0.32)
+    (dict(phenotypic=0.9, genomic=0.6, environmental=0.5, psychosocial=0.5), 0.32, False, True),
+]
+
+
+@pytest.mark.parametrize(
+    "inputs,buffering,expect_default,expect_override", _SENSITIVITY_CASES,
+    ids=["max_permissive", "max_sensitive"],
+)
+def test_sensitivity_at_drift_bounds(inputs, buffering, expect_default, expect_override):
+    """Threshold at ±20% drift changes detection behavior predictably."""
+    result_default = healthcare_friction(**inputs)
+    result_override = healthcare_friction(**inputs, threshold_override={"buffering": buffering})
+    assert (result_default["alert"] is not None) is expect_default
+    assert (result_override["alert"] is not None) is expect_override
 
 
 # =============================================================================
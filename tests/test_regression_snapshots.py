@@ -7,15 +7,41 @@ output consistency across releases.
 Run with: python -m pytest tests/test_regression_snapshots.py -v
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import inspect
 
-import pytest
 import numpy as np
+import pytest
 
-from mantic_thinking.core.mantic_kernel import KERNEL_VERSION, KERNEL_HASH, mantic_kernel, verify_kernel_integrity
+from mantic_thinking.core.mantic_kernel import (
+    KERNEL_VERSION, KERNEL_HASH, mantic_kernel, verify_kernel_integrity, compute_temporal_kernel
+)
 import mantic_thinking.tools as tools
+import mantic_thinking.tools.emergence as emergence_tools
+import mantic_thinking.tools.friction as friction_tools
+
+
+# Golden kernel inputs (verified at v1.0.0)
+_GOLDEN_W = np.array([0.25, 0.25, 0.25, 0.25])
+_GOLDEN_L = np.array([0.8, 0.6, 0.9, 0.4])
+_GOLDEN_I = np.ones(4)
+
+# Golden temporal kernel outputs (verified at v1.0.0); compared exactly.
+# (kernel_type, t, n, alpha, kwargs, f_time)
+_GOLDEN_TEMPORAL = [
+    ("exponential", -9.5, 2.0, 0.5, {}, 7.485182988770058e-05),
+    ("logistic", -9.5, 1.5, 0.1, {}, 0.19387893782385984),
+    ("s_curve", -8.5, 1.0, 0.2, {"t0": 2.0}, 0.10909682119561294),
+    ("oscillatory", -9.5, 2.0, 0.5, {"frequency": 0.7}, 3.071462776587218e-05),
+    ("memory", -9.5, 1.0, 0.05, {"memory_strength": 0.6}, 8016.836097797122),
+]
+
+# Neutral-input cases: (tool_name, inputs, alert_allowed)
+# finance_regime_conflict WILL alert because flow=0 is not aligned
+_NEUTRAL_CASES = [
+    ("healthcare_phenotype_genotype", {"phenotypic": 0.5, "genomic": 0.5, "environmental": 0.5, "psychosocial": 0.5}, False),
+    ("finance_regime_conflict", {"technical": 0.5, "macro": 0.5, "flow": 0.0, "risk": 0.5}, True),
+    ("climate_maladaptation", {"atmospheric": 0.5, "ecological": 0.5, "infrastructure": 0.5, "policy": 0.5}, False),
+]
 
 
 # =============================================================================
@@ -79,6 +105,22 @@ class TestPublicAPISurface:
         assert "codebase_alignment_window" not in tools.__all__
         assert "plan_alignment_window" not in tools.__all__
 
+    def test_suite_packages_resolve_tools_lazily(self):
+        """Suite packages expose each listed tool as an attribute on access."""
+        for suite in (friction_tools, emergence_tools):
+            assert len(suite.__all__) == 8
+            for name in suite.__all__:
+                assert name in dir(suite)
+                assert callable(getattr(suite, name).detect)
+            assert set(suite.__all__) <= set(tools.__all__)
+
+    def test_tool_modules_define_detect_once(self):
+        """Each tool source holds a single detect(); a pasted second copy would shadow the first."""
+        for suite in (friction_tools, emergence_tools):
+            for name in suite.__all__:
+                source = inspect.getsource(getattr(suite, name))
+                assert source.count("\ndef detect(") == 1, name
+
 
 # =============================================================================
 # Golden Output Snapshots
@@ -89,17 +131,19 @@ class TestGoldenOutputs:
 
     def test_kernel_golden_output(self):
         """Known kernel input/output pair must not drift."""
-        W = [0.25, 0.25, 0.25, 0.25]
-        L = [0.8, 0.6, 0.9, 0.4]
-        I = [1.0, 1.0, 1.0, 1.0]
-
-        M, S, attr = mantic_kernel(W, L, I)
+        M, S, attr = mantic_kernel(_GOLDEN_W, _GOLDEN_L, _GOLDEN_I)
 
         # Golden values (verified at v1.0.0)
-        assert np.isclose(M, 0.675, atol=1e-10)
-        assert np.isclose(S, 0.675, atol=1e-10)
+        assert abs(M - 0.675) < 1e-10
+        assert abs(S - 0.675) < 1e-10
         assert len(attr) == 4
 
+    def test_temporal_kernel_golden_output(self):
+        """Temporal kernel values must match the v1.0.0 outputs bit for bit."""
+        for kind, t, n, alpha, kwargs, expected in _GOLDEN_TEMPORAL:
+            f_time = compute_temporal_kernel(t, n=n, alpha=alpha, kernel_type=kind, **kwargs)
+            assert f_time == expected, kind
+
     def test_healthcare_friction_golden(self):
         """Healthcare friction with known inputs produces known output."""
         from mantic_thinking.tools.friction.healthcare_phenotype_genotype import detect
@@ -126,16 +170,12 @@ class TestGoldenOutputs:
         assert result["setup_quality"] in ("HIGH_CONVICTION", "MODERATE_CONVICTION")
         assert 0 < result["m_score"] < 1
 
-    @pytest.mark.parametrize("tool_name,inputs", [
-        ("healthcare_phenotype_genotype", {"phenotypic": 0.5, "genomic": 0.5, "environmental": 0.5, "psychosocial": 0.5}),
-        ("finance_regime_conflict", {"technical": 0.5, "macro": 0.5, "flow": 0.0, "risk": 0.5}),
-        ("climate_maladaptation", {"atmospheric": 0.5, "ecological": 0.5, "infrastructure": 0.5, "policy": 0.5}),
-    ])
-    def test_neutral_inputs_no_alert(self, tool_name, inputs):
+    @pytest.mark.parametrize(
+        "tool_name,inputs,alert_allowed", _NEUTRAL_CASES,
+        ids=[case[0] for case in _NEUTRAL_CASES],
+    )
+    def test_neutral_inputs_no_alert(self, tool_map, tool_name, inputs, alert_allowed):
         """Neutral (0.5) inputs should generally not trigger alerts."""
-        from mantic_thinking.adapters.openai_adapter import TOOL_MAP
-        result = TOOL_MAP[tool_name](**inputs)
-        # For balanced inputs, most tools should not alert
-        # (finance_regime_conflict WILL alert because flow=0 is not aligned)
-        if tool_name != "finance_regime_conflict":
+        result = tool_map[tool_name](**inputs)
+        if not alert_allowed:
             assert result.get("alert") is None or result.get("decision") == "proceed"
@@ -7,34 +7,40 @@ from __future__ import annotations
 
 import json
 
+import numpy as np
 import pytest
 
 fastmcp = pytest.importorskip("fastmcp", reason="requires fastmcp (install with pip install mantic-thinking[mcp])")
 
-from mantic_thinking.server import (
-    # Tools
-    health_check,
-    detect,
-    detect_friction,
-    detect_emergence,
-    visualize_gauge,
-    visualize_attribution,
-    visualize_kernels,
-    # Resources
-    resource_system_prompt,
-    resource_presets,
-    resource_scaffold,
-    resource_tech_spec,
-    resource_domain_config,
-    resource_all_guidance,
-    resource_tool_guidance,
-    resource_full_context,
-    resource_domains,
-    # Prompts
-    warmup,
-    analyze_domain,
-    compare_friction_emergence,
-)
+_server = pytest.importorskip("mantic_thinking.server", reason="server extras")
+
+# Tools
+detect = _server.detect
+detect_friction = _server.detect_friction
+detect_emergence = _server.detect_emergence
+visualize_gauge = _server.visualize_gauge
+visualize_attribution = _server.visualize_attribution
+visualize_kernels = _server.visualize_kernels
+# Resources
+resource_system_prompt = _server.resource_system_prompt
+resource_scaffold = _server.resource_scaffold
+resource_tech_spec = _server.resource_tech_spec
+resource_domain_config = _server.resource_domain_config
+resource_all_guidance = _server.resource_all_guidance
+resource_tool_guidance = _server.resource_tool_guidance
+resource_full_context = _server.resource_full_context
+resource_domains = _server.resource_domains
+# Prompts
+warmup = _server.warmup
+analyze_domain = _server.analyze_domain
+compare_friction_emergence = _server.compare_friction_emergence
+
+
+def _assert_str_contains(result, needle=""):
+    """Result must be a non-empty string containing ``needle``."""
+    assert isinstance(result, str)
+    assert len(result) > 0
+    assert needle in result
 
 
 # ---------------------------------------------------------------------------
@@ -43,14 +49,12 @@ from mantic_thinking.server import (
 
 
 class TestHealthCheck:
-    def test_returns_ok(self):
-        result = health_check()
-        assert result["status"] == "ok"
-        assert result["presets"] == 16
+    def test_returns_ok(self, health_result):
+        assert health_result["status"] == "ok"
+        assert health_result["presets"] == 16
 
-    def test_version_present(self):
-        result = health_check()
-        assert "version" in result
+    def test_version_present(self, health_result):
+        assert "version" in health_result
 
 
 class TestDetect:
@@ -136,19 +140,13 @@ class TestDetectShortcuts:
 
 class TestVisualization:
     def test_gauge(self):
-        result = visualize_gauge(0.65, 0.5)
-        assert isinstance(result, str)
-        assert "M-SCORE" in result
+        _assert_str_contains(visualize_gauge(0.65, 0.5), "M-SCORE")
 
     def test_attribution(self):
-        result = visualize_attribution({"layer_a": 0.4, "layer_b": 0.6})
-        assert isinstance(result, str)
-        assert "TREEMAP" in result
+        _assert_str_contains(visualize_attribution({"layer_a": 0.4, "layer_b": 0.6}), "TREEMAP")
 
     def test_kernels(self):
-        result = visualize_kernels(t=5.0)
-        assert isinstance(result, str)
-        assert "KERNEL" in result
+        _assert_str_contains(visualize_kernels(t=5.0), "KERNEL")
 
 
 # ---------------------------------------------------------------------------
@@ -158,37 +156,32 @@ class TestVisualization:
 
 class TestResources:
     def test_system_prompt(self):
-        content = resource_system_prompt()
-        assert isinstance(content, str)
-        assert len(content) > 0
-        assert "Mantic Thinking" in content
+        _assert_str_contains(resource_system_prompt(), "Mantic Thinking")
 
-    def test_presets(self):
-        content = resource_presets()
-        data = json.loads(content)
-        assert len(data) == 16
+    def test_presets(self, presets_data):
+        assert len(presets_data) == 16
         # Check a known preset has expected structure
-        for name, preset in data.items():
+        for name, preset in presets_data.items():
             assert "layer_names" in preset
             assert "weights" in preset
             assert len(preset["layer_names"]) == len(preset["weights"])
             break
 
-    def test_presets_weights_sum(self):
+    def test_presets_weights_sum(self, presets_data):
         """Every preset's weights should sum to ~1.0."""
-        data = json.loads(resource_presets())
-        for name, preset in data.items():
-            total = sum(preset["weights"].values())
-            assert abs(total - 1.0) < 0.01, f"{name} weights sum to {total}"
+        names = list(presets_data)
+        rows = [list(preset["weights"].values()) for preset in presets_data.values()]
+        width = max(len(row) for row in rows)
+        weights = np.array([row + [0.0] * (width - len(row)) for row in rows])
+        sums = weights.sum(axis=1)
+        bad = np.flatnonzero(np.abs(sums - 1.0) >= 0.01)
+        assert not bad.size, {names[i]: float(sums[i]) for i in bad}
 
     def test_scaffold(self):
-        content = resource_scaffold()
-        assert isinstance(content, str)
-        assert len(content) > 0
+        _assert_str_contains(resource_scaffold())
 
     def test_tech_spec(self):
-        content = resource_tech_spec()
-        assert isinstance(content, str)
+        _assert_str_contains(resource_tech_spec())
 
     def test_domain_config_healthcare(self):
         content = resource_domain_config("healthcare")
@@ -205,18 +198,13 @@ class TestResources:
         assert "No config found" in content
 
     def test_all_guidance(self):
-        content = resource_all_guidance()
-        assert isinstance(content, str)
-        assert len(content) > 0
+        _assert_str_contains(resource_all_guidance())
 
     def test_tool_guidance(self):
-        content = resource_tool_guidance("healthcare_phenotype_genotype")
-        assert isinstance(content, str)
+        _assert_str_contains(resource_tool_guidance("healthcare_phenotype_genotype"))
 
     def test_full_context(self):
-        content = resource_full_context("healthcare")
-        assert isinstance(content, str)
-        assert len(content) > 0
+        _assert_str_contains(resource_full_context("healthcare"))
 
     def test_domains_registry(self):
         content = resource_domains()
@@ -234,17 +222,12 @@ class TestResources:
 
 class TestPrompts:
     def test_warmup(self):
-        result = warmup()
-        assert isinstance(result, str)
-        assert "presets" in result
+        _assert_str_contains(warmup(), "presets")
 
     def test_analyze_domain(self):
         result = analyze_domain("healthcare", "Patient with high genetic risk")
-        assert isinstance(result, str)
-        assert "healthcare" in result
+        _assert_str_contains(result, "healthcare")
         assert "friction" in result.lower()
 
     def test_compare_friction_emergence(self):
-        result = compare_friction_emergence("finance")
-        assert isinstance(result, str)
-        assert "finance" in result
+        _assert_str_contains(compare_friction_emergence("finance"), "finance")
@@ -5,17 +5,15 @@ Covers friction/emergence behavior, guardrails, interaction dynamics,
 temporal allowlist enforcement, and adapter-facing schema stability.
 """
 
-import os
-import sys
+import math
 
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from mantic_thinking.core.validators import DOMAIN_KERNEL_ALLOWLIST
 from mantic_thinking.tools.friction.system_lock_recursive_control import (
     WEIGHTS as FRICTION_WEIGHTS,
     DEFAULT_THRESHOLDS as FRICTION_THRESHOLDS,
+    _score_core,
     detect as detect_friction,
 )
 from mantic_thinking.tools.emergence.system_lock_dissolution_window import (
@@ -25,6 +23,42 @@ from mantic_thinking.tools.emergence.system_lock_dissolution_window import (
 )
 from mantic_thinking.tools.generic_detect import _RESERVED_DOMAINS, detect as detect_generic
 
+# Keys every result carries regardless of mode.
+_COMMON_REQUIRED = frozenset({
+    "m_score",
+    "spatial_component",
+    "layer_attribution",
+    "thresholds",
+    "overrides_applied",
+    "layer_visibility",
+    "layer_coupling",
+})
+
+_FRICTION_REQUIRED = _COMMON_REQUIRED | {
+    "alert",
+    "severity",
+    "severity_band",
+    "lock_phase",
+    "asymmetry_ratio",
+    "recursion_assessment",
+}
+
+_EMERGENCE_WINDOW_REQUIRED = _COMMON_REQUIRED | {
+    "window_detected",
+    "window_type",
+    "dissolution_sustainability",
+    "recommended_action",
+    "catalyst_score",
+}
+
+_EMERGENCE_NOWIN_REQUIRED = _COMMON_REQUIRED | {
+    "window_detected",
+    "catalyst_score",
+    "limiting_factors",
+    "status",
+    "recommendation",
+}
+
 
 class TestFrictionThresholdBoundaries:
     """Phase transitions and guard behavior for friction mode."""
@@ -66,11 +100,11 @@ class TestFrictionAsymmetryRatio:
 
     def test_high_asymmetry_ratio(self):
         result = detect_friction(0.2, 0.3, 0.8, 0.7)
-        assert result["asymmetry_ratio"] == pytest.approx(4.0)
+        assert math.isclose(result["asymmetry_ratio"], 4.0, rel_tol=1e-9)
 
     def test_low_asymmetry_ratio_balanced(self):
         result = detect_friction(0.5, 0.5, 0.5, 0.5)
-        assert result["asymmetry_ratio"] == pytest.approx(1.0)
+        assert result["asymmetry_ratio"] == 1.0
 
     def test_asymmetry_ratio_with_near_zero_micro_floor(self):
         result = detect_friction(0.0, 0.2, 0.8, 0.8)
@@ -128,11 +162,11 @@ class TestWeightValidation:
 
     def test_friction_weights_sum_to_one(self):
         assert isinstance(FRICTION_WEIGHTS, dict)
-        assert sum(FRICTION_WEIGHTS.values()) == pytest.approx(1.0)
+        assert math.isclose(sum(FRICTION_WEIGHTS.values()), 1.0, rel_tol=1e-9)
 
     def test_emergence_weights_sum_to_one(self):
         assert isinstance(EMERGENCE_WEIGHTS, list)
-        assert sum(EMERGENCE_WEIGHTS) == pytest.approx(1.0)
+        assert math.isclose(sum(EMERGENCE_WEIGHTS), 1.0, rel_tol=1e-9)
 
 
 class TestInteractionCoefficients:
@@ -146,7 +180,7 @@ class TestInteractionCoefficients:
     def test_friction_no_amplification_when_micro_exceeds_macro(self):
         dynamic = detect_friction(0.8, 0.7, 0.2, 0.3, interaction_mode="dynamic")
         base = detect_friction(0.8, 0.7, 0.2, 0.3, interaction_mode="base")
-        assert dynamic["m_score"] == pytest.approx(base["m_score"])
+        assert dynamic["m_score"] == base["m_score"]
 
     def test_emergence_readiness_boost_when_vulnerability_high(self):
         dynamic = detect_emergence(0.6, 0.6, 0.8, 0.6, interaction_mode="dynamic")
@@ -159,58 +193,15 @@ class TestOutputSchema:
 
     def test_friction_output_keys(self):
         result = detect_friction(0.2, 0.3, 0.8, 0.7)
-        required = {
-            "alert",
-            "severity",
-            "severity_band",
-            "lock_phase",
-            "asymmetry_ratio",
-            "recursion_assessment",
-            "m_score",
-            "spatial_component",
-            "layer_attribution",
-            "thresholds",
-            "overrides_applied",
-            "layer_visibility",
-            "layer_coupling",
-        }
-        assert required.issubset(result.keys())
+        assert _FRICTION_REQUIRED <= result.keys()
 
     def test_emergence_window_output_keys(self):
         result = detect_emergence(0.8, 0.82, 0.81, 0.7)
-        required = {
-            "window_detected",
-            "window_type",
-            "dissolution_sustainability",
-            "recommended_action",
-            "catalyst_score",
-            "m_score",
-            "spatial_component",
-            "layer_attribution",
-            "thresholds",
-            "overrides_applied",
-            "layer_visibility",
-            "layer_coupling",
-        }
-        assert required.issubset(result.keys())
+        assert _EMERGENCE_WINDOW_REQUIRED <= result.keys()
 
     def test_emergence_no_window_output_keys(self):
         result = detect_emergence(0.3, 0.4, 0.45, 0.5)
-        required = {
-            "window_detected",
-            "catalyst_score",
-            "limiting_factors",
-            "status",
-            "recommendation",
-            "m_score",
-            "spatial_component",
-            "layer_attribution",
-            "thresholds",
-            "overrides_applied",
-            "layer_visibility",
-            "layer_coupling",
-        }
-        assert required.issubset(result.keys())
+        assert _EMERGENCE_NOWIN_REQUIRED <= result.keys()
 
 
 class TestDeterminism:
@@ -219,13 +210,20 @@ class TestDeterminism:
     def test_friction_determinism(self):
         r1 = detect_friction(0.2, 0.3, 0.8, 0.7)
         r2 = detect_friction(0.2, 0.3, 0.8, 0.7)
-        assert r1["m_score"] == pytest.approx(r2["m_score"])
+        assert r1["m_score"] == r2["m_score"]
         assert r1["lock_phase"] == r2["lock_phase"]
 
+    def test_friction_core_scores_memoized(self):
+        _score_core.cache_clear()
+        r1 = detect_friction(0.2, 0.3, 0.8, 0.7)
+        r2 = detect_friction(0.2, 0.3, 0.8, 0.7)
+        assert _score_core.cache_info().hits == 1
+        assert r1["layer_attribution"] == r2["layer_attribution"]
+
     def test_emergence_determinism(self):
         r1 = detect_emergence(0.65, 0.75, 0.6, 0.5)
         r2 = detect_emergence(0.65, 0.75, 0.6, 0.5)
-        assert r1["m_score"] == pytest.approx(r2["m_score"])
+        assert r1["m_score"] == r2["m_score"]
         assert r1["window_detected"] == r2["window_detected"]
 
 
@@ -287,7 +285,7 @@ class TestThresholdOverrideClamping:
             0.7,
             threshold_override={"lock_active": 0.99},
         )
-        assert result["thresholds"]["lock_active"] == pytest.approx(0.624)
+        assert math.isclose(result["thresholds"]["lock_active"], 0.624, rel_tol=1e-9)
         assert result["overrides_applied"]["threshold_overrides"]["clamped"] is True
 
     def test_emergence_threshold_clamping(self):
@@ -298,7 +296,7 @@ class TestThresholdOverrideClamping:
             0.6,
             threshold_override={"dissolution_window": 0.1},
         )
-        assert result["thresholds"]["dissolution_window"] == pytest.approx(0.56)
+        assert math.isclose(result["thresholds"]["dissolution_window"], 0.56, rel_tol=1e-9)
         assert result["overrides_applied"]["threshold_overrides"]["clamped"] is True
 
 
@@ -7,14 +7,12 @@ and interaction with the f_time clamping system in tools.
 Run with: python -m pytest tests/test_temporal_extremes.py -v
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from math import exp
 
 import pytest
 import numpy as np
 
-from mantic_thinking.core.mantic_kernel import compute_temporal_kernel
+from mantic_thinking.core.mantic_kernel import compute_temporal_kernel, compute_temporal_kernel_batch
 from mantic_thinking.core.validators import clamp_f_time
 from mantic_thinking.tools.friction.healthcare_phenotype_genotype import detect as healthcare_detect
 
@@ -26,49 +24,32 @@ from mantic_thinking.tools.friction.healthcare_phenotype_genotype import detect
 class TestExtremeTimeValues:
     """Temporal kernel behavior with very large/small t."""
 
-    def test_exponential_very_large_t(self):
-        """exp(1.0 * 0.1 * 1000) = exp(100) ≈ 2.69e43 — valid but huge."""
-        result = compute_temporal_kernel(t=1000, n=1.0, alpha=0.1,
-                                         kernel_type="exponential")
-        assert result > 1e10, "Huge t should produce huge exponential"
-        assert np.isfinite(result), "Should still be finite"
-
-    def test_exponential_very_negative_t(self):
-        """exp(1.0 * 0.1 * -1000) = exp(-100) ≈ 0 → positivity clamp."""
-        result = compute_temporal_kernel(t=-1000, n=1.0, alpha=0.1,
-                                         kernel_type="exponential")
-        assert result == pytest.approx(1e-10), "Should clamp to positivity minimum"
-
-    def test_linear_beyond_decay(self):
-        """max(0, 1 - 0.1*20) = max(0, -1) = 0 → positivity clamp."""
-        result = compute_temporal_kernel(t=20, alpha=0.1,
-                                         kernel_type="linear")
-        assert result == pytest.approx(1e-10), "Linear beyond decay → positivity clamp"
-
-    def test_linear_at_zero(self):
-        """t=0 → max(0, 1 - 0) = 1.0."""
-        result = compute_temporal_kernel(t=0, alpha=0.1, kernel_type="linear")
-        assert result == pytest.approx(1.0)
-
-    def test_memory_negative_t(self):
-        """t=-5: 1 + 1.0 * exp(5) ≈ 149.4 — large but valid."""
-        result = compute_temporal_kernel(t=-5, kernel_type="memory",
-                                         memory_strength=1.0)
-        assert result > 100, "Negative t in memory kernel should produce large value"
-        assert np.isfinite(result)
-
-    def test_s_curve_far_from_t0(self):
-        """t=-100, t0=0, alpha=0.1: 1/(1+exp(10)) ≈ 0.000045."""
-        result = compute_temporal_kernel(t=-100, alpha=0.1, kernel_type="s_curve",
-                                         t0=0)
-        assert result < 0.001
-        assert result > 0  # Still positive
-
-    def test_s_curve_far_above_t0(self):
-        """t=100, t0=0, alpha=0.1: 1/(1+exp(-10)) ≈ 0.99995."""
-        result = compute_temporal_kernel(t=100, alpha=0.1, kernel_type="s_curve",
-                                         t0=0)
-        assert result > 0.999
+    @pytest.mark.parametrize("kwargs,predicate", [
+        # exp(1.0 * 0.1 * 1000) = exp(100) ≈ 2.69e43 — valid but huge
+        pytest.param(dict(t=1000, n=1.0, alpha=0.1, kernel_type="exponential"),
+                     lambda r: r > 1e10 and np.isfinite(r), id="exponential_very_large_t"),
+        # exp(1.0 * 0.1 * -1000) = exp(-100) ≈ 0 → positivity clamp
+        pytest.param(dict(t=-1000, n=1.0, alpha=0.1, kernel_type="exponential"),
+                     lambda r: r == 1e-10, id="exponential_very_negative_t"),
+        # max(0, 1 - 0.1*20) = max(0, -1) = 0 → positivity clamp
+        pytest.param(dict(t=20, alpha=0.1, kernel_type="linear"),
+                     lambda r: r == 1e-10, id="linear_beyond_decay"),
+        # t=0 → max(0, 1 - 0) = 1.0
+        pytest.param(dict(t=0, alpha=0.1, kernel_type="linear"),
+                     lambda r: r == 1.0, id="linear_at_zero"),
+        # t=-5: 1 + 1.0 * exp(5) ≈ 149.4 — large but valid
+        pytest.param(dict(t=-5, kernel_type="memory", memory_strength=1.0),
+                     lambda r: r > 100 and np.isfinite(r), id="memory_negative_t"),
+        # t=-100, t0=0, alpha=0.1: 1/(1+exp(10)) ≈ 0.000045 — still positive
+        pytest.param(dict(t=-100, alpha=0.1, kernel_type="s_curve", t0=0),
+                     lambda r: 0 < r < 0.001, id="s_curve_far_from_t0"),
+        # t=100, t0=0, alpha=0.1: 1/(1+exp(-10)) ≈ 0.99995
+        pytest.param(dict(t=100, alpha=0.1, kernel_type="s_curve", t0=0),
+                     lambda r: r > 0.999, id="s_curve_far_above_t0"),
+    ])
+    def test_extreme(self, kwargs, predicate):
+        result = compute_temporal_kernel(**kwargs)
+        assert predicate(result), f"{kwargs} -> {result}"
 
 
 # =============================================================================
@@ -119,7 +100,7 @@ class TestOscillatoryExtremes:
         result = compute_temporal_kernel(t=1, n=1.0, alpha=0.1,
                                          kernel_type="oscillatory",
                                          frequency=0)
-        expected = np.exp(0.1) * 0.5 * (1.0 + 0.0)
+        expected = exp(0.1) * 0.5 * (1.0 + 0.0)
         assert result == pytest.approx(expected, rel=1e-6)
 
 
@@ -135,14 +116,14 @@ class TestAlphaAtBounds:
         result = compute_temporal_kernel(t=10, n=1.0, alpha=0.01,
                                          kernel_type="exponential")
         # exp(0.1) ≈ 1.105
-        assert result == pytest.approx(np.exp(0.1), rel=1e-6)
+        assert result == pytest.approx(exp(0.1), rel=1e-6)
 
     def test_alpha_maximum(self):
         """alpha=0.5 (maximum after clamping) — rapid growth."""
         result = compute_temporal_kernel(t=10, n=1.0, alpha=0.5,
                                          kernel_type="exponential")
         # exp(5.0) ≈ 148.4
-        assert result == pytest.approx(np.exp(5.0), rel=1e-6)
+        assert result == pytest.approx(exp(5.0), rel=1e-6)
 
 
 # =============================================================================
@@ -174,6 +155,63 @@ class TestFTimeClampingInTools:
         assert f_info["used"] >= 0.1, "f_time should be clamped to min 0.1"
 
 
+# =============================================================================
+# Batch Kernel
+# =============================================================================
+
+class TestTemporalKernelBatch:
+    """Vectorized kernel matches the scalar kernel element-wise."""
+
+    KINDS = ["exponential", "linear", "logistic", "s_curve", "power_law", "oscillatory", "memory"]
+
+    def test_matches_scalar_kernel(self):
+        t = np.array([-2.0, -0.5, 0.0, 1.0, 10.0])
+        for kind in self.KINDS:
+            batch = compute_temporal_kernel_batch(t, kernel_type=kind, n=1.0, alpha=0.3,
+                                                  t0=0.5, frequency=2.0)
+            scalar = [compute_temporal_kernel(ti, n=1.0, alpha=0.3, kernel_type=kind,
+                                              t0=0.5, frequency=2.0) for ti in t]
+            assert np.array_equal(batch, scalar), kind
+
+    def test_mixed_kernel_types(self):
+        kinds = np.array(["memory", "s_curve", "linear"])
+        batch = compute_temporal_kernel_batch(1.0, kernel_type=kinds, alpha=0.3,
+                                              memory_strength=1.0, t0=0.5)
+        scalar = [compute_temporal_kernel(1.0, alpha=0.3, kernel_type=k,
+                                          memory_strength=1.0, t0=0.5) for k in kinds]
+        assert np.array_equal(batch, scalar)
+
+    def test_matches_scalar_kernel_on_random_configs(self):
+        rng = np.random.default_rng(7)
+        size = 5000
+        kinds = rng.choice(self.KINDS, size)
+        t = rng.uniform(-50.0, 50.0, size)
+        n = rng.uniform(-3.0, 3.0, size)
+        alpha = rng.uniform(0.0, 2.0, size)
+        extra = {
+            "t0": rng.uniform(-10.0, 10.0, size),
+            "exponent": rng.uniform(-3.0, 3.0, size),
+            "frequency": rng.uniform(0.0, 5.0, size),
+            "memory_strength": rng.uniform(0.0, 3.0, size),
+        }
+        batch = compute_temporal_kernel_batch(t, kernel_type=kinds, n=n, alpha=alpha, **extra)
+        with np.errstate(over="ignore"):
+            scalar = [
+                compute_temporal_kernel(t[i], n=n[i], alpha=alpha[i], kernel_type=kinds[i],
+                                        **{key: values[i] for key, values in extra.items()})
+                for i in range(size)
+            ]
+        assert np.array_equal(batch, scalar)
+
+    def test_positivity_floor(self):
+        result = compute_temporal_kernel_batch([-1000.0, 20.0], kernel_type=["exponential", "linear"])
+        np.testing.assert_allclose(result, [1e-10, 1e-10])
+
+    def test_unknown_kernel_raises(self):
+        with pytest.raises(ValueError, match="Unknown kernel type"):
+            compute_temporal_kernel_batch([1.0, 2.0], kernel_type=["linear", "hyperbolic"])
+
+
 # =============================================================================
 # Unknown Kernel Type
 # =============================================================================
@@ -6,33 +6,45 @@ Covers the three-stage load order: Scaffold → Domain Config → Tool Guidance.
 """
 
 import pytest
+import yaml
+
+from mantic_thinking.adapters.openai_adapter import (
+    _YAML_LOADER,
+    _load_tool_yaml,
+    get_domain_config,
+    get_full_context,
+    get_tool_guidance,
+)
+from mantic_thinking.adapters.claude_adapter import get_claude_context, get_claude_tool_guidance
+from mantic_thinking.adapters.gemini_adapter import get_gemini_context, get_gemini_tool_guidance
+from mantic_thinking.adapters.kimi_adapter import get_kimi_context, get_kimi_tool_guidance
 
 
 class TestToolGuidanceLoading:
     """Core guidance loading from openai_adapter."""
 
-    def test_load_all_tool_guidance(self):
+    def test_load_all_tool_guidance(self, all_guidance):
         """All 16 built-in tools load without error."""
-        from mantic_thinking.adapters.openai_adapter import get_tool_guidance
-
-        result = get_tool_guidance()
-        assert isinstance(result, str)
-        assert len(result) > 0
-        assert "## Tool Calibration Guidance" in result
+        assert isinstance(all_guidance, str)
+        assert len(all_guidance) > 0
+        assert "## Tool Calibration Guidance" in all_guidance
 
     def test_load_single_tool(self):
         """Subset loading works for a single tool."""
-        from mantic_thinking.adapters.openai_adapter import get_tool_guidance
-
         result = get_tool_guidance(["healthcare_phenotype_genotype"])
         assert "healthcare_phenotype_genotype" in result
         # Should NOT include other tools
         assert "finance_regime_conflict" not in result
 
+    def test_accepts_any_iterable(self):
+        """Generators and tuples hit the same cached result as a list."""
+        names = ["healthcare_phenotype_genotype", "finance_confluence_alpha"]
+        result = get_tool_guidance(names)
+        assert get_tool_guidance(tuple(names)) is result
+        assert get_tool_guidance(n for n in names) is result
+
     def test_load_multiple_tools(self):
         """Subset loading works for multiple tools."""
-        from mantic_thinking.adapters.openai_adapter import get_tool_guidance
-
         result = get_tool_guidance([
             "healthcare_phenotype_genotype",
             "finance_confluence_alpha",
@@ -43,8 +55,6 @@ class TestToolGuidanceLoading:
 
     def test_unknown_tool_skipped(self):
         """Unknown tool names are silently skipped."""
-        from mantic_thinking.adapters.openai_adapter import get_tool_guidance
-
         result = get_tool_guidance(["nonexistent_tool_xyz"])
         assert isinstance(result, str)
         assert "## Tool Calibration Guidance" in result
@@ -53,18 +63,12 @@ class TestToolGuidanceLoading:
 
     def test_generic_detect_skipped(self):
         """generic_detect has no YAML and is silently skipped."""
-        from mantic_thinking.adapters.openai_adapter import get_tool_guidance
-
         result = get_tool_guidance(["generic_detect"])
         assert isinstance(result, str)
         assert "generic_detect" not in result
 
-    def test_all_16_tools_present(self):
+    def test_all_16_tools_present(self, all_guidance):
         """All 16 built-in tool names appear in full guidance output."""
-        from mantic_thinking.adapters.openai_adapter import get_tool_guidance
-
-        result = get_tool_guidance()
-
         expected_tools = [
             "healthcare_phenotype_genotype",
             "finance_regime_conflict",
@@ -85,61 +89,43 @@ class TestToolGuidanceLoading:
         ]
 
         for tool_name in expected_tools:
-            assert tool_name in result, f"Missing tool: {tool_name}"
+            assert tool_name in all_guidance, f"Missing tool: {tool_name}"
 
 
 class TestGuidanceContent:
     """Verify guidance output contains expected structured content."""
 
-    def test_guidance_contains_parameters(self):
+    def test_guidance_contains_parameters(self, healthcare_guidance):
         """Output includes parameter names from YAML."""
-        from mantic_thinking.adapters.openai_adapter import get_tool_guidance
+        assert "phenotypic" in healthcare_guidance
+        assert "genomic" in healthcare_guidance
+        assert "environmental" in healthcare_guidance
+        assert "psychosocial" in healthcare_guidance
 
-        result = get_tool_guidance(["healthcare_phenotype_genotype"])
-        assert "phenotypic" in result
-        assert "genomic" in result
-        assert "environmental" in result
-        assert "psychosocial" in result
-
-    def test_guidance_contains_selection(self):
+    def test_guidance_contains_selection(self, healthcare_guidance):
         """Output includes use_when and not_for from YAML."""
-        from mantic_thinking.adapters.openai_adapter import get_tool_guidance
-
-        result = get_tool_guidance(["healthcare_phenotype_genotype"])
-        assert "**Use when:**" in result
-        assert "**Not for:**" in result
+        assert "**Use when:**" in healthcare_guidance
+        assert "**Not for:**" in healthcare_guidance
 
-    def test_guidance_contains_interpretation(self):
+    def test_guidance_contains_interpretation(self, healthcare_guidance):
         """Output includes high/low M interpretation."""
-        from mantic_thinking.adapters.openai_adapter import get_tool_guidance
+        assert "**High M:**" in healthcare_guidance
+        assert "**Low M:**" in healthcare_guidance
 
-        result = get_tool_guidance(["healthcare_phenotype_genotype"])
-        assert "**High M:**" in result
-        assert "**Low M:**" in result
-
-    def test_guidance_contains_tuning(self):
+    def test_guidance_contains_tuning(self, healthcare_guidance):
         """Output includes dampen/amplify tuning guidance."""
-        from mantic_thinking.adapters.openai_adapter import get_tool_guidance
-
-        result = get_tool_guidance(["healthcare_phenotype_genotype"])
-        assert "**Tuning:**" in result
-        assert "Dampen" in result
-        assert "Amplify" in result
+        assert "**Tuning:**" in healthcare_guidance
+        assert "Dampen" in healthcare_guidance
+        assert "Amplify" in healthcare_guidance
 
-    def test_guidance_contains_layer_mapping(self):
+    def test_guidance_contains_layer_mapping(self, healthcare_guidance):
         """Output includes layer hierarchy (Micro/Meso/Macro/Meta)."""
-        from mantic_thinking.adapters.openai_adapter import get_tool_guidance
+        assert "Micro" in healthcare_guidance
+        assert "Meso" in healthcare_guidance
 
-        result = get_tool_guidance(["healthcare_phenotype_genotype"])
-        assert "Micro" in result
-        assert "Meso" in result
-
-    def test_guidance_contains_tool_type(self):
+    def test_guidance_contains_tool_type(self, healthcare_guidance):
         """Output includes friction/emergence type."""
-        from mantic_thinking.adapters.openai_adapter import get_tool_guidance
-
-        friction = get_tool_guidance(["healthcare_phenotype_genotype"])
-        assert "friction" in friction
+        assert "friction" in healthcare_guidance
 
         emergence = get_tool_guidance(["finance_confluence_alpha"])
         assert "emergence" in emergence
@@ -150,8 +136,6 @@ class TestYamlLoading:
 
     def test_load_friction_yaml(self):
         """Friction tool YAML loads successfully."""
-        from mantic_thinking.adapters.openai_adapter import _load_tool_yaml
-
         data = _load_tool_yaml("healthcare_phenotype_genotype")
         assert data is not None
         assert data["tool"] == "healthcare_phenotype_genotype"
@@ -162,8 +146,6 @@ class TestYamlLoading:
 
     def test_load_emergence_yaml(self):
         """Emergence tool YAML loads successfully."""
-        from mantic_thinking.adapters.openai_adapter import _load_tool_yaml
-
         data = _load_tool_yaml("finance_confluence_alpha")
         assert data is not None
         assert data["tool"] == "finance_confluence_alpha"
@@ -172,45 +154,48 @@ class TestYamlLoading:
 
     def test_load_nonexistent_returns_none(self):
         """Non-existent tool returns None."""
-        from mantic_thinking.adapters.openai_adapter import _load_tool_yaml
-
         data = _load_tool_yaml("nonexistent_tool")
         assert data is None
 
+    def test_load_is_cached_and_read_only(self):
+        """Repeat loads reuse one parsed mapping that callers cannot mutate."""
+        _load_tool_yaml.cache_clear()
+        first = _load_tool_yaml("healthcare_phenotype_genotype")
+        second = _load_tool_yaml("healthcare_phenotype_genotype")
+        assert first is second
+        assert _load_tool_yaml.cache_info().hits == 1
+        with pytest.raises(TypeError):
+            first["tool"] = "tampered"
+
+    def test_uses_libyaml_loader_when_available(self):
+        """The C safe loader is picked whenever PyYAML was built with libyaml."""
+        expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+        assert _YAML_LOADER is expected
+
 
 class TestAdapterWrappers:
     """Verify all adapters expose the guidance function."""
 
     def test_claude_adapter_has_guidance(self):
         """Claude adapter exposes get_claude_tool_guidance."""
-        from mantic_thinking.adapters.claude_adapter import get_claude_tool_guidance
-
         result = get_claude_tool_guidance()
         assert isinstance(result, str)
         assert "## Tool Calibration Guidance" in result
 
     def test_gemini_adapter_has_guidance(self):
         """Gemini adapter exposes get_gemini_tool_guidance."""
-        from mantic_thinking.adapters.gemini_adapter import get_gemini_tool_guidance
-
         result = get_gemini_tool_guidance()
         assert isinstance(result, str)
         assert "## Tool Calibration Guidance" in result
 
     def test_kimi_adapter_has_guidance(self):
         """Kimi adapter exposes get_kimi_tool_guidance."""
-        from mantic_thinking.adapters.kimi_adapter import get_kimi_tool_guidance
-
         result = get_kimi_tool_guidance()
         assert isinstance(result, str)
         assert "## Tool Calibration Guidance" in result
 
     def test_all_adapters_return_same_content(self):
         """All adapter wrappers return identical content for same input."""
-        from mantic_thinking.adapters.claude_adapter import get_claude_tool_guidance
-        from mantic_thinking.adapters.gemini_adapter import get_gemini_tool_guidance
-        from mantic_thinking.adapters.kimi_adapter import get_kimi_tool_guidance
-
         claude = get_claude_tool_guidance(["healthcare_phenotype_genotype"])
         gemini = get_gemini_tool_guidance(["healthcare_phenotype_genotype"])
         kimi = get_kimi_tool_guidance(["healthcare_phenotype_genotype"])
@@ -219,8 +204,6 @@ class TestAdapterWrappers:
 
     def test_adapter_subset_loading(self):
         """Adapter wrappers support subset loading."""
-        from mantic_thinking.adapters.claude_adapter import get_claude_tool_guidance
-
         result = get_claude_tool_guidance(["cyber_attribution_resolver"])
         assert "cyber_attribution_resolver" in result
         assert "healthcare_phenotype_genotype" not in result
@@ -229,54 +212,36 @@ class TestAdapterWrappers:
 class TestScaffold:
     """Test the reasoning scaffold loader."""
 
-    def test_scaffold_loads(self):
+    def test_scaffold_loads(self, scaffold):
         """Scaffold file loads successfully."""
-        from mantic_thinking.adapters.openai_adapter import get_scaffold
-
-        result = get_scaffold()
-        assert isinstance(result, str)
-        assert len(result) > 0
+        assert isinstance(scaffold, str)
+        assert len(scaffold) > 0
 
-    def test_scaffold_contains_formula(self):
+    def test_scaffold_contains_formula(self, scaffold):
         """Scaffold includes the core formula."""
-        from mantic_thinking.adapters.openai_adapter import get_scaffold
-
-        result = get_scaffold()
-        assert "M =" in result
+        assert "M =" in scaffold
 
-    def test_scaffold_contains_layer_hierarchy(self):
+    def test_scaffold_contains_layer_hierarchy(self, scaffold):
         """Scaffold includes the 4-layer hierarchy."""
-        from mantic_thinking.adapters.openai_adapter import get_scaffold
+        assert "Micro" in scaffold
+        assert "Meso" in scaffold
+        assert "Macro" in scaffold
+        assert "Meta" in scaffold
 
-        result = get_scaffold()
-        assert "Micro" in result
-        assert "Meso" in result
-        assert "Macro" in result
-        assert "Meta" in result
-
-    def test_scaffold_contains_modes(self):
+    def test_scaffold_contains_modes(self, scaffold):
         """Scaffold explains friction and emergence modes."""
-        from mantic_thinking.adapters.openai_adapter import get_scaffold
-
-        result = get_scaffold()
-        assert "Friction" in result
-        assert "Emergence" in result
+        assert "Friction" in scaffold
+        assert "Emergence" in scaffold
 
-    def test_scaffold_contains_translation_rules(self):
+    def test_scaffold_contains_translation_rules(self, scaffold):
         """Scaffold includes translation guidance."""
-        from mantic_thinking.adapters.openai_adapter import get_scaffold
+        assert "What You Think" in scaffold or "Translation" in scaffold
 
-        result = get_scaffold()
-        assert "What You Think" in result or "Translation" in result
-
-    def test_scaffold_contains_load_order(self):
+    def test_scaffold_contains_load_order(self, scaffold):
         """Scaffold references the load order."""
-        from mantic_thinking.adapters.openai_adapter import get_scaffold
-
-        result = get_scaffold()
-        assert "Scaffold" in result
-        assert "Domain Config" in result
-        assert "Tool Guidance" in result
+        assert "Scaffold" in scaffold
+        assert "Domain Config" in scaffold
+        assert "Tool Guidance" in scaffold
 
 
 class TestDomainConfig:
@@ -284,55 +249,48 @@ class TestDomainConfig:
 
     def test_load_healthcare_config(self):
         """Healthcare domain config loads."""
-        from mantic_thinking.adapters.openai_adapter import get_domain_config
-
         result = get_domain_config("healthcare")
         assert isinstance(result, str)
         assert "Mantic-Health" in result or "Clinical" in result
 
     def test_load_finance_config(self):
         """Finance domain config loads."""
-        from mantic_thinking.adapters.openai_adapter import get_domain_config
-
         result = get_domain_config("finance")
         assert isinstance(result, str)
         assert len(result) > 0
 
     def test_load_cyber_config(self):
         """Cyber domain config loads (maps to security)."""
-        from mantic_thinking.adapters.openai_adapter import get_domain_config
-
         result = get_domain_config("cyber")
         assert isinstance(result, str)
         assert len(result) > 0
 
     def test_unknown_domain_returns_empty(self):
         """Unknown domain returns empty string."""
-        from mantic_thinking.adapters.openai_adapter import get_domain_config
-
         result = get_domain_config("nonexistent_domain")
         assert result == ""
 
+    def test_aliases_share_one_cached_read(self):
+        """cyber, cybersecurity and security resolve to the same cached file."""
+        result = get_domain_config("cyber")
+        assert get_domain_config("cybersecurity") is result
+        assert get_domain_config("security") is result
+
 
 class TestFullContext:
     """Test the full context assembly (Scaffold → Config → Guidance)."""
 
-    def test_full_context_no_domain(self):
+    def test_full_context_no_domain(self, full_context):
         """Full context without domain includes scaffold + all tools."""
-        from mantic_thinking.adapters.openai_adapter import get_full_context
-
-        result = get_full_context()
-        assert "Mantic Reasoning Scaffold" in result
-        assert "## Tool Calibration Guidance" in result
+        assert "Mantic Reasoning Scaffold" in full_context
+        assert "## Tool Calibration Guidance" in full_context
         # Should include all built-in domain tools
-        assert "healthcare_phenotype_genotype" in result
-        assert "finance_confluence_alpha" in result
+        assert "healthcare_phenotype_genotype" in full_context
+        assert "finance_confluence_alpha" in full_context
 
-    def test_full_context_with_domain(self):
+    def test_full_context_with_domain(self, full_context_healthcare):
         """Full context with domain includes scaffold + domain config + scoped tools."""
-        from mantic_thinking.adapters.openai_adapter import get_full_context
-
-        result = get_full_context("healthcare")
+        result = full_context_healthcare
         # Stage 1: Scaffold
         assert "Mantic Reasoning Scaffold" in result
         # Stage 2: Domain config
@@ -343,21 +301,14 @@ class TestFullContext:
         # Should NOT include other domain tools
         assert "finance_regime_conflict" not in result
 
-    def test_full_context_order(self):
+    def test_full_context_order(self, full_context):
         """Scaffold appears before tool guidance in output."""
-        from mantic_thinking.adapters.openai_adapter import get_full_context
-
-        result = get_full_context()
-        scaffold_pos = result.find("Mantic Reasoning Scaffold")
-        guidance_pos = result.find("## Tool Calibration Guidance")
+        scaffold_pos = full_context.find("Mantic Reasoning Scaffold")
+        guidance_pos = full_context.find("## Tool Calibration Guidance")
         assert scaffold_pos < guidance_pos
 
     def test_all_adapters_expose_context(self):
         """All adapters expose get_*_context()."""
-        from mantic_thinking.adapters.claude_adapter import get_claude_context
-        from mantic_thinking.adapters.gemini_adapter import get_gemini_context
-        from mantic_thinking.adapters.kimi_adapter import get_kimi_context
-
         claude = get_claude_context("finance")
         gemini = get_gemini_context("finance")
         kimi = get_kimi_context("finance")
@@ -372,48 +323,36 @@ class TestCodexFixes:
 
     def test_cybersecurity_alias_scopes_tools(self):
         """'cybersecurity' alias scopes to cyber tools only."""
-        from mantic_thinking.adapters.openai_adapter import get_full_context
-
         result = get_full_context("cybersecurity")
         assert "cyber_attribution_resolver" in result
         assert "finance_regime_conflict" not in result
 
     def test_health_alias_scopes_tools(self):
         """'health' alias scopes to healthcare tools only."""
-        from mantic_thinking.adapters.openai_adapter import get_full_context
-
         result = get_full_context("health")
         assert "healthcare_phenotype_genotype" in result
         assert "finance_regime_conflict" not in result
 
     def test_security_alias_scopes_tools(self):
         """'security' alias scopes to cyber tools only."""
-        from mantic_thinking.adapters.openai_adapter import get_full_context
-
         result = get_full_context("security")
         assert "cyber_attribution_resolver" in result
         assert "healthcare_phenotype_genotype" not in result
 
     def test_command_alias_scopes_tools(self):
         """'command' alias scopes to military tools only."""
-        from mantic_thinking.adapters.openai_adapter import get_full_context
-
         result = get_full_context("command")
         assert "military_friction_forecast" in result
         assert "finance_regime_conflict" not in result
 
     def test_path_traversal_filtered(self):
         """Path traversal in tool_names is filtered out."""
-        from mantic_thinking.adapters.openai_adapter import get_tool_guidance
-
         result = get_tool_guidance(["../../etc/passwd", "healthcare_phenotype_genotype"])
         assert "healthcare_phenotype_genotype" in result
         assert "passwd" not in result
 
     def test_all_invalid_tool_names_filtered(self):
         """All-invalid tool_names returns header only."""
-        from mantic_thinking.adapters.openai_adapter import get_tool_guidance
-
         result = get_tool_guidance(["../../../etc/shadow", "__import__('os')"])
         assert "## Tool Calibration Guidance" in result
         assert "shadow" not in result
@@ -421,7 +360,5 @@ class TestCodexFixes:
 
     def test_malformed_yaml_skipped(self):
         """Malformed YAML doesn't crash guidance loading."""
-        from mantic_thinking.adapters.openai_adapter import _load_tool_yaml
-
         # Non-existent tool returns None gracefully
         assert _load_tool_yaml("nonexistent") is None
@@ -7,9 +7,7 @@ boundaries, with adversarial types, and edge-case defaults.
 Run with: python -m pytest tests/test_validator_edge_cases.py -v
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from types import MappingProxyType
 
 import pytest
 import numpy as np
@@ -17,8 +15,12 @@ import numpy as np
 from mantic_thinking.core.validators import (
     clamp_input, normalize_weights, validate_layers, require_finite_inputs,
     check_mismatch, clamp_threshold_override, validate_temporal_config,
-    clamp_f_time, DOMAIN_KERNEL_ALLOWLIST
+    clamp_f_time, resolve_threshold_overrides, resolve_temporal_config,
+    build_threshold_audit, temporal_kernel_for, _temporal_kernel_cached,
+    format_attribution, layer_dict_builder, compute_layer_coupling,
+    DOMAIN_KERNEL_ALLOWLIST, _ALLOWLIST_SETS
 )
+from mantic_thinking.core.mantic_kernel import compute_temporal_kernel
 
 
 # =============================================================================
@@ -236,6 +238,13 @@ class TestNormalizeWeightsEdges:
         with pytest.raises(ValueError, match="all weights are zero"):
             normalize_weights([-1.0, -1.0, -1.0, -1.0])
 
+    def test_input_array_not_mutated(self):
+        """Normalization works on a copy, never on the caller's array."""
+        weights = np.array([2.0, -1.0, 0.5, 0.5])
+        result = normalize_weights(weights)
+        assert weights.tolist() == [2.0, -1.0, 0.5, 0.5]
+        assert result is not weights
+
 
 # =============================================================================
 # check_mismatch Edge Cases
@@ -261,6 +270,13 @@ class TestCheckMismatchEdges:
         assert not has_mismatch
         assert "Insufficient data" in desc
 
+    def test_non_numeric_values_raise(self):
+        """None and strings are rejected, not treated as missing layers."""
+        with pytest.raises(TypeError, match="NoneType"):
+            check_mismatch([0.5, None, 0.9, 0.1])
+        with pytest.raises(TypeError, match="str"):
+            check_mismatch(["0.5", "0.9"])
+
 
 # =============================================================================
 # require_finite_inputs Tests
@@ -314,3 +330,121 @@ class TestDomainKernelAllowlists:
         """'linear' kernel should be allowed in every domain."""
         for domain, allowed in DOMAIN_KERNEL_ALLOWLIST.items():
             assert "linear" in allowed, f"Domain {domain} does not allow 'linear'"
+
+    def test_membership_sets_mirror_allowlist(self):
+        """The hashed lookup view matches the public lists exactly."""
+        assert _ALLOWLIST_SETS.keys() == DOMAIN_KERNEL_ALLOWLIST.keys()
+        for domain, allowed in DOMAIN_KERNEL_ALLOWLIST.items():
+            assert _ALLOWLIST_SETS[domain] == frozenset(allowed)
+
+
+# =============================================================================
+# Shared Override Resolution
+# =============================================================================
+
+class TestOverrideResolution:
+    """Threshold/temporal override helpers shared by the detection tools."""
+
+    def test_threshold_overrides_clamp_and_ignore(self):
+        defaults = {"coupling": 0.5, "min_layer": 0.6}
+        active, info, ignored = resolve_threshold_overrides(
+            {"coupling": 0.9, "bogus": 1.0}, defaults
+        )
+        assert active == {"coupling": 0.6, "min_layer": 0.6}
+        assert info["coupling"]["was_clamped"] is True
+        assert ignored == ["bogus"]
+        assert defaults == {"coupling": 0.5, "min_layer": 0.6}
+
+    def test_threshold_overrides_accept_mappings_and_ignore_other_types(self):
+        defaults = {"coupling": 0.5}
+        active, _, _ = resolve_threshold_overrides(MappingProxyType({"coupling": 0.55}), defaults)
+        assert active == {"coupling": 0.55}
+        assert resolve_threshold_overrides([("coupling", 0.55)], defaults) == (defaults, {}, [])
+
+    def test_threshold_audit_none_without_known_overrides(self):
+        assert build_threshold_audit({}, ["bogus"]) is None
+        _, info, ignored = resolve_threshold_overrides({"coupling": 0.55}, {"coupling": 0.5})
+        audit = build_threshold_audit(info, ignored)
+        assert audit["was_clamped"] is False
+        assert audit["ignored_keys"] is None
+        assert audit["overrides"]["coupling"]["used"] == 0.55
+
+    def test_temporal_config_missing_t_keeps_f_time(self):
+        f_time, applied, rejected, _ = resolve_temporal_config(
+            {"kernel_type": "exponential"}, 0.7, domain="climate"
+        )
+        assert f_time == 0.7
+        assert applied is None
+        assert "t required" in rejected["t"]["reason"]
+
+    def test_temporal_config_applied(self):
+        f_time, applied, rejected, _ = resolve_temporal_config(
+            {"kernel_type": "exponential", "t": 2.0, "alpha": 0.1}, 1.0, domain="climate"
+        )
+        assert applied["kernel_type"] == "exponential"
+        assert rejected == {}
+        assert f_time != 1.0
+
+    def test_no_temporal_config_passthrough(self):
+        assert resolve_temporal_config(None, 1.3) == (1.3, None, {}, {})
+
+    def test_temporal_kernel_value_is_memoized(self):
+        config = {"kernel_type": "exponential", "t": 3.0, "alpha": 0.2, "n": 1.5}
+        _temporal_kernel_cached.cache_clear()
+        first = temporal_kernel_for(config)
+        second = temporal_kernel_for(dict(reversed(list(config.items()))))
+        assert first == second == compute_temporal_kernel(**config)
+        assert _temporal_kernel_cached.cache_info().hits == 1
+
+
+# =============================================================================
+# layer_dict_builder
+# =============================================================================
+
+class TestLayerDictBuilder:
+    """Prebuilt per-tool formatter matches format_attribution."""
+
+    def test_four_layer_builder_matches_format_attribution(self):
+        names = ['a', 'b', 'c', 'd']
+        build = layer_dict_builder(names)
+        values = np.array([0.1, 0.2, 0.3, 0.4])
+        result = build(values)
+        assert result == format_attribution(values, names)
+        assert list(result) == names
+        assert all(type(v) is float for v in result.values())
+
+    def test_other_layer_counts_fall_back(self):
+        names = ['a', 'b', 'c']
+        assert layer_dict_builder(names)([1, 2, 3]) == {'a': 1.0, 'b': 2.0, 'c': 3.0}
+
+
+# =============================================================================
+# compute_layer_coupling
+# =============================================================================
+
+class TestLayerCouplingGoldenValues:
+    """Rounded coupling values stay pinned to the NumPy reductions."""
+
+    def test_agreement_rounding_is_pinned(self):
+        coupling = compute_layer_coupling([0.38, 0.1, 0.25], ['a', 'b', 'c'])
+        assert coupling["coherence"] == 0.77
+        agreement = {name: entry["agreement"] for name, entry in coupling["layers"].items()}
+        assert agreement == {'a': 0.8, 'b': 0.78, 'c': 0.86}
+
+    def test_tension_pairs_are_pinned(self):
+        coupling = compute_layer_coupling([0.97, 0.89, 0.3], ['a', 'b', 'c'])
+        assert coupling["coherence"] == 0.4
+        assert coupling["layers"] == {
+            'a': {'agreement': 0.62, 'tension_with': {'c': 0.33}},
+            'b': {'agreement': 0.66, 'tension_with': {'c': 0.41}},
+            'c': {'agreement': 0.37, 'tension_with': {'a': 0.33, 'b': 0.41}},
+        }
+
+    def test_values_are_plain_floats(self):
+        coupling = compute_layer_coupling([0.2, 0.4, 0.9, 0.5], ['a', 'b', 'c', 'd'])
+        assert type(coupling["coherence"]) is float
+        assert all(type(entry["agreement"]) is float for entry in coupling["layers"].values())
+
+    def test_length_mismatch_raises(self):
+        with pytest.raises(IndexError):
+            compute_layer_coupling([0.2, 0.4, 0.9], ['a', 'b'])